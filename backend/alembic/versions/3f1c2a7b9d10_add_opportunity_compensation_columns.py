@@ -0,0 +1,66 @@
+"""add opportunity compensation columns
+
+Revision ID: 3f1c2a7b9d10
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '3f1c2a7b9d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("comp_min", "NUMERIC(14, 2)"),
+    ("comp_max", "NUMERIC(14, 2)"),
+    ("currency", "VARCHAR(3)"),
+    ("period", "VARCHAR(16)"),
+]
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: init_db's create_all may already have built the columns
+    for name, type_ in COLUMNS:
+        op.execute(f"ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS {name} {type_}")
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_opportunities_{name} ON opportunities ({name})")
+
+    _backfill()
+
+
+def _backfill() -> None:
+    from app.scrapers.normalize import parse_compensation
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, compensation, opportunity_type FROM opportunities "
+        "WHERE compensation IS NOT NULL AND comp_min IS NULL AND comp_max IS NULL"
+    )).all()
+
+    for opportunity_id, compensation, opportunity_type in rows:
+        details = (compensation or {}).get("details")
+        parsed = parse_compensation(details, str(opportunity_type).lower())
+        if not parsed or (parsed["min"] is None and parsed["max"] is None):
+            continue
+        bind.execute(
+            sa.text(
+                "UPDATE opportunities SET comp_min = :min, comp_max = :max, "
+                "currency = :currency, period = :period WHERE id = :id"
+            ),
+            {
+                "id": opportunity_id,
+                "min": parsed["min"],
+                "max": parsed["max"],
+                "currency": parsed["currency"],
+                "period": parsed["period"],
+            }
+        )
+
+
+def downgrade() -> None:
+    for name, _ in COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_opportunities_{name}")
+        op.execute(f"ALTER TABLE opportunities DROP COLUMN IF EXISTS {name}")
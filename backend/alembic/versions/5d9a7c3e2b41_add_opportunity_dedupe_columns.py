@@ -0,0 +1,85 @@
+"""add opportunity dedupe columns
+
+Revision ID: 5d9a7c3e2b41
+Revises: 8b2e4d6f1a3c
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '5d9a7c3e2b41'
+down_revision = '8b2e4d6f1a3c'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _legacy_company(row):
+    """
+    Rows stored before normalize_opportunity kept a "company" key only have
+    it in the title where the scraper put it there: RemoteOK's "<position>
+    at <company>". Other legacy rows stay without a company, so they only
+    link to listings with a comparable description.
+    """
+    raw_data = row.raw_data or {}
+    company = raw_data.get("company") or raw_data.get("company_or_organizer")
+    if company:
+        return company
+    if row.source_name == "remoteok" and " at " in (row.title or ""):
+        return row.title.rsplit(" at ", 1)[1]
+    return None
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: init_db's create_all may already have built the columns
+    op.execute("ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS dedupe_key BIGINT")
+    op.execute("ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS dedupe_description BIGINT")
+    op.execute("ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS dedupe_company BIGINT")
+    op.execute("ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS dedupe_bands INTEGER[]")
+    op.execute(
+        "ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS canonical_id UUID "
+        "REFERENCES opportunities (id) ON DELETE SET NULL"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_opportunities_canonical_id ON opportunities (canonical_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_opportunities_dedupe_bands ON opportunities USING gin (dedupe_bands)")
+
+    # Fingerprint existing rows so new listings can be matched against them;
+    # existing rows all stay canonical
+    from app.services.near_duplicates import fingerprint
+
+    bind = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id, source_name, title, description, raw_data FROM opportunities "
+        "WHERE dedupe_key IS NULL AND id > :after ORDER BY id LIMIT :limit"
+    )
+    update = sa.text(
+        "UPDATE opportunities SET dedupe_key = :dedupe_key, dedupe_description = :dedupe_description, "
+        "dedupe_company = :dedupe_company, dedupe_bands = :dedupe_bands WHERE id = :id"
+    )
+    after = "00000000-0000-0000-0000-000000000000"
+    while True:
+        rows = bind.execute(select_batch, {"after": after, "limit": BACKFILL_BATCH_SIZE}).all()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            fp = fingerprint({
+                "title": row.title,
+                "description": row.description,
+                "company": _legacy_company(row),
+            })
+            if fp is not None:
+                updates.append({"id": row.id, **fp.columns()})
+        if updates:
+            bind.execute(update, updates)
+        after = rows[-1].id
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_opportunities_dedupe_bands")
+    op.execute("DROP INDEX IF EXISTS ix_opportunities_canonical_id")
+    for column in ("canonical_id", "dedupe_bands", "dedupe_company", "dedupe_description", "dedupe_key"):
+        op.execute(f"ALTER TABLE opportunities DROP COLUMN IF EXISTS {column}")
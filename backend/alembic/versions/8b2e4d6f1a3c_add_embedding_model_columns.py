@@ -0,0 +1,36 @@
+"""add embedding model columns
+
+Revision ID: 8b2e4d6f1a3c
+Revises: 3f1c2a7b9d10
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = '8b2e4d6f1a3c'
+down_revision = '3f1c2a7b9d10'
+branch_labels = None
+depends_on = None
+
+# Every embedding stored before providers became pluggable came from OpenAI
+LEGACY_MODEL = "text-embedding-3-small"
+
+
+def upgrade() -> None:
+    # IF NOT EXISTS: init_db's create_all may already have built the columns
+    op.execute("ALTER TABLE opportunities ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(128)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_opportunities_embedding_model ON opportunities (embedding_model)")
+    op.execute("ALTER TABLE goals ADD COLUMN IF NOT EXISTS embedding_model VARCHAR(128)")
+
+    for table in ("opportunities", "goals"):
+        op.execute(
+            f"UPDATE {table} SET embedding_model = '{LEGACY_MODEL}' "
+            f"WHERE embedding IS NOT NULL AND embedding_model IS NULL"
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_opportunities_embedding_model")
+    op.execute("ALTER TABLE opportunities DROP COLUMN IF EXISTS embedding_model")
+    op.execute("ALTER TABLE goals DROP COLUMN IF EXISTS embedding_model")
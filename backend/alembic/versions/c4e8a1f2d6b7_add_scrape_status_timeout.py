@@ -0,0 +1,25 @@
+"""add scrape status timeout
+
+Revision ID: c4e8a1f2d6b7
+Revises: 5d9a7c3e2b41
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = 'c4e8a1f2d6b7'
+down_revision = '5d9a7c3e2b41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLAlchemy stores enum member names; ADD VALUE cannot be used inside the migration's transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE scrapestatus ADD VALUE IF NOT EXISTS 'TIMEOUT'")
+
+
+def downgrade() -> None:
+    # Postgres cannot drop an enum value; TIMEOUT rows become plain failures
+    op.execute("UPDATE scrape_logs SET status = 'FAILURE' WHERE status = 'TIMEOUT'")
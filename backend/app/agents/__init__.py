@@ -1,7 +1,28 @@
-from app.agents.clarifier import ClarifierAgent
-from app.agents.executor import ExecutorAgent
-from app.agents.ranker import RankerAgent
-from app.agents.coordinator import CoordinatorAgent
+"""
+Agents are imported on first access: the coordinator pulls in LangGraph,
+the LLM clients and the scrapers, none of which an API worker needs to start.
+"""
+from importlib import import_module
+from typing import Any
 
-__all__ = ["ClarifierAgent", "ExecutorAgent", "RankerAgent", "CoordinatorAgent"]
+_LAZY_EXPORTS = {
+    "ClarifierAgent": "app.agents.clarifier",
+    "ExecutorAgent": "app.agents.executor",
+    "RankerAgent": "app.agents.ranker",
+    "CoordinatorAgent": "app.agents.coordinator",
+}
 
+
+def get_coordinator():
+    """Shared CoordinatorAgent, constructed on first use"""
+    from app.agents.coordinator import get_coordinator as _get_coordinator
+    return _get_coordinator()
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["ClarifierAgent", "ExecutorAgent", "RankerAgent", "CoordinatorAgent", "get_coordinator"]
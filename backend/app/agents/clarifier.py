@@ -34,6 +34,8 @@ class ClarifierAgent:
         - location (string)
         - remote (boolean)
         - compensation_required (boolean)
+        - min_salary (number, annual amount; only if the user states a minimum)
+        - salary_currency (ISO code such as "USD", only with min_salary)
         - timeframe (string, e.g., "immediate", "next 3 months", "ongoing")
         - experience_level (string, if applicable)
         - additional_filters (object with any other relevant info)
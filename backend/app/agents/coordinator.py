@@ -10,6 +10,7 @@ from app.agents.executor import ExecutorAgent
 from app.agents.ranker import RankerAgent
 from app.services.ably_service import ably_service
 from app.models.goal import Goal, GoalStatus, GoalType
+from app.services.embeddings import current_embedding_model
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,14 @@ class CoordinatorAgent:
         self.clarifier = ClarifierAgent()
         self.executor = ExecutorAgent()
         self.ranker = RankerAgent()
-        self.graph = self._build_graph()
+        self._graph = None
+
+    @property
+    def graph(self):
+        # Compiled on the first new-goal run; most requests never use it
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
     
     def _build_graph(self) -> StateGraph:
         workflow = StateGraph(AgentState)
@@ -263,6 +271,7 @@ class CoordinatorAgent:
                 goal_type=GoalType(refined_goal.get("goal_type", "job")),
                 filters=refined_goal,
                 embedding=goal_embedding,
+                embedding_model=current_embedding_model(),
                 status=GoalStatus.ACTIVE
             )
             db.add(goal)
@@ -338,3 +347,14 @@ class CoordinatorAgent:
                 )
         
         return all_opportunities
+
+
+_coordinator: Optional[CoordinatorAgent] = None
+
+
+def get_coordinator() -> CoordinatorAgent:
+    """Process-wide CoordinatorAgent shared by the API routers"""
+    global _coordinator
+    if _coordinator is None:
+        _coordinator = CoordinatorAgent()
+    return _coordinator
@@ -1,25 +1,98 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple, Union
+from contextlib import aclosing
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 import asyncio
 import logging
 
 from app.scrapers import get_scrapers_for_goal_type
-from app.models.opportunity import Opportunity, OpportunityType
+from app.scrapers.checkpoints import Checkpoint, checkpoints_of, run_checkpoints
+from app.scrapers.circuit_breaker import circuit_breakers
+from app.scrapers.coalescer import scrape_coalescer
 from app.models.scrape_log import ScrapeLog, ScrapeStatus
 from app.services.embeddings import generate_embeddings_batch
+from app.services.opportunity_store import (
+    UpsertResult,
+    bulk_upsert_opportunities,
+    embedding_text,
+    filter_known_opportunities,
+    find_ids,
+)
+from app.services.near_duplicates import DedupeWindow, Fingerprint, find_canonicals, fingerprint
+from app.services.pipeline import Pipeline, Stage
+from app.services.telemetry import telemetry
+from app.database import AsyncSessionLocal
+from app.config import settings
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+class StoreBatch:
+    """Listings of one scraped batch on their way from the dedupe stage to the persist stage"""
+    
+    def __init__(
+        self,
+        opportunities: List[Dict[str, Any]],
+        needs_embedding: List[bool],
+        fingerprints: List[Optional[Fingerprint]],
+        links: List[Optional[Union[UUID, str]]],
+        known: int = 0,
+        checkpoints: Optional[List[Checkpoint]] = None
+    ):
+        self.opportunities = opportunities
+        self.needs_embedding = needs_embedding
+        self.fingerprints = fingerprints
+        self.links = links
+        self.embeddings: List[Optional[List[float]]] = [None] * len(opportunities)
+        self.known = known
+        self.embedded = 0
+        # Scraper bookkeeping (e.g. advancing its cursor) to run once the batch is committed
+        self.checkpoints: List[Checkpoint] = list(checkpoints or [])
+    
+    def __len__(self) -> int:
+        return len(self.opportunities)
+    
+    def subset(self, indexes: List[int]) -> "StoreBatch":
+        batch = StoreBatch(
+            [self.opportunities[i] for i in indexes],
+            [self.needs_embedding[i] for i in indexes],
+            [self.fingerprints[i] for i in indexes],
+            [self.links[i] for i in indexes]
+        )
+        batch.embeddings = [self.embeddings[i] for i in indexes]
+        return batch
+    
+    @staticmethod
+    def merge(batches: List["StoreBatch"]) -> "StoreBatch":
+        merged = StoreBatch([], [], [], [])
+        for batch in batches:
+            merged.opportunities.extend(batch.opportunities)
+            merged.needs_embedding.extend(batch.needs_embedding)
+            merged.fingerprints.extend(batch.fingerprints)
+            merged.links.extend(batch.links)
+            merged.embeddings.extend(batch.embeddings)
+            merged.checkpoints.extend(batch.checkpoints)
+        return merged
+
+
 class ExecutorAgent:
     
+    def __init__(self, session_factory: Callable[[], Any] = AsyncSessionLocal):
+        # Each DB-touching pipeline worker opens its own session from this
+        self.session_factory = session_factory
+    
     async def execute_search(
         self,
         db: AsyncSession,
-        goal_data: Dict[str, Any]
+        goal_data: Dict[str, Any],
+        source_timeout: Optional[float] = None
     ) -> List[Dict[str, Any]]:
+        """
+        Scrape every source for the goal type and store what they find.
+        Each source gets `source_timeout` seconds (default: the interactive
+        budget); listings found before a source's deadline are still stored.
+        """
         goal_type = goal_data.get("goal_type")
         filters = goal_data.get("filters", {})
         
@@ -27,33 +100,136 @@ class ExecutorAgent:
         
         logger.info(f"Executing search with {len(scrapers)} scrapers for goal type: {goal_type}")
         
-        tasks = [
-            self._scrape_with_logging(db, scraper, filters)
-            for scraper in scrapers
-        ]
+        # The pipeline's DB stages open their own sessions rather than sharing the caller's
+        result = await self.scrape_and_store(
+            scrapers,
+            filters,
+            source_timeout=source_timeout or settings.scraping_source_timeout_interactive
+        )
+        
+        return result["stored"]
+    
+    async def scrape_and_store(
+        self,
+        scrapers: List[Any],
+        filters: Dict[str, Any],
+        source_timeout: Optional[float] = None,
+        collect_stored: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run the scrape -> dedupe -> embed -> persist pipeline. Batches move
+        between stages through bounded queues (`pipeline_queue_size`), each
+        stage runs `pipeline_*_concurrency` workers, and every worker of the
+        DB stages holds its own session.
+        Sources whose circuit breaker is open are skipped without a request.
+        A source still running after `source_timeout` seconds (default: the
+        daily budget) is cut off and logged as PARTIAL if it found anything,
+        TIMEOUT otherwise; neither counts against its circuit breaker.
+        With `collect_stored=False` only counts are returned, which keeps a
+        large run's memory flat.
+        """
+        source_timeout = source_timeout or settings.scraping_source_timeout_daily
+        await circuit_breakers.ensure_seeded()
+        skipped_sources = [s.source_name for s in scrapers if not circuit_breakers.allow(s.source_name)]
+        if skipped_sources:
+            logger.info(f"Skipping sources with open circuits: {skipped_sources}")
+            for source_name in skipped_sources:
+                telemetry.record_event("source_skipped", source_name, reason="circuit_open")
+            scrapers = [s for s in scrapers if s.source_name not in skipped_sources]
+        
+        failed_sources: List[str] = []
+        partial_sources: List[str] = []
+        stored_opportunities: List[Dict[str, Any]] = []
+        inserted = 0
+        deferred: List[StoreBatch] = []
+        window = DedupeWindow()
+        found = 0
+        scrape_slots = asyncio.Semaphore(max(1, settings.pipeline_scrape_concurrency))
+        
+        async def scrape(feed):
+            async def emit(batch):
+                nonlocal found
+                # Waits while the dedupe queue is full; a deadline cancelling the wait drops the batch
+                await feed(batch)
+                found += len(batch)
+            
+            async def run(scraper):
+                async with scrape_slots:
+                    return await self._stream_with_logging(scraper, filters, emit, source_timeout)
+            
+            results = await asyncio.gather(*[run(scraper) for scraper in scrapers], return_exceptions=True)
+            for scraper, result in zip(scrapers, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Scraper failed: {result}")
+                if result == ScrapeStatus.PARTIAL:
+                    partial_sources.append(scraper.source_name)
+                elif result != ScrapeStatus.SUCCESS:
+                    failed_sources.append(scraper.source_name)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def dedupe(session, batch):
+            return await self._dedupe_batch(session, batch, window)
         
-        all_opportunities = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Scraper failed: {result}")
-                continue
-            if result:
-                all_opportunities.extend(result)
+        async def persist(session, batch):
+            nonlocal inserted
+            stored, unresolved = await self._persist_batch(session, batch, window)
+            if unresolved is not None:
+                deferred.append(unresolved)
+            inserted += len(stored)
+            if collect_stored:
+                stored_opportunities.extend(stored)
+            return stored
         
-        logger.info(f"Found {len(all_opportunities)} total opportunities")
+        pipeline = Pipeline([
+            Stage("dedupe", dedupe, settings.pipeline_dedupe_concurrency, settings.pipeline_queue_size, self.session_factory),
+            Stage("embed", self._embed_batch, settings.pipeline_embed_concurrency, settings.pipeline_queue_size),
+            Stage("persist", persist, settings.pipeline_persist_concurrency, settings.pipeline_queue_size, self.session_factory),
+        ])
+        await pipeline.run(scrape)
         
-        stored_opportunities = await self._store_opportunities(db, all_opportunities)
+        if deferred:
+            # Duplicates whose canonical was still in flight; every canonical is committed now
+            async with self.session_factory() as session:
+                stored, _ = await self._persist_batch(session, StoreBatch.merge(deferred))
+            inserted += len(stored)
+            if collect_stored:
+                stored_opportunities.extend(stored)
+        
+        stats = pipeline.stats()
+        stats["scrape"] = {
+            "concurrency": settings.pipeline_scrape_concurrency,
+            "sources": len(scrapers),
+            "items_out": found,
+            "items_per_second": round(found / stats["elapsed_seconds"], 1) if stats["elapsed_seconds"] else 0.0,
+        }
+        logger.info(f"Found {found} total opportunities, stored {inserted}; pipeline: {stats}")
+        telemetry.record_event(
+            "pipeline_run",
+            found=found,
+            inserted=inserted,
+            failed_sources=failed_sources,
+            partial_sources=partial_sources,
+            skipped_sources=skipped_sources,
+            stages=stats
+        )
         
-        return stored_opportunities
+        return {
+            "found": found,
+            "stored": stored_opportunities,
+            "inserted": inserted,
+            "skipped": found - inserted,
+            "failed_sources": failed_sources,
+            "partial_sources": partial_sources,
+            "skipped_sources": skipped_sources,
+            "pipeline": stats
+        }
     
-    async def _scrape_with_logging(
+    async def _stream_with_logging(
         self,
-        db: AsyncSession,
         scraper,
-        filters: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+        filters: Dict[str, Any],
+        emit: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        timeout: float
+    ) -> ScrapeStatus:
         source_name = scraper.source_name
         started_at = datetime.utcnow()
         
@@ -63,82 +239,191 @@ class ExecutorAgent:
             started_at=started_at
         )
         
+        found = 0
+        deadline = asyncio.timeout(timeout)
         try:
-            opportunities = await scraper.scrape(filters)
-            log.opportunities_found = len(opportunities)
-            log.completed_at = datetime.utcnow()
+            async with deadline:
+                async with aclosing(scrape_coalescer.stream(scraper, filters)) as stream:
+                    async for batch in stream:
+                        await emit(batch)
+                        found += len(batch)
             log.status = ScrapeStatus.SUCCESS
-            
-            db.add(log)
-            await db.commit()
-            
-            return opportunities
+            circuit_breakers.record_success(source_name)
             
         except Exception as e:
-            log.status = ScrapeStatus.FAILURE
-            log.error_log = str(e)
-            log.completed_at = datetime.utcnow()
-            
-            db.add(log)
-            await db.commit()
+            timed_out = isinstance(e, TimeoutError) and deadline.expired()
+            if timed_out:
+                elapsed = (datetime.utcnow() - started_at).total_seconds()
+                log.error_log = f"Deadline of {timeout:.0f}s reached after {elapsed:.1f}s with {found} opportunities"
+                logger.warning(f"Scraper {source_name}: {log.error_log}")
+            else:
+                log.error_log = str(e)
+                logger.error(f"Scraper {source_name} failed: {e}")
             
-            logger.error(f"Scraper {source_name} failed: {e}")
-            return []
+            if timed_out and found:
+                # What streamed in before the deadline is already in the pipeline
+                log.status = ScrapeStatus.PARTIAL
+                circuit_breakers.record_success(source_name)
+            elif timed_out:
+                # A short interactive budget on a slow source is not a failure of the source
+                log.status = ScrapeStatus.TIMEOUT
+                circuit_breakers.release_probe(source_name)
+            else:
+                log.status = ScrapeStatus.FAILURE
+                circuit_breakers.record_failure(source_name, e)
+        
+        except asyncio.CancelledError:
+            # Cancelled, not judged: a half-open circuit must not wait forever on this probe
+            circuit_breakers.release_probe(source_name)
+            raise
+        
+        log.opportunities_found = found
+        log.completed_at = datetime.utcnow()
+        # Buffered; written in the background with other scrape bookkeeping
+        telemetry.record_scrape_log(log)
+        
+        return log.status
     
     async def _store_opportunities(
         self,
         db: AsyncSession,
         opportunities: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        if not opportunities:
+        """Run one batch through dedupe, embed and persist on a single session"""
+        batch = await self._dedupe_batch(db, opportunities)
+        if batch is None:
             return []
+        stored, _ = await self._persist_batch(db, await self._embed_batch(batch))
+        return stored
+    
+    async def _dedupe_batch(
+        self,
+        db: AsyncSession,
+        opportunities: List[Dict[str, Any]],
+        window: Optional[DedupeWindow] = None
+    ) -> Optional[StoreBatch]:
+        """Drop stored listings and link near-duplicates; None when nothing is left to write"""
+        if not opportunities:
+            return None
+        
+        to_write, needs_embedding = await filter_known_opportunities(db, opportunities)
+        known = len(opportunities) - len(to_write)
+        if not to_write:
+            logger.info(f"All {known} scraped opportunities are already stored")
+            await run_checkpoints(checkpoints_of(opportunities))
+            return None
         
+        # Listings that repeat one from another source are linked, not embedded
+        fingerprints = [fingerprint(opp) for opp in to_write]
+        links = await find_canonicals(db, to_write, fingerprints, window)
+        needs_embedding = [
+            needed and link is None
+            for needed, link in zip(needs_embedding, links)
+        ]
+        return StoreBatch(
+            to_write, needs_embedding, fingerprints, links, known=known, checkpoints=checkpoints_of(opportunities)
+        )
+    
+    async def _embed_batch(self, batch: StoreBatch) -> StoreBatch:
         texts_for_embedding = [
-            f"{opp['title']} {opp.get('description', '')[:500]}"
-            for opp in opportunities
+            embedding_text(opp)
+            for opp, needed in zip(batch.opportunities, batch.needs_embedding)
+            if needed
         ]
         
+        new_embeddings = []
+        if texts_for_embedding:
+            try:
+                new_embeddings = await generate_embeddings_batch(texts_for_embedding)
+            except Exception as e:
+                logger.error(f"Error generating embeddings: {e}")
+                new_embeddings = [None] * len(texts_for_embedding)
+                # Stored without embeddings; leave the listings to be scraped (and embedded) again
+                batch.checkpoints = []
+        
+        # Listings whose text is unchanged keep their stored embedding
+        remaining = iter(new_embeddings)
+        batch.embeddings = [next(remaining) if needed else None for needed in batch.needs_embedding]
+        batch.embedded = len(texts_for_embedding)
+        return batch
+    
+    async def _persist_batch(
+        self,
+        db: AsyncSession,
+        batch: StoreBatch,
+        window: Optional[DedupeWindow] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[StoreBatch]]:
+        """
+        Write a batch and commit, then run its checkpoints. Returns the
+        listings inserted and, when `window` is given, the duplicates whose
+        canonical is not committed yet, for the caller to persist once it
+        is; without a window those are written unlinked. The checkpoints
+        then travel with those duplicates.
+        """
+        canonical = [i for i, link in enumerate(batch.links) if link is None]
+        duplicates = [i for i, link in enumerate(batch.links) if link is not None]
+        unresolved = None
         try:
-            embeddings = await generate_embeddings_batch(texts_for_embedding)
-        except Exception as e:
-            logger.error(f"Error generating embeddings: {e}")
-            embeddings = [None] * len(opportunities)
+            # Canonicals first, so duplicates of listings in this batch can reference their ids
+            result = await bulk_upsert_opportunities(
+                db,
+                [batch.opportunities[i] for i in canonical],
+                [batch.embeddings[i] for i in canonical],
+                fingerprints=[batch.fingerprints[i] for i in canonical]
+            )
+            if duplicates:
+                canonical_ids = await self._resolve_canonical_ids(
+                    db, [batch.links[i] for i in duplicates], result
+                )
+                if window is not None:
+                    pending = [i for i, canonical_id in zip(duplicates, canonical_ids) if canonical_id is None]
+                    if pending:
+                        unresolved = batch.subset(pending)
+                        canonical_ids = [
+                            canonical_id for canonical_id in canonical_ids if canonical_id is not None
+                        ]
+                        pending_set = set(pending)
+                        duplicates = [i for i in duplicates if i not in pending_set]
+                result.merge(await bulk_upsert_opportunities(
+                    db,
+                    [batch.opportunities[i] for i in duplicates],
+                    fingerprints=[batch.fingerprints[i] for i in duplicates],
+                    canonical_ids=canonical_ids
+                ))
+            await db.commit()
+        finally:
+            if window is not None:
+                window.release(batch.opportunities[i]["source_url"] for i in canonical)
+        
+        if unresolved is None:
+            await run_checkpoints(batch.checkpoints)
+        else:
+            unresolved.checkpoints = batch.checkpoints
+        
+        logger.info(
+            f"Stored {len(result.inserted)} new opportunities "
+            f"({result.updated} updated, {result.skipped + batch.known} skipped, "
+            f"{len(duplicates)} near-duplicates, {batch.embedded} embedded)"
+        )
         
+        inserted_urls = {row["source_url"] for row in result.inserted}
         stored = []
-        for opp_data, embedding in zip(opportunities, embeddings):
-            try:
-                from sqlalchemy import select
-                result = await db.execute(
-                    select(Opportunity).where(Opportunity.source_url == opp_data["source_url"])
-                )
-                existing = result.scalar_one_or_none()
-                
-                if existing:
-                    continue
-                
-                opportunity = Opportunity(
-                    title=opp_data["title"],
-                    description=opp_data.get("description"),
-                    source_url=opp_data["source_url"],
-                    source_name=opp_data["source_name"],
-                    opportunity_type=OpportunityType(opp_data["opportunity_type"]),
-                    location=opp_data.get("location"),
-                    remote=opp_data.get("remote", False),
-                    compensation=opp_data.get("compensation"),
-                    tags=opp_data.get("tags"),
-                    embedding=embedding,
-                    raw_data=opp_data
-                )
-                
-                db.add(opportunity)
+        for opp_data in batch.opportunities:
+            if opp_data.get("source_url") in inserted_urls:
+                inserted_urls.discard(opp_data["source_url"])
                 stored.append(opp_data)
-                
-            except Exception as e:
-                logger.error(f"Error storing opportunity: {e}")
-                continue
-        
-        await db.commit()
-        logger.info(f"Stored {len(stored)} new opportunities")
         
-        return stored
-
+        return stored, unresolved
+    
+    async def _resolve_canonical_ids(
+        self,
+        db: AsyncSession,
+        links: List[Union[UUID, str]],
+        result: UpsertResult
+    ) -> List[Optional[UUID]]:
+        """Ids for links given as source URLs: inserted by `result`, or already committed"""
+        ids = {row["source_url"]: row["id"] for row in result.inserted}
+        missing = list({link for link in links if isinstance(link, str) and link not in ids})
+        if missing:
+            ids.update(await find_ids(db, missing))
+        return [ids.get(link) if isinstance(link, str) else link for link in links]
@@ -21,14 +21,13 @@ from app.schemas.chat import (
     MessageResponse,
     AnswerQuestionsRequest
 )
-from app.agents.coordinator import CoordinatorAgent
+from app.agents import get_coordinator
 from app.services.ably_service import ably_service
 from app.auth import get_current_user, get_user_email_from_token
 from app.services.user_service import get_or_create_user
 from app.config import settings
 
 router = APIRouter()
-coordinator = CoordinatorAgent()
 logger = logging.getLogger(__name__)
 ably_auth = AblyRest(key=settings.ably_api_key)
 
@@ -111,7 +110,7 @@ async def process_initial_message(conversation_id: str, initial_message: str):
     
     async with AsyncSessionLocal() as db:
         try:
-            conversational_message = await coordinator.generate_questions(initial_message)
+            conversational_message = await get_coordinator().generate_questions(initial_message)
             
             assistant_message = Message(
                 conversation_id=UUID(conversation_id),
@@ -302,7 +301,7 @@ async def process_goal_from_answers(conversation_id: str, user_id: str, answers:
             })
             
             qa_pairs = [{"question": qa.question, "answer": qa.answer} for qa in answers]
-            goal_result = await coordinator.process_goal_with_answers(
+            goal_result = await get_coordinator().process_goal_with_answers(
                 db, UUID(user_id), initial_message, qa_pairs, conversation_id
             )
             
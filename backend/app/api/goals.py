@@ -8,11 +8,11 @@ from app.database import get_db
 from app.models.goal import Goal, GoalStatus, GoalType
 from app.models.user import User
 from app.schemas.goal import GoalCreate, GoalResponse, GoalUpdate
-from app.agents.coordinator import CoordinatorAgent
+from app.agents import get_coordinator
+from app.services.embeddings import current_embedding_model
 from app.auth import get_current_user
 
 router = APIRouter()
-coordinator = CoordinatorAgent()
 
 
 @router.post("/", response_model=GoalResponse)
@@ -46,7 +46,7 @@ async def process_goal_background(goal_id: str, user_id: UUID, description: str)
     from app.database import AsyncSessionLocal
     
     async with AsyncSessionLocal() as db:
-        result = await coordinator.process_new_goal(db, user_id, description)
+        result = await get_coordinator().process_new_goal(db, user_id, description)
         
         if result["success"]:
             clarified_goal = result["clarified_goal"]
@@ -59,6 +59,7 @@ async def process_goal_background(goal_id: str, user_id: UUID, description: str)
                 goal.goal_type = GoalType(clarified_goal.get("goal_type", "job"))
                 goal.filters = clarified_goal
                 goal.embedding = clarified_goal.get("embedding")
+                goal.embedding_model = current_embedding_model()
                 
                 await db.commit()
 
@@ -183,7 +184,7 @@ async def refresh_goal_background(goal_id: UUID, goal_filters: dict):
     from app.database import AsyncSessionLocal
     
     async with AsyncSessionLocal() as db:
-        result = await coordinator.refresh_goal_opportunities(
+        result = await get_coordinator().refresh_goal_opportunities(
             db, goal_id, goal_filters
         )
 
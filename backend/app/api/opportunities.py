@@ -7,11 +7,10 @@ from uuid import UUID
 from app.database import get_db
 from app.models.opportunity import Opportunity
 from app.schemas.opportunity import OpportunityResponse, OpportunityFilters
-from app.agents.coordinator import CoordinatorAgent
+from app.agents import get_coordinator
 from app.auth import get_current_user, get_optional_user
 
 router = APIRouter()
-coordinator = CoordinatorAgent()
 
 
 @router.get("/", response_model=List[OpportunityResponse])
@@ -27,7 +26,7 @@ async def list_opportunities(
         if not user_id:
             raise HTTPException(status_code=401, detail="Authentication required")
         
-        result = await coordinator.get_ranked_opportunities(
+        result = await get_coordinator().get_ranked_opportunities(
             db=db,
             goal_id=goal_id,
             user_id=user_id,
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 
@@ -31,7 +32,77 @@ class Settings(BaseSettings):
     allowed_origins: str = "http://localhost:5173,http://localhost:3000"
     
     scraping_rate_limit: int = 2
+    scraping_rate_limit_min: float = 0.2
+    scraping_rate_limit_max: float = 10.0
+    scraping_rate_increase: float = 0.1
+    scraping_rate_decrease_factor: float = 0.5
     scraping_user_agent: str = "Genie-Bot/1.0"
+    scraping_http_max_connections: int = 100
+    scraping_http_max_connections_per_host: int = 10
+    scraping_http_dns_cache_ttl: int = 300
+    scraping_http_keepalive_timeout: float = 30.0
+    scraping_http_timeout: int = 30
+    scraping_browser_pool_size: int = 2
+    scraping_browser_max_concurrency: int = 4
+    scraping_browser_max_pages: int = 50
+    scraping_browser_prewarm: bool = True
+    scraping_robots_ttl: int = 86400
+    scraping_robots_negative_ttl: int = 600
+    scraping_conditional_get: bool = True
+    scraping_extraction_cache_enabled: bool = True
+    scraping_extraction_cache_memory_size: int = 256
+    scraping_extraction_cache_ttl_days: int = 14
+    scraping_extraction_cache_max_per_source: int = 500
+    scraping_max_pages: int = 3
+    scraping_max_new_listings: int = 50
+    scraping_cursor_max_keys: int = 2000
+    scraping_stream_batch_size: int = 10
+    scraping_cassette_mode: str = "off"
+    scraping_cassette_dir: str = "tests/fixtures/cassettes"
+    scraping_breaker_enabled: bool = True
+    scraping_breaker_failure_threshold: int = 3
+    scraping_breaker_cooldown: int = 300
+    scraping_breaker_max_cooldown: int = 3600
+    scraping_breaker_health_alpha: float = 0.3
+    scraping_breaker_seed_window_hours: int = 24
+    scraping_result_cache_ttl: int = 300
+    scraping_result_cache_max_entries: int = 256
+    scraping_cpu_workers: int = 2
+    scraping_cpu_max_pending: int = 32
+    scraping_cpu_inline_threshold: int = 50000
+    scraping_source_timeout_interactive: float = 45.0
+    scraping_source_timeout_daily: float = 300.0
+    pipeline_queue_size: int = 8
+    pipeline_scrape_concurrency: int = 8
+    pipeline_dedupe_concurrency: int = 1
+    pipeline_embed_concurrency: int = 2
+    pipeline_persist_concurrency: int = 1
+    telemetry_flush_interval: float = 5.0
+    telemetry_flush_size: int = 200
+    telemetry_max_buffer: int = 10000
+    
+    opportunity_upsert_batch_size: int = 1000
+    opportunity_upsert_update_existing: bool = False
+    embedding_provider: str = "openai"
+    embedding_local_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_local_backend: str = "torch"
+    embedding_local_threads: int = 2
+    embedding_local_batch_size: int = 64
+    embedding_batch_max_inputs: int = 512
+    embedding_batch_max_tokens: int = 250000
+    embedding_max_input_tokens: int = 8191
+    embedding_max_concurrency: int = 4
+    embedding_retry_attempts: int = 3
+    embedding_cache_enabled: bool = True
+    embedding_cache_memory_size: int = 2000
+    embedding_cache_max_rows: int = 200000
+    embedding_prefilter_bloom: bool = False
+    embedding_prefilter_bloom_capacity: int = 1000000
+    embedding_prefilter_bloom_error_rate: float = 0.01
+    dedupe_enabled: bool = True
+    # At most near_duplicates.BANDS - 1: only then must a match share one of the indexed bands
+    dedupe_key_max_distance: int = Field(default=3, ge=0, le=3)
+    dedupe_description_max_distance: int = 8
     
     @property
     def allowed_origins_list(self) -> List[str]:
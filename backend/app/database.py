@@ -43,7 +43,7 @@ async def get_db() -> AsyncSession:
 
 async def init_db():
     # Import models to register them with Base
-    from app.models import user, goal, opportunity, feedback, chat
+    from app.models import user, goal, opportunity, feedback, chat, scrape_log, http_validator, extraction_cache, scrape_cursor, embedding_cache, pipeline_event
     
     async with engine.begin() as conn:
         try:
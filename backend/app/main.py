@@ -6,6 +6,10 @@ import logging
 from app.config import settings
 from app.database import init_db
 from app.api import api_router
+from app.scrapers.http_client import http_client
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.cpu_executor import cpu_executor
+from app.services.telemetry import telemetry
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +28,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}")
     yield
     logger.info("Shutting down...")
+    await browser_pool.close()
+    await http_client.close()
+    await cpu_executor.close()
+    await telemetry.close()
 
 
 app = FastAPI(
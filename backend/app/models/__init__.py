@@ -3,6 +3,16 @@ from app.models.goal import Goal
 from app.models.opportunity import Opportunity
 from app.models.feedback import Feedback
 from app.models.scrape_log import ScrapeLog
+from app.models.chat import Conversation, Message
+from app.models.http_validator import HttpValidator
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.models.scrape_cursor import ScrapeCursor
+from app.models.embedding_cache import EmbeddingCacheEntry
+from app.models.pipeline_event import PipelineEvent
 
-__all__ = ["User", "Goal", "Opportunity", "Feedback", "ScrapeLog"]
+__all__ = [
+    "User", "Goal", "Opportunity", "Feedback", "ScrapeLog", "Conversation", "Message",
+    "HttpValidator", "ExtractionCacheEntry", "ScrapeCursor", "EmbeddingCacheEntry",
+    "PipelineEvent"
+]
 
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from pgvector.sqlalchemy import Vector
+import uuid
+
+from app.database import Base
+
+
+class EmbeddingCacheEntry(Base):
+    __tablename__ = "embedding_cache"
+    __table_args__ = (
+        UniqueConstraint("model", "dimensions", "text_hash", name="uq_embedding_cache_model_dims_hash"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    model = Column(String, nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    text_hash = Column(String(64), nullable=False)
+    # Unsized so entries for any model/dimension combination share the table
+    embedding = Column(Vector(), nullable=False)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_hit_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
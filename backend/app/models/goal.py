@@ -32,6 +32,7 @@ class Goal(Base):
     goal_type = Column(Enum(GoalType), nullable=False)
     filters = Column(JSON, default=dict)
     embedding = Column(Vector(1536))
+    embedding_model = Column(String(128))
     status = Column(Enum(GoalStatus), default=GoalStatus.ACTIVE)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.database import Base
+
+
+class HttpValidator(Base):
+    __tablename__ = "http_validators"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    url = Column(String, unique=True, nullable=False, index=True)
+    source_name = Column(String, nullable=False, index=True)
+    etag = Column(String)
+    last_modified = Column(String)
+    body_hash = Column(String(64))
+    checked_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
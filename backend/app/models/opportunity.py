@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, DateTime, JSON, Enum, Boolean, Text, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, JSON, Enum, Boolean, Text, Numeric, BigInteger, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 import uuid
@@ -17,6 +17,9 @@ class OpportunityType(str, enum.Enum):
 
 class Opportunity(Base):
     __tablename__ = "opportunities"
+    __table_args__ = (
+        Index("ix_opportunities_dedupe_bands", "dedupe_bands", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
@@ -27,8 +30,22 @@ class Opportunity(Base):
     location = Column(String)
     remote = Column(Boolean, default=False)
     compensation = Column(JSON)
+    # Parsed from `compensation`; recurring pay is annualized, `period` is the unit the listing quoted
+    comp_min = Column(Numeric(14, 2), index=True)
+    comp_max = Column(Numeric(14, 2), index=True)
+    currency = Column(String(3), index=True)
+    period = Column(String(16), index=True)
     tags = Column(ARRAY(String))
     embedding = Column(Vector(1536))
+    # Which provider/model produced `embedding`; only same-model vectors are compared
+    embedding_model = Column(String(128), index=True)
+    # SimHash fingerprints and LSH bands (see app.services.near_duplicates)
+    dedupe_key = Column(BigInteger)
+    dedupe_description = Column(BigInteger)
+    dedupe_company = Column(BigInteger)
+    dedupe_bands = Column(ARRAY(Integer))
+    # Set on near-duplicates of a listing from another source; search only returns canonicals
+    canonical_id = Column(UUID(as_uuid=True), ForeignKey("opportunities.id", ondelete="SET NULL"), index=True)
     raw_data = Column(JSON)
     scraped_at = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.database import Base
+
+
+class PipelineEvent(Base):
+    """Bookkeeping from scrape runs other than per-source ScrapeLogs, e.g. skipped sources and run summaries"""
+    __tablename__ = "pipeline_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(64), nullable=False, index=True)
+    source_name = Column(String, index=True)
+    payload = Column(JSON)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, JSON, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.database import Base
+
+
+class ScrapeCursor(Base):
+    __tablename__ = "scrape_cursors"
+    __table_args__ = (UniqueConstraint("source_name", "scope", name="uq_scrape_cursor_source_scope"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    source_name = Column(String, nullable=False, index=True)
+    scope = Column(String, nullable=False, default="")
+    last_seen_key = Column(String)
+    last_seen_at = Column(DateTime(timezone=True))
+    seen_keys = Column(JSON, default=list)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -11,6 +11,8 @@ class ScrapeStatus(str, enum.Enum):
     SUCCESS = "success"
     FAILURE = "failure"
     PARTIAL = "partial"
+    # Cut off by its time budget before finding anything; says nothing about the source's health
+    TIMEOUT = "timeout"
 
 
 class ScrapeLog(Base):
@@ -25,6 +25,10 @@ class OpportunityResponse(BaseModel):
     location: Optional[str]
     remote: bool
     compensation: Optional[Dict]
+    comp_min: Optional[float] = None
+    comp_max: Optional[float] = None
+    currency: Optional[str] = None
+    period: Optional[str] = None
     tags: Optional[List[str]]
     scraped_at: datetime
     created_at: datetime
@@ -1,23 +1,27 @@
-from typing import List, Dict, Any
-from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
-from app.scrapers.papercall import PapercallScraper
-from app.scrapers.sessionize import SessionizeScraper
-from app.scrapers.remoteok import RemoteOKScraper
-from app.scrapers.weworkremotely import WeWorkRemotelyScraper
-from app.scrapers.indeed import IndeedScraper
-from app.scrapers.ycombinator import YCombinatorScraper
-from app.scrapers.angellist import AngelListScraper
-from app.scrapers.eventbrite import EventbriteScraper
-
-SCRAPER_REGISTRY: Dict[str, Crawl4AIBaseScraper] = {
-    "papercall": PapercallScraper(),
-    "sessionize": SessionizeScraper(),
-    "remoteok": RemoteOKScraper(),
-    "weworkremotely": WeWorkRemotelyScraper(),
-    "indeed": IndeedScraper(),
-    "ycombinator": YCombinatorScraper(),
-    "angellist": AngelListScraper(),
-    "eventbrite": EventbriteScraper(),
+"""
+Scraper registry.
+
+Scrapers are imported and instantiated on first use: importing this package
+must not pull in crawl4ai/Playwright, so API processes that never crawl (and
+uvicorn workers at spawn) stay cheap to start.
+"""
+from typing import List, Dict, Any, TYPE_CHECKING
+from importlib import import_module
+import threading
+
+if TYPE_CHECKING:
+    from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
+
+# name -> "module:Class"; modules are imported only when the scraper is first requested
+SCRAPER_PATHS: Dict[str, str] = {
+    "papercall": "app.scrapers.papercall:PapercallScraper",
+    "sessionize": "app.scrapers.sessionize:SessionizeScraper",
+    "remoteok": "app.scrapers.remoteok:RemoteOKScraper",
+    "weworkremotely": "app.scrapers.weworkremotely:WeWorkRemotelyScraper",
+    "indeed": "app.scrapers.indeed:IndeedScraper",
+    "ycombinator": "app.scrapers.ycombinator:YCombinatorScraper",
+    "angellist": "app.scrapers.angellist:AngelListScraper",
+    "eventbrite": "app.scrapers.eventbrite:EventbriteScraper",
 }
 
 GOAL_TYPE_TO_SCRAPERS = {
@@ -27,25 +31,55 @@ GOAL_TYPE_TO_SCRAPERS = {
     "grant": [],
 }
 
+# Re-exports resolved on attribute access, for the same reason
+_LAZY_EXPORTS = {
+    "Crawl4AIBaseScraper": "app.scrapers.crawl4ai_base",
+    "http_client": "app.scrapers.http_client",
+    "browser_pool": "app.scrapers.browser_pool",
+    "rate_limiters": "app.scrapers.rate_limiter",
+}
+
+_instances: Dict[str, "Crawl4AIBaseScraper"] = {}
+_instances_lock = threading.Lock()
 
-def get_scrapers_for_goal_type(goal_type: str) -> List[Crawl4AIBaseScraper]:
+
+def get_scraper(name: str) -> "Crawl4AIBaseScraper":
+    """The shared instance of a scraper, constructed on first request; None if unknown"""
+    scraper = _instances.get(name)
+    if scraper is not None or name not in SCRAPER_PATHS:
+        return scraper
+    with _instances_lock:
+        if name not in _instances:
+            module_path, class_name = SCRAPER_PATHS[name].split(":")
+            _instances[name] = getattr(import_module(module_path), class_name)()
+        return _instances[name]
+
+
+def get_scrapers_for_goal_type(goal_type: str) -> List["Crawl4AIBaseScraper"]:
     scraper_names = GOAL_TYPE_TO_SCRAPERS.get(goal_type, [])
-    return [SCRAPER_REGISTRY[name] for name in scraper_names if name in SCRAPER_REGISTRY]
+    return [get_scraper(name) for name in scraper_names if name in SCRAPER_PATHS]
 
 
-def get_all_scrapers() -> List[Crawl4AIBaseScraper]:
-    return list(SCRAPER_REGISTRY.values())
+def get_all_scrapers() -> List["Crawl4AIBaseScraper"]:
+    return [get_scraper(name) for name in SCRAPER_PATHS]
 
 
-def get_scraper(name: str) -> Crawl4AIBaseScraper:
-    return SCRAPER_REGISTRY.get(name)
+def __getattr__(name: str) -> Any:
+    if name == "SCRAPER_REGISTRY":
+        return {scraper_name: get_scraper(scraper_name) for scraper_name in SCRAPER_PATHS}
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
     "Crawl4AIBaseScraper",
+    "http_client",
+    "browser_pool",
+    "rate_limiters",
     "get_scrapers_for_goal_type",
     "get_all_scrapers",
     "get_scraper",
+    "SCRAPER_PATHS",
     "SCRAPER_REGISTRY"
 ]
-
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
 import logging
 
@@ -7,6 +7,9 @@ logger = logging.getLogger(__name__)
 
 class AngelListScraper(Crawl4AIBaseScraper):
     
+    query_filters = ("role",)
+    content_selector = "main"
+    
     def __init__(self):
         super().__init__(
             source_name="angellist",
@@ -14,6 +17,9 @@ class AngelListScraper(Crawl4AIBaseScraper):
         )
     
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._collect_stream(filters)
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
         try:
             role = filters.get("role", "software-engineer")
             url = f"{self.base_url}/role/r/{role}"
@@ -32,17 +38,16 @@ class AngelListScraper(Crawl4AIBaseScraper):
             Only include active job postings.
             """
             
-            raw_opportunities = await self._crawl_with_llm(url, instruction)
-            
-            opportunities = []
-            for raw_opp in raw_opportunities:
-                normalized = self._normalize_opportunity(raw_opp, "job")
-                if normalized.get("source_url"):
-                    opportunities.append(normalized)
+            total = 0
+            async for raw_opportunities in self._stream_new_listings(url, instruction):
+                opportunities = await self._normalize_batch(raw_opportunities, "job")
+                
+                total += len(opportunities)
+                if opportunities:
+                    yield opportunities
             
-            logger.info(f"Scraped {len(opportunities)} opportunities from AngelList/Wellfound")
-            return opportunities
+            logger.info(f"Scraped {total} opportunities from AngelList/Wellfound")
             
         except Exception as e:
             logger.error(f"Error scraping AngelList: {e}")
-            return []
+            raise
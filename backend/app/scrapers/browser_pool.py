@@ -0,0 +1,149 @@
+from typing import Dict, Any, List, Optional, AsyncIterator
+from contextlib import asynccontextmanager
+from importlib.util import find_spec
+import asyncio
+import logging
+
+from app.config import settings
+
+# crawl4ai (and Playwright behind it) is imported when the first browser is
+# launched, not when the API imports the pool to close it on shutdown
+CRAWL4AI_AVAILABLE = find_spec("crawl4ai") is not None
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        self.pages_served = 0
+        self.in_flight = 0
+        self.retiring = False
+
+
+class BrowserPool:
+    """
+    Long-lived headless browsers shared by all crawl4ai-based scrapers.
+
+    Every crawl gets its own page (crawl4ai opens one per `arun` inside a
+    context keyed by the run config), a global semaphore bounds the number of
+    concurrent pages, and browsers are recycled after serving
+    `scraping_browser_max_pages` pages to keep worker memory flat.
+    """
+
+    def __init__(self):
+        self._browsers: List[_PooledBrowser] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._browsers_launched = 0
+        self._browsers_recycled = 0
+        self._pages_served = 0
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._browsers:
+                logger.warning("Discarding browsers bound to a different event loop")
+            self._browsers = []
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(settings.scraping_browser_max_concurrency)
+            self._loop = loop
+
+    async def _launch(self) -> _PooledBrowser:
+        from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+        browser_config = BrowserConfig(
+            headless=True,
+            verbose=False,
+            user_agent=settings.scraping_user_agent,
+        )
+        crawler = AsyncWebCrawler(config=browser_config)
+        await crawler.start()
+        self._browsers_launched += 1
+        logger.info(f"Launched pooled browser ({len(self._browsers) + 1}/{settings.scraping_browser_pool_size})")
+        return _PooledBrowser(crawler)
+
+    async def _checkout(self) -> _PooledBrowser:
+        async with self._lock:
+            active = [b for b in self._browsers if not b.retiring]
+            least_busy = min(active, key=lambda b: b.in_flight, default=None)
+
+            if least_busy is None or (
+                least_busy.in_flight > 0 and len(active) < settings.scraping_browser_pool_size
+            ):
+                least_busy = await self._launch()
+                self._browsers.append(least_busy)
+
+            least_busy.in_flight += 1
+            return least_busy
+
+    async def _checkin(self, browser: _PooledBrowser):
+        browser.in_flight -= 1
+        browser.pages_served += 1
+        self._pages_served += 1
+
+        if browser.pages_served >= settings.scraping_browser_max_pages:
+            browser.retiring = True
+
+        if browser.retiring and browser.in_flight == 0 and browser in self._browsers:
+            self._browsers.remove(browser)
+            self._browsers_recycled += 1
+            logger.info(f"Recycling browser after {browser.pages_served} pages")
+            await self._close_browser(browser)
+
+    async def _close_browser(self, browser: _PooledBrowser):
+        try:
+            await browser.crawler.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser: {e}")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow a started AsyncWebCrawler for a single page crawl"""
+        if not CRAWL4AI_AVAILABLE:
+            raise RuntimeError("crawl4ai is not installed")
+
+        self._bind_loop()
+        async with self._semaphore:
+            browser = await self._checkout()
+            try:
+                yield browser.crawler
+            finally:
+                await self._checkin(browser)
+
+    async def warm_up(self):
+        """Launch the configured number of browsers ahead of the first crawl"""
+        if not CRAWL4AI_AVAILABLE:
+            return
+
+        self._bind_loop()
+        async with self._lock:
+            while len(self._browsers) < settings.scraping_browser_pool_size:
+                try:
+                    self._browsers.append(await self._launch())
+                except Exception as e:
+                    logger.error(f"Browser pre-warm failed: {e}")
+                    break
+
+    async def close(self):
+        browsers, self._browsers = self._browsers, []
+        for browser in browsers:
+            await self._close_browser(browser)
+        if browsers:
+            logger.info(f"Closed browser pool: {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "browsers": len(self._browsers),
+            "pool_size": settings.scraping_browser_pool_size,
+            "max_concurrency": settings.scraping_browser_max_concurrency,
+            "in_flight": sum(b.in_flight for b in self._browsers),
+            "pages_served": self._pages_served,
+            "browsers_launched": self._browsers_launched,
+            "browsers_recycled": self._browsers_recycled,
+        }
+
+
+browser_pool = BrowserPool()
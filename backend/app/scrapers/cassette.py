@@ -0,0 +1,176 @@
+from typing import Dict, Any, Optional, Callable, Awaitable
+from pathlib import Path
+import asyncio
+import base64
+import json
+import logging
+
+from app.config import settings
+from app.scrapers.errors import ScraperError
+
+logger = logging.getLogger(__name__)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+
+class CassetteMiss(ScraperError):
+    """Replay mode was asked for a URL that is not in the cassette"""
+
+
+class FetchedResponse:
+    """Status, headers and body of a plain HTTP fetch, live or replayed"""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+class PageSnapshot:
+    """The subset of crawl4ai's CrawlResult the scrapers read, live or replayed"""
+
+    def __init__(
+        self,
+        url: str,
+        html: str,
+        markdown: str,
+        status_code: Optional[int] = 200,
+        response_headers: Optional[Dict[str, str]] = None,
+        success: bool = True,
+        error_message: Optional[str] = None
+    ):
+        self.url = url
+        self.html = html
+        self.markdown = markdown
+        self.status_code = status_code
+        self.response_headers = response_headers or {}
+        self.success = success
+        self.error_message = error_message
+
+    @classmethod
+    def from_crawl_result(cls, url: str, result) -> "PageSnapshot":
+        markdown = getattr(result.markdown, "raw_markdown", result.markdown) or ""
+        return cls(
+            url=url,
+            html=result.html or "",
+            markdown=str(markdown),
+            status_code=result.status_code,
+            response_headers=dict(result.response_headers or {}),
+            success=result.success,
+            error_message=result.error_message
+        )
+
+
+class Cassette:
+    """
+    Record/replay layer under the scrapers' HTTP and browser fetches.
+
+    With `scraping_cassette_mode=record` every live fetch is written to
+    `<scraping_cassette_dir>/<source_name>.json`; with `replay` fetches are
+    served from those files and never touch the network, so parsing and
+    throughput can be exercised offline.
+    """
+
+    def __init__(self):
+        self._tapes: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def mode(self) -> str:
+        return settings.scraping_cassette_mode
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    def _path(self, source_name: str) -> Path:
+        return Path(settings.scraping_cassette_dir) / f"{source_name}.json"
+
+    def _tape(self, source_name: str) -> Dict[str, Any]:
+        key = str(self._path(source_name))
+        if key not in self._tapes:
+            path = self._path(source_name)
+            if path.exists():
+                self._tapes[key] = json.loads(path.read_text(encoding="utf-8"))
+            else:
+                self._tapes[key] = {"source": source_name, "http": {}, "pages": {}}
+        return self._tapes[key]
+
+    async def _save(self, source_name: str):
+        path = self._path(source_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tape = self._tape(source_name)
+        await asyncio.to_thread(
+            path.write_text, json.dumps(tape, indent=2, sort_keys=True), "utf-8"
+        )
+
+    async def http_get(
+        self,
+        source_name: str,
+        url: str,
+        live: Callable[[], Awaitable[FetchedResponse]]
+    ) -> FetchedResponse:
+        if self.mode == MODE_OFF:
+            return await live()
+
+        if self.replaying:
+            entry = self._tape(source_name)["http"].get(url)
+            if entry is None:
+                raise CassetteMiss(f"No recorded HTTP response for {url} in {self._path(source_name)}")
+            if entry.get("encoding") == "base64":
+                body = base64.b64decode(entry["body"])
+            else:
+                body = entry["body"].encode("utf-8")
+            return FetchedResponse(url, entry["status"], entry.get("headers", {}), body)
+
+        response = await live()
+        try:
+            body, encoding = response.body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(response.body).decode("ascii"), "base64"
+        async with self._lock:
+            self._tape(source_name)["http"][url] = {
+                "status": response.status,
+                "headers": response.headers,
+                "body": body,
+                "encoding": encoding,
+            }
+            await self._save(source_name)
+        return response
+
+    async def fetch_page(
+        self,
+        source_name: str,
+        url: str,
+        live: Callable[[], Awaitable[PageSnapshot]]
+    ) -> PageSnapshot:
+        if self.mode == MODE_OFF:
+            return await live()
+
+        if self.replaying:
+            entry = self._tape(source_name)["pages"].get(url)
+            if entry is None:
+                raise CassetteMiss(f"No recorded page for {url} in {self._path(source_name)}")
+            return PageSnapshot(url=url, **entry)
+
+        snapshot = await live()
+        async with self._lock:
+            self._tape(source_name)["pages"][url] = {
+                "html": snapshot.html,
+                "markdown": snapshot.markdown,
+                "status_code": snapshot.status_code,
+                "response_headers": snapshot.response_headers,
+                "success": snapshot.success,
+                "error_message": snapshot.error_message,
+            }
+            await self._save(source_name)
+        return snapshot
+
+    def clear(self):
+        self._tapes.clear()
+
+
+cassette = Cassette()
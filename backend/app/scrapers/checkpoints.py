@@ -0,0 +1,53 @@
+"""
+Bookkeeping that may only happen once a scraped batch is stored.
+
+Advancing a source cursor means "never yield these listings again", so it
+must not happen before the consumer has committed them: a failed write, a
+deadline or a cancelled crawl would otherwise lose them for good. Scrapers
+attach such steps to the batch they yield as checkpoints, and the consumer
+runs them after its commit. A batch whose checkpoints never run is simply
+scraped again on the next run.
+"""
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """An async step that runs at most once, however many consumers store the batch"""
+
+    def __init__(self, fn: Callable[..., Awaitable[None]], *args: Any):
+        self._fn = fn
+        self._args = args
+        self.done = False
+
+    async def __call__(self):
+        if self.done:
+            return
+        self.done = True
+        await self._fn(*self._args)
+
+
+class ScrapeBatch(list):
+    """A batch of listings plus the checkpoints to run once they are stored"""
+
+    def __init__(self, items: Iterable[Any] = (), checkpoints: Optional[Iterable[Checkpoint]] = None):
+        super().__init__(items)
+        self.checkpoints: List[Checkpoint] = list(checkpoints or [])
+
+    def copy(self) -> "ScrapeBatch":
+        return ScrapeBatch(self, self.checkpoints)
+
+
+def checkpoints_of(batch: Any) -> List[Checkpoint]:
+    """Checkpoints of a batch; none for a plain list"""
+    return list(getattr(batch, "checkpoints", ()))
+
+
+async def run_checkpoints(checkpoints: Iterable[Checkpoint]):
+    for checkpoint in checkpoints:
+        try:
+            await checkpoint()
+        except Exception as e:
+            logger.warning(f"Scrape checkpoint failed; its listings will be scraped again: {e}")
@@ -0,0 +1,195 @@
+from typing import Dict, Any, Optional, List
+from datetime import datetime, timedelta, timezone
+import asyncio
+import enum
+import logging
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.scrape_log import ScrapeLog, ScrapeStatus
+from app.scrapers.errors import is_retryable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class SourceCircuit:
+    """
+    Breaker state for one source.
+    Retryable failures open the circuit after `scraping_breaker_failure_threshold`
+    in a row; a fatal failure opens it at once. Once the cooldown has passed a
+    single probe scrape is let through (half-open): success closes the circuit,
+    failure reopens it with a doubled cooldown, and a probe that never
+    finished (cancelled) is released so the next scrape can probe instead.
+    """
+
+    def __init__(self, source_name: str):
+        self.source_name = source_name
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.open_until: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_success_at: Optional[datetime] = None
+        self.last_failure_at: Optional[datetime] = None
+        self.health = 1.0
+        self._probing = False
+
+    def allow(self, now: Optional[datetime] = None) -> bool:
+        now = now or _utcnow()
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            if self.open_until and now < self.open_until:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            self._probing = False
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def release_probe(self):
+        self._probing = False
+
+    def record_success(self, at: Optional[datetime] = None):
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"Circuit for {self.source_name} closed after successful probe")
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.open_until = None
+        self.last_success_at = at or _utcnow()
+        self._probing = False
+        self._score(1.0)
+
+    def record_failure(self, error: Optional[str] = None, fatal: bool = False, at: Optional[datetime] = None):
+        at = at or _utcnow()
+        self.consecutive_failures += 1
+        self.last_error = error
+        self.last_failure_at = at
+        self._probing = False
+        self._score(0.0)
+
+        if (
+            fatal
+            or self.state == CircuitState.HALF_OPEN
+            or self.consecutive_failures >= settings.scraping_breaker_failure_threshold
+        ):
+            self._open(at)
+
+    def _open(self, at: datetime):
+        cooldown = min(
+            settings.scraping_breaker_cooldown * (2 ** self.open_count),
+            settings.scraping_breaker_max_cooldown
+        )
+        self.open_count += 1
+        self.state = CircuitState.OPEN
+        self.open_until = at + timedelta(seconds=cooldown)
+        logger.warning(
+            f"Circuit for {self.source_name} open until {self.open_until.isoformat()} "
+            f"after {self.consecutive_failures} failures: {self.last_error}"
+        )
+
+    def _score(self, outcome: float):
+        alpha = settings.scraping_breaker_health_alpha
+        self.health = (1 - alpha) * self.health + alpha * outcome
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "health": round(self.health, 3),
+            "consecutive_failures": self.consecutive_failures,
+            "open_until": self.open_until.isoformat() if self.open_until else None,
+            "last_error": self.last_error,
+        }
+
+
+class CircuitBreakerRegistry:
+    """One SourceCircuit per source_name, seeded from recent ScrapeLog rows"""
+
+    def __init__(self):
+        self._circuits: Dict[str, SourceCircuit] = {}
+        self._seeded = False
+        self._seed_lock: Optional[asyncio.Lock] = None
+
+    def get(self, source_name: str) -> SourceCircuit:
+        circuit = self._circuits.get(source_name)
+        if circuit is None:
+            circuit = SourceCircuit(source_name)
+            self._circuits[source_name] = circuit
+        return circuit
+
+    def allow(self, source_name: str) -> bool:
+        if not settings.scraping_breaker_enabled:
+            return True
+        return self.get(source_name).allow()
+
+    def record_success(self, source_name: str):
+        self.get(source_name).record_success()
+
+    def release_probe(self, source_name: str):
+        self.get(source_name).release_probe()
+
+    def record_failure(self, source_name: str, error: BaseException):
+        self.get(source_name).record_failure(str(error), fatal=not is_retryable(error))
+
+    async def ensure_seeded(self):
+        """Replay the last `scraping_breaker_seed_window_hours` of ScrapeLog once per process"""
+        if self._seeded or not settings.scraping_breaker_enabled:
+            return
+        if self._seed_lock is None:
+            self._seed_lock = asyncio.Lock()
+        async with self._seed_lock:
+            if self._seeded:
+                return
+            try:
+                await self._seed_from_logs()
+            except Exception as e:
+                logger.warning(f"Could not seed circuit breakers from scrape logs: {e}")
+            self._seeded = True
+
+    async def _seed_from_logs(self):
+        since = _utcnow() - timedelta(hours=settings.scraping_breaker_seed_window_hours)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(ScrapeLog.source_name, ScrapeLog.status, ScrapeLog.error_log, ScrapeLog.started_at, ScrapeLog.completed_at)
+                .where(ScrapeLog.started_at >= since)
+                .order_by(ScrapeLog.started_at)
+            )
+            rows = result.all()
+
+        for source_name, status, error_log, started_at, completed_at in rows:
+            at = completed_at or started_at
+            if at is not None and at.tzinfo is None:
+                at = at.replace(tzinfo=timezone.utc)
+            circuit = self.get(source_name)
+            if status == ScrapeStatus.FAILURE:
+                circuit.record_failure(error_log, at=at)
+            elif status == ScrapeStatus.TIMEOUT:
+                continue
+            else:
+                circuit.record_success(at=at)
+
+        open_sources = self.open_sources()
+        logger.info(f"Seeded circuit breakers from {len(rows)} scrape logs; open: {open_sources or 'none'}")
+
+    def open_sources(self) -> List[str]:
+        return [name for name, circuit in self._circuits.items() if circuit.state != CircuitState.CLOSED]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: circuit.stats() for name, circuit in self._circuits.items()}
+
+
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,161 @@
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+import asyncio
+import json
+import logging
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_filters(filters: Dict[str, Any], keys: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    Canonical form of the filters a scraper actually reads, so goals that
+    differ only in case, whitespace or unrelated fields share one crawl
+    """
+    def normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return " ".join(value.split()).lower()
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items()}
+        return value
+
+    filters = filters or {}
+    if keys is not None:
+        filters = {k: filters[k] for k in keys if filters.get(k) not in (None, "", [])}
+    return json.dumps(normalize(filters), sort_keys=True, default=str)
+
+
+class _SharedScrape:
+    """One in-flight scrape whose batches are replayed to every subscriber"""
+
+    def __init__(self):
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self._changed = asyncio.Condition()
+
+    async def publish(self, batch: List[Dict[str, Any]]):
+        async with self._changed:
+            self.batches.append(batch)
+            self._changed.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None):
+        async with self._changed:
+            self.done = True
+            self.error = error
+            self._changed.notify_all()
+
+    async def follow(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: index < len(self.batches) or self.done)
+                pending = self.batches[index:]
+                index = len(self.batches)
+                done, error = self.done, self.error
+            for batch in pending:
+                # copy() keeps a ScrapeBatch's checkpoints; whichever subscriber stores it first runs them
+                yield batch.copy()
+            if done:
+                if error is not None:
+                    raise error
+                return
+
+
+class ScrapeCoalescer:
+    """
+    Single-flight scrapes keyed by (source, normalized filters).
+    Concurrent identical scrapes attach to the crawl already running and
+    receive the same batches as they stream in; a completed scrape is reused
+    for `scraping_result_cache_ttl` seconds. Failures are never cached.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[str, str], _SharedScrape] = {}
+        self._results: Dict[Tuple[str, str], Tuple[float, List[List[Dict[str, Any]]]]] = {}
+        # Strong references so running crawls are not garbage collected
+        self._tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    def _key(self, scraper, filters: Dict[str, Any]) -> Tuple[str, str]:
+        return scraper.source_name, normalize_filters(filters, scraper.query_filters)
+
+    async def stream(self, scraper, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
+        key = self._key(scraper, filters)
+
+        cached = self._results.get(key)
+        if cached and cached[0] > time.monotonic():
+            self.hits += 1
+            logger.info(f"{scraper.source_name}: reusing scrape result from the last {settings.scraping_result_cache_ttl}s")
+            for batch in cached[1]:
+                yield batch.copy()
+            return
+
+        shared = self._inflight.get(key)
+        if shared is None:
+            self.misses += 1
+            shared = _SharedScrape()
+            self._inflight[key] = shared
+            self._tasks[key] = asyncio.create_task(self._run(key, shared, scraper, filters))
+        else:
+            self.coalesced += 1
+            logger.info(f"{scraper.source_name}: joining in-flight scrape for {key[1]}")
+
+        shared.subscribers += 1
+        try:
+            async for batch in shared.follow():
+                yield batch
+        finally:
+            shared.subscribers -= 1
+            task = self._tasks.get(key)
+            if shared.subscribers == 0 and not shared.done and task is not None:
+                # Every caller gave up (e.g. its deadline passed): stop the crawl
+                logger.info(f"{scraper.source_name}: no callers left, cancelling in-flight scrape")
+                task.cancel()
+
+    async def _run(self, key: Tuple[str, str], shared: _SharedScrape, scraper, filters: Dict[str, Any]):
+        try:
+            async for batch in scraper.scrape_stream(filters):
+                await shared.publish(batch)
+        except BaseException as e:
+            await shared.finish(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        else:
+            await shared.finish()
+            if settings.scraping_result_cache_ttl > 0:
+                self._store(key, shared.batches)
+        finally:
+            self._inflight.pop(key, None)
+            self._tasks.pop(key, None)
+
+    def _store(self, key: Tuple[str, str], batches: List[List[Dict[str, Any]]]):
+        now = time.monotonic()
+        for stale in [k for k, (expires_at, _) in self._results.items() if expires_at <= now]:
+            del self._results[stale]
+        while len(self._results) >= settings.scraping_result_cache_max_entries:
+            # Dicts keep insertion order, so this drops the oldest result
+            del self._results[next(iter(self._results))]
+        self._results[key] = (now + settings.scraping_result_cache_ttl, batches)
+
+    def clear(self):
+        self._results.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "inflight": len(self._inflight),
+            "cached": len(self._results),
+        }
+
+
+scrape_coalescer = ScrapeCoalescer()
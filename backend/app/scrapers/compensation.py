@@ -0,0 +1,196 @@
+"""
+Compensation text -> typed amounts.
+
+Handles ranges ("$120k - $150k", "80-100K"), single bounds ("up to €70k",
+"from 60,000 GBP"), currency symbols and ISO codes on either side, k/m
+suffixes, and pay periods ("/hr", "per month", "a day", "p.a.").
+A number only counts as pay when it carries a currency, a k/m suffix or a
+pay period of its own; percentages, counts ("10+ years", "4 day week",
+"40 hours per week"), years and benefit plans ("401(k)") are skipped.
+Recurring amounts are annualized so listings can be compared in SQL;
+one-off payments (honoraria, stipends) keep their face value.
+"""
+from typing import Dict, Any, Optional, Tuple
+import re
+
+HOURS_PER_YEAR = 2080
+ANNUAL_FACTORS = {
+    "hour": HOURS_PER_YEAR,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+RECURRING_PERIODS = set(ANNUAL_FACTORS)
+FIXED_PERIOD = "fixed"
+
+_SYMBOLS = [
+    ("US$", "USD"), ("CA$", "CAD"), ("C$", "CAD"), ("AU$", "AUD"), ("A$", "AUD"),
+    ("NZ$", "NZD"), ("S$", "SGD"), ("HK$", "HKD"), ("R$", "BRL"),
+    ("$", "USD"), ("€", "EUR"), ("£", "GBP"), ("¥", "JPY"), ("₹", "INR"), ("₩", "KRW"),
+]
+_CODES = {
+    "USD", "EUR", "GBP", "CAD", "AUD", "NZD", "CHF", "SEK", "NOK", "DKK", "PLN",
+    "INR", "JPY", "SGD", "HKD", "BRL", "MXN", "ZAR", "KRW", "CNY", "ILS",
+}
+
+_PERIOD_PATTERNS = [
+    ("hour", r"(?:/|\bper\s+|\ban?\s+)\s*(?:hour|hr|h)\b|\bhourly\b|\bp/?h\b"),
+    ("day", r"(?:/|\bper\s+|\ba\s+)\s*day\b|\bdaily\b|\bday\s+rate\b"),
+    ("week", r"(?:/|\bper\s+|\ba\s+)\s*(?:week|wk)\b|\bweekly\b"),
+    ("month", r"(?:/|\bper\s+|\ba\s+)\s*(?:month|mo|mth)\b|\bmonthly\b|\bp/?m\b"),
+    ("year", r"(?:/|\bper\s+|\ban?\s+)\s*(?:year|yr|annum)\b|\b(?:annual|annually|yearly)\b|\bp\.?a\.?(?!\w)|\bsalary\b"),
+    (FIXED_PERIOD, r"\bhonorarium\b|\bstipend\b|\bper\s+(?:talk|session|event|project)\b|\bflat\s+fee\b|\bone[-\s]?time\b"),
+]
+_PERIOD_RES = [(period, re.compile(pattern, re.IGNORECASE)) for period, pattern in _PERIOD_PATTERNS]
+
+# "." groups thousands too ("€ 45.000"), so a decimal needs other than three digits after it
+_NUMBER = r"(?<![\d.,])(\d{1,3}(?:[.,\s]\d{3})+(?![\d.,]\d)|\d+(?:\.\d+)?)\s*([kKmM](?![a-zA-Z]))?"
+_RANGE_RE = re.compile(_NUMBER + r"\s*(?:[A-Za-z]{3}\s*)?(?:-|–|—|to)\s*(?:[^\d\s]{1,3}\s*)?" + _NUMBER)
+_SINGLE_RE = re.compile(_NUMBER)
+_UP_TO_RE = re.compile(r"\b(?:up\s+to|max(?:imum)?|under)\b", re.IGNORECASE)
+_FROM_RE = re.compile(r"\b(?:from|min(?:imum)?|starting\s+at|at\s+least)\b", re.IGNORECASE)
+_THOUSANDS_RE = re.compile(r"\d{1,3}(?:[.,\s]\d{3})+")
+_SYMBOL_RE = "|".join(re.escape(symbol) for symbol, _ in _SYMBOLS)
+_CURRENCY_BEFORE_RE = re.compile(r"(?:(?:" + _SYMBOL_RE + r")|\b[A-Za-z]{3})\s*$")
+_CURRENCY_AFTER_RE = re.compile(r"\s*(?:(?:" + _SYMBOL_RE + r")|[A-Za-z]{3}\b)")
+_PERIOD_AFTER_RE = re.compile(
+    r"\s*(?:(?:/|per\s+|an?\s+)\s*(?:hour|hr|h|day|week|wk|month|mo|mth|year|yr|annum)\b"
+    r"|(?:hourly|daily|weekly|monthly|annually|yearly)\b|p\.?a\.?(?!\w))",
+    re.IGNORECASE
+)
+# "5%", "10+ years", "4 day week", "40 hours": never an amount, whatever else the text says
+_NOT_PAY_AFTER_RE = re.compile(
+    r"\s*(?:%|\+?\s*(?:years?|yrs?|days?|hours?|hrs?|weeks?|wks?|months?)\b(?!\s+rate))",
+    re.IGNORECASE
+)
+_BENEFIT_RE = re.compile(r"(?<![\d.,$€£¥₹])\b(?:401|403|457)\s*(?:\(\s*[a-z]\s*\)|[kb]\b)", re.IGNORECASE)
+_UNPAID_RE = re.compile(r"\b(?:unpaid|volunteer|no\s+compensation|pro\s+bono)\b", re.IGNORECASE)
+_PAID_RE = re.compile(r"\b(?:paid|salary|honorarium|stipend|compensat\w*)\b|\$", re.IGNORECASE)
+
+
+def _to_amount(digits: str, suffix: Optional[str]) -> float:
+    value = float(re.sub(r"[.,\s]", "", digits) if _THOUSANDS_RE.fullmatch(digits) else digits)
+    if suffix:
+        value *= 1000 if suffix.lower() == "k" else 1_000_000
+    return value
+
+
+def detect_currency(text: str) -> Optional[str]:
+    upper = text.upper()
+    for code in re.findall(r"\b[A-Z]{3}\b", upper):
+        if code in _CODES:
+            return code
+    for symbol, code in _SYMBOLS:
+        if symbol in text:
+            return code
+    return None
+
+
+def detect_period(text: str) -> Optional[str]:
+    for period, pattern in _PERIOD_RES:
+        if pattern.search(text):
+            return period
+    return None
+
+
+def _has_currency(text: str, start: int, end: int) -> bool:
+    """A currency symbol or ISO code right before `start` or right after `end`"""
+    before = _CURRENCY_BEFORE_RE.search(text[max(0, start - 4):start])
+    if before and (not before.group().strip().isalpha() or before.group().strip().upper() in _CODES):
+        return True
+    after = _CURRENCY_AFTER_RE.match(text, end)
+    return bool(after) and (not after.group().strip().isalpha() or after.group().strip().upper() in _CODES)
+
+
+def _is_pay(text: str, start: int, end: int, suffixes: Tuple[Optional[str], ...]) -> bool:
+    if _NOT_PAY_AFTER_RE.match(text, end):
+        return False
+    return any(suffixes) or _has_currency(text, start, end) or bool(_PERIOD_AFTER_RE.match(text, end))
+
+
+def _amounts(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """The first range or single amount that reads as pay"""
+    text = _BENEFIT_RE.sub(" ", text)
+    for match in _SINGLE_RE.finditer(text):
+        span = _RANGE_RE.match(text, match.start())
+        if span and not _NOT_PAY_AFTER_RE.match(text, match.end()):
+            low_digits, low_suffix, high_digits, high_suffix = span.groups()
+            if _is_pay(text, span.start(), span.end(), (low_suffix, high_suffix)):
+                # "80-100k": the suffix on the upper bound applies to both
+                low = _to_amount(low_digits, low_suffix or high_suffix)
+                high = _to_amount(high_digits, high_suffix)
+                if low > high:
+                    low, high = high, low
+                return low, high
+
+        if not _is_pay(text, match.start(), match.end(), (match.group(2),)):
+            continue
+        value = _to_amount(*match.groups())
+        prefix = text[:match.start()]
+        if _UP_TO_RE.search(prefix):
+            return None, value
+        if _FROM_RE.search(prefix) or text[match.end():].lstrip().startswith("+"):
+            return value, None
+        return value, value
+    return None, None
+
+
+def _infer_period(low: Optional[float], high: Optional[float]) -> Optional[str]:
+    reference = high if high is not None else low
+    if reference is None:
+        return None
+    if reference >= 10_000:
+        return "year"
+    if reference < 300:
+        return "hour"
+    return None
+
+
+def annualize(amount: Optional[float], period: Optional[str]) -> Optional[float]:
+    if amount is None:
+        return None
+    return round(amount * ANNUAL_FACTORS.get(period, 1), 2)
+
+
+def structured_compensation(
+    details: Optional[str],
+    low: Optional[float],
+    high: Optional[float],
+    currency: Optional[str],
+    period: Optional[str]
+) -> Dict[str, Any]:
+    """Compensation JSON with annualized `min`/`max` for recurring periods"""
+    if low is not None and low <= 0:
+        low = None
+    if high is not None and high <= 0:
+        high = None
+    has_amount = low is not None or high is not None
+    return {
+        "type": "paid" if has_amount else "unknown",
+        "details": details,
+        "min": annualize(low, period) if period in RECURRING_PERIODS else low,
+        "max": annualize(high, period) if period in RECURRING_PERIODS else high,
+        "currency": currency if has_amount else None,
+        "period": period if has_amount else None,
+    }
+
+
+def parse_compensation_text(text: Optional[str], infer_period: bool = True) -> Optional[Dict[str, Any]]:
+    """Parse free-form compensation text; None when there is nothing to parse"""
+    if not text or not str(text).strip():
+        return None
+    text = str(text)
+
+    if _UNPAID_RE.search(text):
+        return {"type": "unpaid", "details": text, "min": None, "max": None, "currency": None, "period": None}
+
+    low, high = _amounts(text)
+    period = detect_period(text)
+    if period is None and infer_period:
+        period = _infer_period(low, high)
+    parsed = structured_compensation(text, low, high, detect_currency(text), period)
+
+    if parsed["type"] == "unknown" and _PAID_RE.search(text):
+        parsed["type"] = "paid"
+    return parsed
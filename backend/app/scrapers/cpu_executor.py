@@ -0,0 +1,138 @@
+from typing import Dict, Any, Optional, Callable, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import logging
+import multiprocessing
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_call(fn: Callable, args: Tuple) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+class _TaskStats:
+
+    def __init__(self):
+        self.offloaded = 0
+        self.inline = 0
+        self.run_seconds = 0.0
+        self.max_run_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def record(self, run_seconds: float, wait_seconds: float, offloaded: bool):
+        if offloaded:
+            self.offloaded += 1
+        else:
+            self.inline += 1
+        self.run_seconds += run_seconds
+        self.max_run_seconds = max(self.max_run_seconds, run_seconds)
+        self.wait_seconds += wait_seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        calls = self.offloaded + self.inline
+        return {
+            "offloaded": self.offloaded,
+            "inline": self.inline,
+            "avg_ms": round(self.run_seconds * 1000 / calls, 2) if calls else 0.0,
+            "max_ms": round(self.max_run_seconds * 1000, 2),
+            "queue_wait_ms": round(self.wait_seconds * 1000, 2),
+        }
+
+
+class CPUExecutor:
+    """
+    Process pool for the CPU-bound parts of a crawl (structured-data parsing,
+    feed/JSON decoding, normalization) so large pages never block the loop.
+
+    Payloads under `scraping_cpu_inline_threshold` bytes run inline, where
+    pickling would cost more than the work. At most `scraping_cpu_max_pending`
+    tasks are queued or running at once; further callers wait for a slot.
+    Functions must be module-level so they can be pickled.
+    """
+
+    def __init__(self):
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._stats: Dict[str, _TaskStats] = {}
+        self._pool_restarts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.scraping_cpu_workers > 0
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._slots = asyncio.Semaphore(settings.scraping_cpu_max_pending)
+            self._loop = loop
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn, not fork: the parent has live threads (aiohttp, to_thread)
+            self._pool = ProcessPoolExecutor(
+                max_workers=settings.scraping_cpu_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def run(self, name: str, fn: Callable, *args, size: int = 0) -> Any:
+        """Run fn(*args), in the pool when the payload is large enough"""
+        stats = self._stats.setdefault(name, _TaskStats())
+
+        if not self.enabled or size < settings.scraping_cpu_inline_threshold:
+            result, run_seconds = _timed_call(fn, args)
+            stats.record(run_seconds, 0.0, offloaded=False)
+            return result
+
+        self._bind_loop()
+        queued_at = time.perf_counter()
+        async with self._slots:
+            wait_seconds = time.perf_counter() - queued_at
+            try:
+                result, run_seconds = await self._loop.run_in_executor(
+                    self._get_pool(), _timed_call, fn, args
+                )
+            except BrokenProcessPool:
+                logger.warning(f"CPU pool broke while running {name}; restarting it and running inline")
+                self._pool = None
+                self._pool_restarts += 1
+                result, run_seconds = _timed_call(fn, args)
+
+        stats.record(run_seconds, wait_seconds, offloaded=True)
+        logger.debug(f"cpu task {name}: {run_seconds * 1000:.1f} ms run, {wait_seconds * 1000:.1f} ms queued ({size} bytes)")
+        return result
+
+    async def warm_up(self):
+        """Start the worker processes now rather than on the first large page"""
+        if not self.enabled:
+            return
+        self._bind_loop()
+        pool = self._get_pool()
+        await asyncio.gather(*[
+            self._loop.run_in_executor(pool, _timed_call, time.sleep, (0,))
+            for _ in range(settings.scraping_cpu_workers)
+        ])
+
+    async def close(self):
+        if self._pool is not None:
+            logger.info(f"Closing CPU pool: {self.stats()}")
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": settings.scraping_cpu_workers if self.enabled else 0,
+            "pool_restarts": self._pool_restarts,
+            "tasks": {name: stats.as_dict() for name, stats in self._stats.items()},
+        }
+
+
+cpu_executor = CPUExecutor()
@@ -1,24 +1,52 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from aiolimiter import AsyncLimiter
-from urllib.robotparser import RobotFileParser
-from urllib.parse import urlparse
+from typing import List, Dict, Any, Optional, AsyncIterator, Callable, Tuple
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from functools import partial
+from datetime import datetime
+import asyncio
+import json
 import logging
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 from pydantic import BaseModel, Field
 from app.config import settings
+from app.scrapers.http_client import http_client
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.robots import robots_cache
+from app.scrapers.http_cache import http_validators, hash_body, CachedValidator
+from app.scrapers.extraction_cache import extraction_cache, extraction_cache_key
+from app.scrapers.cursors import cursor_store, SourceCursor
+from app.scrapers.checkpoints import Checkpoint, ScrapeBatch, checkpoints_of, run_checkpoints
+from app.scrapers.rate_limiter import rate_limiters, parse_retry_after, AdaptiveRateLimiter
+from app.scrapers.errors import (
+    RateLimitedError, HTTPStatusError, RobotsBlockedError, CrawlFailedError, is_retryable
+)
+from app.scrapers.cassette import cassette, FetchedResponse, PageSnapshot
+from app.scrapers.structured import extract_structured_opportunities, parse_feed
+from app.scrapers.normalize import normalize_opportunity, normalize_opportunities, parse_compensation
+from app.scrapers.cpu_executor import cpu_executor
+from app.scrapers.pruning import prune_listing_content
 
 try:
-    from crawl4ai import AsyncWebCrawler
+    from crawl4ai import CrawlerRunConfig, CacheMode
     from crawl4ai.extraction_strategy import LLMExtractionStrategy
+    from crawl4ai.chunking_strategy import RegexChunking
     CRAWL4AI_AVAILABLE = True
 except ImportError:
     CRAWL4AI_AVAILABLE = False
-    AsyncWebCrawler = None
+    CrawlerRunConfig = None
+    CacheMode = None
     LLMExtractionStrategy = None
+    RegexChunking = None
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_MODEL = "openai/gpt-4o-mini"
+# Bump whenever OpportunitySchema or the default instruction changes,
+# so memoized extractions from the old shape are not reused
+EXTRACTION_SCHEMA_VERSION = "1"
+# Dropped from the rendered DOM before markdown generation; never part of a listing
+EXCLUDED_TAGS = ["nav", "footer", "aside", "form", "noscript", "iframe", "svg"]
+
 
 class OpportunitySchema(BaseModel):
     """Schema for extracting opportunity data using LLM"""
@@ -33,35 +61,55 @@ class OpportunitySchema(BaseModel):
 
 class Crawl4AIBaseScraper(ABC):
     
+    # Filter keys that change what scrape() fetches; identical values share one crawl
+    query_filters: Tuple[str, ...] = ()
+    # CSS selector for the listing region; the whole page is used when it matches nothing
+    content_selector: Optional[str] = None
+    # Source-specific ads/promos to drop from the DOM, e.g. ".sponsored, #promo-banner"
+    excluded_selector: Optional[str] = None
+    
     def __init__(self, source_name: str, base_url: str, rate_limit: int = None):
         self.source_name = source_name
         self.base_url = base_url
         self.rate_limit = rate_limit or settings.scraping_rate_limit
-        self.limiter = AsyncLimiter(self.rate_limit, 1)
         self.user_agent = settings.scraping_user_agent
-        self.robots_parser: Optional[RobotFileParser] = None
         
         if not CRAWL4AI_AVAILABLE:
             logger.warning("crawl4ai not available, falling back to basic scraping")
     
     async def _check_robots_txt(self, url: str) -> bool:
+        if cassette.replaying:
+            return True
         try:
-            parsed = urlparse(url)
-            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-            
-            if not self.robots_parser:
-                self.robots_parser = RobotFileParser()
-                self.robots_parser.set_url(robots_url)
-                self.robots_parser.read()
-            
-            return self.robots_parser.can_fetch(self.user_agent, url)
+            return await robots_cache.can_fetch(url, self.user_agent)
         except Exception as e:
             logger.warning(f"Error checking robots.txt for {url}: {e}")
             return True
     
+    def _limiter(self, url: str) -> AdaptiveRateLimiter:
+        """Process-wide limiter for the URL's host, seeded with this scraper's rate"""
+        return rate_limiters.for_url(url, self.rate_limit)
+    
+    def _record_throttling(
+        self,
+        limiter: AdaptiveRateLimiter,
+        url: str,
+        status: Optional[int],
+        headers: Optional[Any]
+    ):
+        """Feed the response status back into the host limiter; raise if throttled"""
+        retry_after = parse_retry_after((headers or {}).get("Retry-After") or (headers or {}).get("retry-after"))
+        if status == 429 or (status == 503 and retry_after is not None):
+            limiter.on_throttle(retry_after)
+            raise RateLimitedError(url, status, retry_after)
+        if status is not None and status < 400:
+            limiter.on_success()
+    
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(is_retryable),
+        reraise=True
     )
     async def _crawl_with_llm(
         self, 
@@ -71,80 +119,350 @@ class Crawl4AIBaseScraper(ABC):
         """
         Crawl and extract structured data using LLM.
         More resilient to website structure changes.
+        schema.org JSON-LD/microdata on the page is used instead when present.
+        Returns an empty list when the page has not changed since the last crawl.
+        The page's validators are a checkpoint of the returned batch, and
+        are never stored when some LLM chunks failed.
         """
         if not await self._check_robots_txt(url):
-            raise Exception(f"Blocked by robots.txt: {url}")
-        
-        async with self.limiter:
-            if CRAWL4AI_AVAILABLE and LLMExtractionStrategy:
-                default_instruction = f"""
-                Extract all opportunities (jobs, speaking events, conferences, or listings) from this page.
-                For each opportunity, extract:
-                - Title/position name
-                - Company/organizer name
-                - Description (brief summary)
-                - Location (or "Remote")
-                - Direct URL/link
-                - Any relevant tags or categories
-                - Compensation information if available
-                
-                Only extract actual opportunities, ignore navigation, ads, or unrelated content.
-                """
-                
-                extraction_strategy = LLMExtractionStrategy(
-                    provider="openai/gpt-4o-mini",
-                    api_token=settings.openai_api_key,
-                    schema=OpportunitySchema.model_json_schema(),
-                    extraction_type="schema",
-                    instruction=instruction or default_instruction,
-                    chunk_token_threshold=4000,
-                    overlap_rate=0.1
-                )
-                
-                async with AsyncWebCrawler(verbose=False) as crawler:
-                    result = await crawler.arun(
-                        url=url,
-                        bypass_cache=True,
-                        user_agent=self.user_agent,
-                        extraction_strategy=extraction_strategy,
-                        word_count_threshold=10
-                    )
-                    
-                    if hasattr(result, 'extracted_content') and result.extracted_content:
-                        import json
-                        try:
-                            extracted = json.loads(result.extracted_content)
-                            if isinstance(extracted, list):
-                                return extracted
-                            elif isinstance(extracted, dict):
-                                return [extracted]
-                        except json.JSONDecodeError:
-                            logger.error(f"Failed to parse LLM extraction: {result.extracted_content}")
-                    
-                    return []
-            else:
-                logger.warning(f"LLM extraction not available for {url}, returning empty list")
-                return []
+            raise RobotsBlockedError(url)
+        
+        if not (CRAWL4AI_AVAILABLE and LLMExtractionStrategy) and not cassette.replaying:
+            logger.warning(f"LLM extraction not available for {url}, returning empty list")
+            return []
+        
+        validator = await http_validators.get(url) if settings.scraping_conditional_get else None
+        if (
+            validator
+            and validator.conditional_headers
+            and not cassette.replaying
+            and await self._is_not_modified(url, validator)
+        ):
+            logger.info(f"{self.source_name}: {url} not modified, skipping crawl")
+            return []
+        
+        async with self._limiter(url) as limiter:
+            result = await self._fetch_page(url)
+            self._record_throttling(limiter, url, result.status_code, result.response_headers)
+        
+        if not result.success:
+            raise CrawlFailedError(url, result.error_message)
+        
+        body_hash = hash_body(result.html or "")
+        if settings.scraping_conditional_get and http_validators.is_unchanged(validator, body_hash):
+            logger.info(f"{self.source_name}: {url} unchanged since last crawl, skipping extraction")
+            return []
+        
+        extracted = await cpu_executor.run(
+            "structured", extract_structured_opportunities, result.html, url, size=len(result.html or "")
+        )
+        complete = True
+        if extracted:
+            logger.info(f"{self.source_name}: {len(extracted)} structured listings at {url}, skipping LLM")
+        else:
+            markdown = await self._prune_for_extraction(url, result)
+            extracted, complete = await self._extract_with_llm(url, markdown, instruction)
+        
+        if not (settings.scraping_conditional_get and complete):
+            # A partial extraction must be retried next time, not skipped as unchanged
+            return ScrapeBatch(extracted)
+        headers = {k.lower(): v for k, v in (result.response_headers or {}).items()}
+        return ScrapeBatch(extracted, [Checkpoint(
+            http_validators.store, url, self.source_name, headers.get("etag"), headers.get("last-modified"), body_hash
+        )])
+    
+    async def _fetch_page(self, url: str) -> PageSnapshot:
+        """Render a page in a pooled browser without running extraction"""
+        async def render() -> PageSnapshot:
+            run_config = CrawlerRunConfig(
+                cache_mode=CacheMode.BYPASS,
+                user_agent=self.user_agent,
+                word_count_threshold=10,
+                excluded_tags=EXCLUDED_TAGS,
+                excluded_selector=self.excluded_selector,
+                exclude_social_media_links=True
+            )
+            async with browser_pool.acquire() as crawler:
+                result = await crawler.arun(url=url, config=run_config)
+            return PageSnapshot.from_crawl_result(url, result)
+        
+        return await cassette.fetch_page(self.source_name, url, render)
+    
+    async def _prune_for_extraction(self, url: str, page: PageSnapshot) -> str:
+        """Listing-region markdown, so the LLM only sees (and is billed for) the listings"""
+        markdown, stats = await cpu_executor.run(
+            "prune",
+            prune_listing_content,
+            page.html,
+            page.markdown,
+            url,
+            self.content_selector,
+            size=len(page.html or "")
+        )
+        before, after = stats["tokens_before"], stats["tokens_after"]
+        logger.info(
+            f"{self.source_name}: pruned {url} from {before} to {after} tokens"
+            f" ({100 * (before - after) // max(before, 1)}% cut{', scoped' if stats['scoped'] else ''})"
+        )
+        return markdown
+    
+    async def _http_get(self, url: str, headers: Dict[str, str]) -> FetchedResponse:
+        """Plain GET through the shared session, recorded/replayed by the cassette"""
+        async def fetch() -> FetchedResponse:
+            session = await http_client.get_session()
+            async with session.get(url, headers=headers) as response:
+                body = await response.read() if response.status < 400 else b""
+                return FetchedResponse(url, response.status, dict(response.headers), body)
+        
+        return await cassette.http_get(self.source_name, url, fetch)
+    
+    async def _extract_with_llm(
+        self,
+        url: str,
+        markdown: str,
+        instruction: str = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Listings on the page, and False when some chunks failed and are missing from them"""
+        default_instruction = f"""
+        Extract all opportunities (jobs, speaking events, conferences, or listings) from this page.
+        For each opportunity, extract:
+        - Title/position name
+        - Company/organizer name
+        - Description (brief summary)
+        - Location (or "Remote")
+        - Direct URL/link
+        - Any relevant tags or categories
+        - Compensation information if available
+        
+        Only extract actual opportunities, ignore navigation, ads, or unrelated content.
+        """
+        
+        instruction = instruction or default_instruction
+        cache_key = extraction_cache_key(
+            markdown, instruction, f"{EXTRACTION_SCHEMA_VERSION}:{EXTRACTION_MODEL}"
+        )
+        if settings.scraping_extraction_cache_enabled:
+            cached = await extraction_cache.get(self.source_name, cache_key)
+            if cached is not None:
+                logger.info(f"{self.source_name}: extraction cache hit for {url}")
+                return cached, True
+        
+        extraction_strategy = LLMExtractionStrategy(
+            provider=EXTRACTION_MODEL,
+            api_token=settings.openai_api_key,
+            schema=OpportunitySchema.model_json_schema(),
+            extraction_type="schema",
+            instruction=instruction,
+            chunk_token_threshold=4000,
+            overlap_rate=0.1
+        )
+        
+        # LLMExtractionStrategy.run is blocking (threaded LLM calls)
+        sections = RegexChunking().chunk(markdown)
+        extracted = await asyncio.to_thread(extraction_strategy.run, url, sections)
+        
+        failed_chunks = [item for item in extracted if isinstance(item, dict) and item.get("error")]
+        opportunities = [
+            item for item in extracted
+            if isinstance(item, dict) and not item.get("error")
+        ]
+        
+        # Never memoize a partially failed extraction
+        if failed_chunks:
+            logger.warning(f"{self.source_name}: {len(failed_chunks)} extraction chunks failed for {url}")
+        elif settings.scraping_extraction_cache_enabled:
+            await extraction_cache.set(self.source_name, cache_key, opportunities)
+        
+        return opportunities, not failed_chunks
+    
+    async def _is_not_modified(self, url: str, validator: CachedValidator) -> bool:
+        """Cheap conditional GET so unchanged pages never reach the browser"""
+        try:
+            headers = {"User-Agent": self.user_agent, **validator.conditional_headers}
+            async with self._limiter(url) as limiter:
+                response = await self._http_get(url, headers)
+                self._record_throttling(limiter, url, response.status, response.headers)
+                if response.status == 304:
+                    http_validators.record_not_modified()
+                    return True
+        except RateLimitedError:
+            raise
+        except Exception as e:
+            logger.debug(f"Conditional request failed for {url}: {e}")
+        return False
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(is_retryable),
+        reraise=True
     )
-    async def _crawl_json(self, url: str) -> Dict:
-        """For API endpoints that return JSON directly"""
+    async def _crawl_json(self, url: str) -> Optional[Any]:
+        """
+        For API endpoints that return JSON directly.
+        Returns None when the payload has not changed since the last fetch.
+        A list payload comes back as a ScrapeBatch whose checkpoint stores
+        the validators; for other payloads they are not kept.
+        """
+        return await self._fetch_conditional(url, "application/json", "json", json.loads)
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(is_retryable),
+        reraise=True
+    )
+    async def _crawl_feed(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        RSS/Atom feed items in OpportunitySchema shape, as a ScrapeBatch
+        whose checkpoint stores the feed's validators.
+        Returns None when the feed has not changed since the last fetch.
+        """
+        return await self._fetch_conditional(
+            url,
+            "application/rss+xml, application/atom+xml, application/xml;q=0.9",
+            "feed",
+            partial(parse_feed, feed_url=url)
+        )
+    
+    async def _fetch_conditional(
+        self,
+        url: str,
+        accept: str,
+        parse_task: str,
+        parse: Callable[[bytes], Any]
+    ) -> Optional[Any]:
+        """`parse` must be picklable: large bodies are decoded in the CPU pool"""
         if not await self._check_robots_txt(url):
-            raise Exception(f"Blocked by robots.txt: {url}")
-        
-        async with self.limiter:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": self.user_agent,
-                    "Accept": "application/json"
-                }
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            raise RobotsBlockedError(url)
+        
+        validator = await http_validators.get(url) if settings.scraping_conditional_get else None
+        
+        async with self._limiter(url) as limiter:
+            headers = {
+                "User-Agent": self.user_agent,
+                "Accept": accept
+            }
+            if validator:
+                headers.update(validator.conditional_headers)
+            
+            response = await self._http_get(url, headers)
+            self._record_throttling(limiter, url, response.status, response.headers)
+        
+        if response.status == 304:
+            http_validators.record_not_modified()
+            logger.info(f"{self.source_name}: {url} not modified")
+            return None
+        if response.status >= 400:
+            raise HTTPStatusError(url, response.status)
+        
+        body = response.body
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        
+        body_hash = hash_body(body)
+        if settings.scraping_conditional_get and http_validators.is_unchanged(validator, body_hash):
+            logger.info(f"{self.source_name}: {url} unchanged since last fetch")
+            return None
+        
+        data = await cpu_executor.run(parse_task, parse, body, size=len(body))
+        
+        if settings.scraping_conditional_get and isinstance(data, list):
+            return ScrapeBatch(data, [
+                Checkpoint(http_validators.store, url, self.source_name, etag, last_modified, body_hash)
+            ])
+        return data
+    
+    async def _stream_new_listings(
+        self,
+        url: str,
+        instruction: str = None,
+        feed_url: str = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        LLM-crawl a listing page by page, yielding only entries not seen on
+        earlier runs. Follows `_page_url` pagination until a page contains
+        known listings, which is where the previous scrape stopped.
+        When `feed_url` is given its RSS/Atom items are used instead, and the
+        page crawl only runs if the feed cannot be fetched.
+        The cursor only advances past a batch when the consumer runs its
+        checkpoints, i.e. after the listings are stored.
+        """
+        cursor = await cursor_store.load(self.source_name, url)
+        
+        if feed_url:
+            try:
+                feed_listings = await self._crawl_feed(feed_url)
+            except Exception as e:
+                logger.warning(f"{self.source_name}: feed {feed_url} failed, crawling {url} instead: {e}")
+            else:
+                feed_listings = feed_listings or []
+                fresh = cursor.filter_new(feed_listings)[:settings.scraping_max_new_listings]
+                if fresh:
+                    yield self._with_checkpoints(fresh, feed_listings, cursor)
+                else:
+                    await run_checkpoints(checkpoints_of(feed_listings))
+                logger.info(f"{self.source_name}: {len(fresh)} new listings in {feed_url}")
+                return
+        
+        # Without a watermark there is nothing to page back to
+        max_pages = 1 if cursor.is_empty else settings.scraping_max_pages
+        
+        total = 0
+        for page in range(max_pages):
+            page_url = url if page == 0 else self._page_url(url, page)
+            if not page_url:
+                break
+            
+            raw_listings = await self._crawl_with_llm(page_url, instruction)
+            fresh = cursor.filter_new(raw_listings)[:settings.scraping_max_new_listings - total]
+            
+            if fresh:
+                total += len(fresh)
+                yield self._with_checkpoints(fresh, raw_listings, cursor)
+            else:
+                # Nothing to store, so nothing can be lost by remembering the page
+                await run_checkpoints(checkpoints_of(raw_listings))
+            
+            if not raw_listings or len(fresh) < len(raw_listings):
+                break
+            if total >= settings.scraping_max_new_listings:
+                break
+        
+        logger.info(f"{self.source_name}: {total} new listings at {url}")
+    
+    def _with_checkpoints(
+        self,
+        fresh: List[Dict[str, Any]],
+        fetched: List[Dict[str, Any]],
+        cursor: SourceCursor
+    ) -> ScrapeBatch:
+        """
+        `fresh` listings of the `fetched` page or feed, advancing the cursor
+        once stored. The fetch's validators come along only when every new
+        listing on it is in the batch; otherwise the rest would be skipped
+        as unchanged next time.
+        """
+        checkpoints = [Checkpoint(self._advance_cursor, cursor, [listing.get("url") for listing in fresh])]
+        if len(fresh) == len(cursor.filter_new(fetched)):
+            checkpoints += checkpoints_of(fetched)
+        return ScrapeBatch(fresh, checkpoints)
+    
+    async def _advance_cursor(self, cursor: SourceCursor, keys: List[str], posted_at: Optional[datetime] = None):
+        cursor.mark_seen(keys, posted_at)
+        await cursor_store.save(cursor)
+    
+    def _page_url(self, url: str, page: int) -> Optional[str]:
+        """URL of the zero-based `page` of a listing; None when the source is not paginated"""
+        return None
+    
+    @staticmethod
+    def _with_query_param(url: str, key: str, value: Any) -> str:
+        parsed = urlparse(url)
+        query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+        query[key] = str(value)
+        return urlunparse(parsed._replace(query=urlencode(query)))
     
     def _normalize_opportunity(
         self,
@@ -152,30 +470,27 @@ class Crawl4AIBaseScraper(ABC):
         opportunity_type: str
     ) -> Dict[str, Any]:
         """Normalize LLM-extracted data to our internal format"""
-        return {
-            "title": raw_data.get("title", ""),
-            "description": raw_data.get("description", ""),
-            "source_url": raw_data.get("url", ""),
-            "source_name": self.source_name,
-            "opportunity_type": opportunity_type,
-            "location": raw_data.get("location"),
-            "remote": "remote" in str(raw_data.get("location", "")).lower(),
-            "compensation": self._parse_compensation(raw_data.get("compensation_info")),
-            "tags": raw_data.get("tags", []),
-        }
-    
-    def _parse_compensation(self, compensation_info: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Parse compensation string into structured format"""
-        if not compensation_info:
-            return None
-        
-        comp_lower = compensation_info.lower()
-        if "paid" in comp_lower or "$" in compensation_info or "salary" in comp_lower:
-            return {"type": "paid", "details": compensation_info}
-        elif "unpaid" in comp_lower or "volunteer" in comp_lower:
-            return {"type": "unpaid", "details": compensation_info}
-        
-        return {"type": "unknown", "details": compensation_info}
+        return normalize_opportunity(raw_data, self.source_name, opportunity_type)
+    
+    async def _normalize_batch(
+        self,
+        raw_items: List[Dict[str, Any]],
+        opportunity_type: str
+    ) -> List[Dict[str, Any]]:
+        """Normalize a page of listings (off the event loop when it is large), dropping ones without a URL"""
+        size = sum(len(str(item.get("description") or "")) for item in raw_items)
+        # A plain list crosses the process boundary; the checkpoints stay with the batch
+        normalized = await cpu_executor.run(
+            "normalize", normalize_opportunities, list(raw_items), self.source_name, opportunity_type, size=size
+        )
+        return ScrapeBatch(normalized, checkpoints_of(raw_items))
+    
+    def _parse_compensation(
+        self,
+        compensation_info: Optional[str],
+        opportunity_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        return parse_compensation(compensation_info, opportunity_type)
     
     @abstractmethod
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -184,3 +499,23 @@ class Crawl4AIBaseScraper(ABC):
         Should call _crawl_with_llm() and normalize results.
         """
         pass
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield batches of normalized opportunities as pages are extracted.
+        Scrapers that can extract incrementally override this and implement
+        scrape() with _collect_stream(); the default yields scrape() once.
+        A batch may be a ScrapeBatch whose checkpoints the consumer runs
+        once it has stored the listings.
+        """
+        opportunities = await self.scrape(filters)
+        if opportunities:
+            yield opportunities
+    
+    async def _collect_stream(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Every batch in one list, carrying all their checkpoints for whoever stores it"""
+        opportunities = ScrapeBatch()
+        async for batch in self.scrape_stream(filters):
+            opportunities.extend(batch)
+            opportunities.checkpoints.extend(checkpoints_of(batch))
+        return opportunities
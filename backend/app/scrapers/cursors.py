@@ -0,0 +1,122 @@
+from typing import List, Dict, Any, Optional, Iterable
+from datetime import datetime, timezone
+import logging
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.scrape_cursor import ScrapeCursor
+
+logger = logging.getLogger(__name__)
+
+
+class SourceCursor:
+    """
+    Watermark for one (source, scope) pair: the most recent listing keys seen,
+    plus the newest posting date for feeds that are ordered newest-first.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        scope: str,
+        seen_keys: Optional[List[str]] = None,
+        last_seen_key: Optional[str] = None,
+        last_seen_at: Optional[datetime] = None
+    ):
+        self.source_name = source_name
+        self.scope = scope
+        self.seen_keys: List[str] = list(seen_keys or [])
+        self._seen = set(self.seen_keys)
+        self.last_seen_key = last_seen_key
+        self.last_seen_at = last_seen_at
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._seen and self.last_seen_at is None
+
+    def is_new(self, key: Optional[str], posted_at: Optional[datetime] = None) -> bool:
+        if not key or key in self._seen:
+            return False
+        if posted_at and self.last_seen_at and posted_at < self.last_seen_at:
+            return False
+        return True
+
+    def filter_new(self, items: Iterable[Dict[str, Any]], key_field: str = "url") -> List[Dict[str, Any]]:
+        return [item for item in items if self.is_new(item.get(key_field))]
+
+    def mark_seen(self, keys: Iterable[str], posted_at: Optional[datetime] = None):
+        fresh = [key for key in keys if key and key not in self._seen]
+        if fresh:
+            # Newest first, so the cap drops the oldest keys
+            self.seen_keys = fresh + self.seen_keys
+            self.seen_keys = self.seen_keys[:settings.scraping_cursor_max_keys]
+            self._seen = set(self.seen_keys)
+            self.last_seen_key = fresh[0]
+        if posted_at and (self.last_seen_at is None or posted_at > self.last_seen_at):
+            self.last_seen_at = posted_at
+
+
+class ScrapeCursorStore:
+
+    async def load(self, source_name: str, scope: str = "") -> SourceCursor:
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(ScrapeCursor).where(
+                        ScrapeCursor.source_name == source_name,
+                        ScrapeCursor.scope == scope
+                    )
+                )
+                row = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"Could not load scrape cursor for {source_name}: {e}")
+            row = None
+
+        if not row:
+            return SourceCursor(source_name, scope)
+
+        return SourceCursor(
+            source_name,
+            scope,
+            seen_keys=row.seen_keys,
+            last_seen_key=row.last_seen_key,
+            last_seen_at=row.last_seen_at
+        )
+
+    async def save(self, cursor: SourceCursor):
+        stmt = insert(ScrapeCursor).values(
+            source_name=cursor.source_name,
+            scope=cursor.scope,
+            seen_keys=cursor.seen_keys,
+            last_seen_key=cursor.last_seen_key,
+            last_seen_at=cursor.last_seen_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_scrape_cursor_source_scope",
+            set_={
+                "seen_keys": stmt.excluded.seen_keys,
+                "last_seen_key": stmt.excluded.last_seen_key,
+                "last_seen_at": stmt.excluded.last_seen_at,
+                "updated_at": func.now(),
+            }
+        )
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Could not save scrape cursor for {cursor.source_name}: {e}")
+
+
+def epoch_to_datetime(epoch: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+cursor_store = ScrapeCursorStore()
@@ -0,0 +1,59 @@
+from typing import Optional
+
+
+class ScraperError(Exception):
+    """Base class for errors raised by the scraping layer"""
+
+
+class RateLimitedError(ScraperError):
+    """The source throttled us (HTTP 429, or 503 with Retry-After)"""
+
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None):
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(f"Rate limited by {url} (HTTP {status}, retry after {retry_after}s)")
+
+
+class HTTPStatusError(ScraperError):
+    """The source answered with an error status"""
+
+    def __init__(self, url: str, status: int):
+        self.url = url
+        self.status = status
+        super().__init__(f"HTTP {status} for {url}")
+
+
+class RobotsBlockedError(ScraperError):
+    """robots.txt disallows the URL for our user agent"""
+
+    def __init__(self, url: str):
+        self.url = url
+        super().__init__(f"Blocked by robots.txt: {url}")
+
+
+class CrawlFailedError(ScraperError):
+    """The browser could not render the page"""
+
+    def __init__(self, url: str, reason: Optional[str] = None):
+        self.url = url
+        self.reason = reason
+        super().__init__(f"Failed to crawl {url}: {reason}")
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Whether retrying the same request could succeed.
+    Policy refusals, client errors and unparseable payloads are fatal;
+    throttling, server errors, timeouts and connection failures are not.
+    """
+    if isinstance(error, RateLimitedError):
+        return True
+    if isinstance(error, HTTPStatusError):
+        return error.status >= 500 or error.status in (408, 425)
+    if isinstance(error, ScraperError) and not isinstance(error, CrawlFailedError):
+        return False
+    if isinstance(error, (ValueError, SyntaxError)):
+        # json.JSONDecodeError and xml.etree ParseError
+        return False
+    return True
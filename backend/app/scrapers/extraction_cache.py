@@ -0,0 +1,154 @@
+from typing import List, Dict, Any, Optional
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
+import hashlib
+import logging
+import re
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.extraction_cache import ExtractionCacheEntry
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def extraction_cache_key(content: str, instruction: str, schema_version: str) -> str:
+    """Stable key for (cleaned page content, instruction, schema/model version)"""
+    digest = hashlib.sha256()
+    for part in (
+        _WHITESPACE.sub(" ", content or "").strip(),
+        _WHITESPACE.sub(" ", instruction or "").strip(),
+        schema_version,
+    ):
+        digest.update(part.encode("utf-8", errors="replace"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Memoizes LLM extraction output by content hash.
+    An in-process LRU sits in front of the `extraction_cache` table; `prune()`
+    drops rows past the TTL and caps the number of rows kept per source.
+    """
+
+    def __init__(self):
+        self._memory: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._hits: Dict[str, int] = defaultdict(int)
+        self._misses: Dict[str, int] = defaultdict(int)
+
+    def _remember(self, key: str, extracted: List[Dict[str, Any]]):
+        self._memory[key] = extracted
+        self._memory.move_to_end(key)
+        while len(self._memory) > settings.scraping_extraction_cache_memory_size:
+            self._memory.popitem(last=False)
+
+    async def get(self, source_name: str, key: str) -> Optional[List[Dict[str, Any]]]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self._hits[source_name] += 1
+            return self._memory[key]
+
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(ExtractionCacheEntry.extracted).where(ExtractionCacheEntry.cache_key == key)
+                )
+                extracted = result.scalar_one_or_none()
+
+                if extracted is not None:
+                    await db.execute(
+                        update(ExtractionCacheEntry)
+                        .where(ExtractionCacheEntry.cache_key == key)
+                        .values(
+                            hit_count=ExtractionCacheEntry.hit_count + 1,
+                            last_hit_at=func.now()
+                        )
+                    )
+                    await db.commit()
+        except Exception as e:
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            extracted = None
+
+        if extracted is None:
+            self._misses[source_name] += 1
+            return None
+
+        self._hits[source_name] += 1
+        self._remember(key, extracted)
+        return extracted
+
+    async def set(self, source_name: str, key: str, extracted: List[Dict[str, Any]]):
+        self._remember(key, extracted)
+
+        stmt = insert(ExtractionCacheEntry).values(
+            cache_key=key,
+            source_name=source_name,
+            extracted=extracted,
+            hit_count=0
+        ).on_conflict_do_nothing(index_elements=[ExtractionCacheEntry.cache_key])
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+
+    async def prune(self) -> int:
+        """Evict expired rows, then keep only the most recently used rows per source"""
+        cutoff = datetime.utcnow() - timedelta(days=settings.scraping_extraction_cache_ttl_days)
+
+        ranked = select(
+            ExtractionCacheEntry.id,
+            func.row_number().over(
+                partition_by=ExtractionCacheEntry.source_name,
+                order_by=ExtractionCacheEntry.last_hit_at.desc()
+            ).label("rank")
+        ).subquery()
+        overflow = select(ranked.c.id).where(
+            ranked.c.rank > settings.scraping_extraction_cache_max_per_source
+        )
+
+        try:
+            async with AsyncSessionLocal() as db:
+                expired = await db.execute(
+                    delete(ExtractionCacheEntry).where(ExtractionCacheEntry.last_hit_at < cutoff)
+                )
+                capped = await db.execute(
+                    delete(ExtractionCacheEntry).where(ExtractionCacheEntry.id.in_(overflow))
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Extraction cache prune failed: {e}")
+            return 0
+
+        removed = (expired.rowcount or 0) + (capped.rowcount or 0)
+        if removed:
+            self._memory.clear()
+            logger.info(f"Pruned {removed} extraction cache entries")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        sources = set(self._hits) | set(self._misses)
+        return {
+            "memory_entries": len(self._memory),
+            "sources": {
+                source: {
+                    "hits": self._hits[source],
+                    "misses": self._misses[source],
+                    "hit_rate": round(
+                        self._hits[source] / (self._hits[source] + self._misses[source]), 3
+                    ),
+                }
+                for source in sorted(sources)
+            },
+        }
+
+
+extraction_cache = ExtractionCache()
@@ -0,0 +1,113 @@
+from typing import Dict, Any, Optional
+import hashlib
+import logging
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.database import AsyncSessionLocal
+from app.models.http_validator import HttpValidator
+
+logger = logging.getLogger(__name__)
+
+
+def hash_body(body) -> str:
+    if isinstance(body, str):
+        body = body.encode("utf-8", errors="replace")
+    return hashlib.sha256(body).hexdigest()
+
+
+class CachedValidator:
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], body_hash: Optional[str]):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_hash = body_hash
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPValidatorCache:
+    """
+    Per-URL ETag / Last-Modified / body-hash store backing conditional fetches.
+    Entries are persisted in `http_validators` so a restarted worker still
+    short-circuits unchanged sources; lookups are memoized in-process.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Optional[CachedValidator]] = {}
+        self._counters = {"not_modified": 0, "unchanged": 0, "changed": 0}
+
+    async def get(self, url: str) -> Optional[CachedValidator]:
+        if url in self._entries:
+            return self._entries[url]
+
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(HttpValidator).where(HttpValidator.url == url)
+                )
+                row = result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"Could not load HTTP validators for {url}: {e}")
+            return None
+
+        entry = CachedValidator(row.etag, row.last_modified, row.body_hash) if row else None
+        self._entries[url] = entry
+        return entry
+
+    def is_unchanged(self, entry: Optional[CachedValidator], body_hash: str) -> bool:
+        unchanged = entry is not None and entry.body_hash == body_hash
+        self._counters["unchanged" if unchanged else "changed"] += 1
+        return unchanged
+
+    def record_not_modified(self):
+        self._counters["not_modified"] += 1
+
+    async def store(
+        self,
+        url: str,
+        source_name: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: str
+    ):
+        self._entries[url] = CachedValidator(etag, last_modified, body_hash)
+
+        values = {
+            "url": url,
+            "source_name": source_name,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_hash": body_hash,
+        }
+        stmt = insert(HttpValidator).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HttpValidator.url],
+            set_={
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+                "body_hash": stmt.excluded.body_hash,
+                "checked_at": func.now(),
+            }
+        )
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Could not persist HTTP validators for {url}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"urls": len(self._entries), **self._counters}
+
+
+http_validators = HTTPValidatorCache()
@@ -0,0 +1,114 @@
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+
+import aiohttp
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperHTTPClient:
+    """
+    Process-wide aiohttp session shared by all scrapers.
+    Keeps per-host keep-alive pools and a DNS cache warm between fetches,
+    so repeated scrapes and tenacity retries skip DNS/TCP/TLS setup.
+    """
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._counters = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        def count(key: str):
+            async def _handler(session, context, params):
+                self._counters[key] += 1
+            return _handler
+
+        trace_config.on_request_start.append(count("requests"))
+        trace_config.on_connection_create_end.append(count("connections_created"))
+        trace_config.on_connection_reuseconn.append(count("connections_reused"))
+        trace_config.on_dns_cache_hit.append(count("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(count("dns_cache_misses"))
+        return trace_config
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=settings.scraping_http_max_connections,
+            limit_per_host=settings.scraping_http_max_connections_per_host,
+            ttl_dns_cache=settings.scraping_http_dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=settings.scraping_http_keepalive_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.scraping_http_timeout),
+            headers={"User-Agent": settings.scraping_user_agent},
+            trace_configs=[self._build_trace_config()],
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use in the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._session is None or self._session.closed or self._loop is not loop:
+                if self._session is not None and not self._session.closed and self._loop is not loop:
+                    logger.warning("Discarding HTTP session bound to a different event loop")
+                self._session = self._create_session()
+                self._loop = loop
+                logger.info(
+                    f"Scraper HTTP pool opened (limit={settings.scraping_http_max_connections}, "
+                    f"per_host={settings.scraping_http_max_connections_per_host})"
+                )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            logger.info(f"Closing scraper HTTP pool: {self.stats()}")
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection-pool utilization and reuse counters"""
+        stats: Dict[str, Any] = dict(self._counters)
+        stats["limit"] = settings.scraping_http_max_connections
+        stats["limit_per_host"] = settings.scraping_http_max_connections_per_host
+        stats["open"] = self._session is not None and not self._session.closed
+
+        connector = self._session.connector if stats["open"] else None
+        if connector is not None:
+            # aiohttp does not expose pool occupancy publicly
+            acquired = getattr(connector, "_acquired", ())
+            idle = getattr(connector, "_conns", {})
+            stats["in_use"] = len(acquired)
+            stats["idle"] = sum(len(conns) for conns in idle.values())
+            stats["hosts"] = len(idle)
+        else:
+            stats["in_use"] = 0
+            stats["idle"] = 0
+            stats["hosts"] = 0
+
+        opened = stats["connections_created"] + stats["connections_reused"]
+        stats["reuse_ratio"] = round(stats["connections_reused"] / opened, 3) if opened else 0.0
+        return stats
+
+
+http_client = ScraperHTTPClient()
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator
 from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
 import logging
 
@@ -7,13 +7,22 @@ logger = logging.getLogger(__name__)
 
 class IndeedScraper(Crawl4AIBaseScraper):
     
+    query_filters = ("job_title", "location")
+    content_selector = "#mosaic-provider-jobcards"
+    
     def __init__(self):
         super().__init__(
             source_name="indeed",
             base_url="https://www.indeed.com"
         )
     
+    def _page_url(self, url: str, page: int) -> Optional[str]:
+        return self._with_query_param(url, "start", page * 10)
+    
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._collect_stream(filters)
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
         try:
             job_title = filters.get("job_title", "software developer")
             location = filters.get("location", "")
@@ -33,17 +42,16 @@ class IndeedScraper(Crawl4AIBaseScraper):
             Only extract actual job listings, ignore ads or promoted content markers.
             """
             
-            raw_opportunities = await self._crawl_with_llm(url, instruction)
-            
-            opportunities = []
-            for raw_opp in raw_opportunities:
-                normalized = self._normalize_opportunity(raw_opp, "job")
-                if normalized.get("source_url"):
-                    opportunities.append(normalized)
+            total = 0
+            async for raw_opportunities in self._stream_new_listings(url, instruction):
+                opportunities = await self._normalize_batch(raw_opportunities, "job")
+                
+                total += len(opportunities)
+                if opportunities:
+                    yield opportunities
             
-            logger.info(f"Scraped {len(opportunities)} opportunities from Indeed")
-            return opportunities
+            logger.info(f"Scraped {total} opportunities from Indeed")
             
         except Exception as e:
             logger.error(f"Error scraping Indeed: {e}")
-            return []
+            raise
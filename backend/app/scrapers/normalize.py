@@ -0,0 +1,73 @@
+"""
+Pure mapping from extracted listings to the internal opportunity shape.
+Kept free of scraper state so batches can run in the CPU process pool.
+"""
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.scrapers.compensation import parse_compensation_text, structured_compensation
+
+
+def parse_compensation(
+    compensation_info: Optional[str],
+    opportunity_type: Optional[str] = None,
+    amounts: Optional[Tuple[Any, Any]] = None,
+    currency: Optional[str] = None,
+    period: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Structured compensation: type, details, annualized min/max, currency, period.
+    `amounts` are numeric bounds the source already provides (e.g. RemoteOK);
+    they take precedence over parsing the text.
+    """
+    if amounts and any(amounts):
+        low, high = (_to_number(a) for a in amounts)
+        return structured_compensation(compensation_info, low, high, currency, period)
+    
+    parsed = parse_compensation_text(compensation_info, infer_period=opportunity_type == "job")
+    if parsed and opportunity_type == "event":
+        # Event listings carry ticket prices, which are not compensation
+        parsed.update({"type": "unknown", "min": None, "max": None, "currency": None, "period": None})
+    return parsed
+
+
+def _to_number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_opportunity(
+    raw_data: Dict[str, Any],
+    source_name: str,
+    opportunity_type: str
+) -> Dict[str, Any]:
+    """Normalize LLM-extracted data to our internal format"""
+    return {
+        "title": raw_data.get("title", ""),
+        "company": raw_data.get("company_or_organizer"),
+        "description": raw_data.get("description", ""),
+        "source_url": raw_data.get("url", ""),
+        "source_name": source_name,
+        "opportunity_type": opportunity_type,
+        "location": raw_data.get("location"),
+        "remote": "remote" in str(raw_data.get("location", "")).lower(),
+        "compensation": parse_compensation(
+            raw_data.get("compensation_info"),
+            opportunity_type,
+            amounts=(raw_data.get("salary_min"), raw_data.get("salary_max")),
+            currency=raw_data.get("salary_currency"),
+            period=raw_data.get("salary_period")
+        ),
+        "tags": raw_data.get("tags", []),
+    }
+
+
+def normalize_opportunities(
+    raw_items: List[Dict[str, Any]],
+    source_name: str,
+    opportunity_type: str
+) -> List[Dict[str, Any]]:
+    """Normalized listings that have a URL; the rest cannot be stored"""
+    normalized = (normalize_opportunity(raw, source_name, opportunity_type) for raw in raw_items)
+    return [opportunity for opportunity in normalized if opportunity.get("source_url")]
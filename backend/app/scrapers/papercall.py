@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator
 from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
 import logging
 
@@ -7,13 +7,21 @@ logger = logging.getLogger(__name__)
 
 class PapercallScraper(Crawl4AIBaseScraper):
     
+    content_selector = "main"
+    
     def __init__(self):
         super().__init__(
             source_name="papercall",
             base_url="https://www.papercall.io"
         )
     
+    def _page_url(self, url: str, page: int) -> Optional[str]:
+        return self._with_query_param(url, "page", page + 1)
+    
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._collect_stream(filters)
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
         try:
             url = f"{self.base_url}/events"
             
@@ -29,17 +37,16 @@ class PapercallScraper(Crawl4AIBaseScraper):
             Ignore past events or closed CFPs.
             """
             
-            raw_opportunities = await self._crawl_with_llm(url, instruction)
-            
-            opportunities = []
-            for raw_opp in raw_opportunities:
-                normalized = self._normalize_opportunity(raw_opp, "speaking")
-                if normalized.get("source_url"):
-                    opportunities.append(normalized)
+            total = 0
+            async for raw_opportunities in self._stream_new_listings(url, instruction):
+                opportunities = await self._normalize_batch(raw_opportunities, "speaking")
+                
+                total += len(opportunities)
+                if opportunities:
+                    yield opportunities
             
-            logger.info(f"Scraped {len(opportunities)} opportunities from Papercall")
-            return opportunities
+            logger.info(f"Scraped {total} opportunities from Papercall")
             
         except Exception as e:
             logger.error(f"Error scraping Papercall: {e}")
-            return []
+            raise
@@ -0,0 +1,163 @@
+"""
+Trim a crawled page down to its listing region before LLM extraction.
+
+Three stages, all pure so they can run in the CPU process pool:
+1. CSS scoping: if the scraper declares a `content_selector`, only the
+   matching elements are converted to markdown (falls back to the full page
+   when nothing matches, so a stale selector never empties a crawl).
+2. Boilerplate removal: cookie banners, copyright/legal lines, sign-in and
+   newsletter prompts, and images.
+3. Link density: blocks that are mostly short link labels (menus, tag
+   clouds, pagination, footers) are dropped; listing cards, whose links are
+   titles with surrounding text, are kept.
+"""
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+import re
+
+try:
+    from lxml import html as lxml_html
+    from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+    SCOPING_AVAILABLE = True
+except ImportError:
+    SCOPING_AVAILABLE = False
+    lxml_html = None
+    DefaultMarkdownGenerator = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+_LINK = re.compile(r"\[([^\]]*)\]\(([^)\s]*)(?:\s+\"[^\"]*\")?\)")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_BLANK_RUN = re.compile(r"\n{3,}")
+_BOILERPLATE = re.compile(
+    r"cookie|©|\(c\)\s*\d{4}|all rights reserved|privacy policy|terms of (?:service|use)"
+    r"|subscribe to (?:our|the) newsletter|sign (?:in|up)\b|log ?in\b|create an account"
+    r"|download (?:our|the) app|skip to (?:main )?content|back to top",
+    re.IGNORECASE
+)
+_WORD = re.compile(r"\w+")
+
+# A block is navigation when at least this share of its words are link text
+# and its links are short labels rather than listing titles
+MAX_LINK_DENSITY = 0.7
+MAX_NAV_LABEL_WORDS = 3
+# Boilerplate phrases only drop short blocks; long ones may be a listing that mentions them
+MAX_BOILERPLATE_WORDS = 40
+
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    # Loaded on first use: tiktoken fetches the BPE file, which fails offline
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        if tiktoken is not None:
+            try:
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                logger.debug(f"tiktoken encoding unavailable, estimating tokens from length: {e}")
+    return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // 4
+
+
+def scope_html_to_markdown(html: str, selector: str, base_url: str) -> Optional[str]:
+    """Markdown of the elements matching `selector`, or None when nothing matches"""
+    if not (SCOPING_AVAILABLE and html and selector):
+        return None
+    try:
+        document = lxml_html.fromstring(html)
+        elements = document.cssselect(selector)
+    except Exception as e:
+        logger.debug(f"Could not apply content selector {selector!r} to {base_url}: {e}")
+        return None
+    if not elements:
+        return None
+
+    scoped = "".join(lxml_html.tostring(element, encoding="unicode") for element in elements)
+    result = DefaultMarkdownGenerator().generate_markdown(scoped, base_url=base_url, citations=False)
+    return result.raw_markdown or None
+
+
+def _is_shallow(href: str) -> bool:
+    """Section links (/about, /pricing) rather than item links (/jobs/123-title)"""
+    parsed = urlparse(href)
+    segments = [segment for segment in parsed.path.split("/") if segment]
+    return len(segments) <= 1 and not re.search(r"\d", parsed.path + parsed.query)
+
+
+def _is_navigation(block: str) -> bool:
+    links = _LINK.findall(block)
+    if len(links) < 2:
+        return False
+    total_words = len(_WORD.findall(_LINK.sub(r"\1", block)))
+    link_words = [len(_WORD.findall(text)) for text, _ in links]
+    if not total_words:
+        return True
+    density = sum(link_words) / total_words
+    average_label = sum(link_words) / len(links)
+    shallow = sum(1 for _, href in links if _is_shallow(href))
+    return (
+        density >= MAX_LINK_DENSITY
+        and average_label <= MAX_NAV_LABEL_WORDS
+        and shallow * 2 >= len(links)
+    )
+
+
+def _is_boilerplate(block: str) -> bool:
+    if not _BOILERPLATE.search(block):
+        return False
+    return len(_WORD.findall(_LINK.sub(r"\1", block))) <= MAX_BOILERPLATE_WORDS
+
+
+def prune_markdown(markdown: str) -> str:
+    """Drop navigation, boilerplate and image-only blocks from page markdown"""
+    if not markdown:
+        return ""
+    markdown = _IMAGE.sub("", markdown)
+
+    kept = []
+    for block in re.split(r"\n\s*\n", markdown):
+        stripped = block.strip()
+        if not _WORD.search(stripped):
+            continue
+        if _is_navigation(stripped) or _is_boilerplate(stripped):
+            continue
+        kept.append(stripped)
+    return _BLANK_RUN.sub("\n\n", "\n\n".join(kept))
+
+
+def prune_listing_content(
+    html: str,
+    markdown: str,
+    url: str,
+    content_selector: Optional[str] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """Listing-region markdown for LLM extraction, plus before/after token counts"""
+    scoped = scope_html_to_markdown(html, content_selector, url) if content_selector else None
+    pruned = prune_markdown(scoped if scoped is not None else markdown)
+    if not pruned.strip():
+        # Never hand the LLM nothing when the heuristics were too aggressive
+        pruned = markdown or ""
+
+    return pruned, {
+        "tokens_before": estimate_tokens(markdown),
+        "tokens_after": estimate_tokens(pruned),
+        "scoped": scoped is not None,
+    }
@@ -0,0 +1,105 @@
+from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+import asyncio
+import logging
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD request pacing for a single host.
+    Each success adds `scraping_rate_increase` req/s up to the ceiling; a
+    throttle response multiplies the rate by `scraping_rate_decrease_factor`
+    and pauses the host until its Retry-After has passed.
+    """
+
+    def __init__(self, host: str, initial_rate: float):
+        self.host = host
+        self.min_rate = settings.scraping_rate_limit_min
+        self.max_rate = max(settings.scraping_rate_limit_max, initial_rate)
+        self.rate = min(max(initial_rate, self.min_rate), self.max_rate)
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self.successes = 0
+        self.throttles = 0
+
+    async def acquire(self):
+        # Slot bookkeeping has no await in it, so concurrent callers never race
+        now = time.monotonic()
+        start = max(now, self._next_slot, self._blocked_until)
+        self._next_slot = start + 1.0 / self.rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def __aenter__(self) -> "AdaptiveRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def on_success(self):
+        self.successes += 1
+        self.rate = min(self.max_rate, self.rate + settings.scraping_rate_increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None):
+        self.throttles += 1
+        self.rate = max(self.min_rate, self.rate * settings.scraping_rate_decrease_factor)
+        pause = retry_after if retry_after is not None else 1.0 / self.rate
+        self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+        logger.warning(f"Throttled by {self.host}: rate now {self.rate:.2f} req/s, pausing {pause:.1f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 3),
+            "min_rate": self.min_rate,
+            "max_rate": self.max_rate,
+            "successes": self.successes,
+            "throttles": self.throttles,
+            "paused_for": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+        }
+
+
+class HostRateLimiterRegistry:
+    """One AdaptiveRateLimiter per host, shared by every scraper in the process"""
+
+    def __init__(self):
+        self._limiters: Dict[str, AdaptiveRateLimiter] = {}
+
+    def for_url(self, url: str, initial_rate: Optional[float] = None) -> AdaptiveRateLimiter:
+        host = urlparse(url).netloc.lower()
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(host, initial_rate or settings.scraping_rate_limit)
+            self._limiters[host] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: limiter.stats() for host, limiter in self._limiters.items()}
+
+
+rate_limiters = HostRateLimiterRegistry()
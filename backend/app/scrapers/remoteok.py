@@ -1,5 +1,8 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
+from app.scrapers.cursors import cursor_store, epoch_to_datetime
+from app.scrapers.checkpoints import Checkpoint, ScrapeBatch, checkpoints_of, run_checkpoints
+from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,21 +17,65 @@ class RemoteOKScraper(Crawl4AIBaseScraper):
         )
     
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._collect_stream(filters)
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
         try:
             url = f"{self.base_url}/api"
             
             data = await self._crawl_json(url)
             
+            if data is None:
+                logger.info("RemoteOK feed unchanged since last scrape")
+                return
+            
             if not isinstance(data, list):
-                return []
+                return
+            
+            cursor = await cursor_store.load(self.source_name, url)
+            batch = []
+            batch_keys = []
+            total = 0
+            newest_posted_at = None
+            # Yielded batches not stored yet; the watermark and validators wait for all of them
+            unstored = set()
+            finished = False
+            
+            async def complete():
+                if newest_posted_at:
+                    await self._advance_cursor(cursor, [], newest_posted_at)
+                await run_checkpoints(checkpoints_of(data))
+            
+            completed = Checkpoint(complete)
             
-            opportunities = []
+            async def advance(marker: object, keys: List[str]):
+                unstored.discard(marker)
+                await self._advance_cursor(cursor, keys)
+                if finished and not unstored:
+                    await completed()
             
-            for job in data[1:21]:
+            def checkpointed(items: List[Dict[str, Any]], keys: List[str]) -> ScrapeBatch:
+                marker = object()
+                unstored.add(marker)
+                return ScrapeBatch(items, [Checkpoint(advance, marker, keys)])
+            
+            # data[0] is the API legal notice; jobs follow newest first
+            for job in data[1:]:
                 try:
                     if not isinstance(job, dict):
                         continue
                     
+                    job_key = str(job.get('id') or job.get('url') or '')
+                    posted_at = epoch_to_datetime(job.get('epoch'))
+                    if not cursor.is_new(job_key, posted_at):
+                        break
+                    if total >= settings.scraping_max_new_listings:
+                        break
+                    
+                    batch_keys.append(job_key)
+                    if posted_at and (newest_posted_at is None or posted_at > newest_posted_at):
+                        newest_posted_at = posted_at
+                    
                     title = job.get('position', 'Unknown Position')
                     company = job.get('company', 'Unknown Company')
                     description = job.get('description', '')
@@ -39,37 +86,54 @@ class RemoteOKScraper(Crawl4AIBaseScraper):
                     
                     tags = job.get('tags', [])
                     
-                    salary_min = job.get('salary_min')
-                    salary_max = job.get('salary_max')
-                    compensation = {}
-                    if salary_min or salary_max:
-                        compensation = {
-                            "min": salary_min,
-                            "max": salary_max,
-                            "currency": "USD"
-                        }
+                    salary_min = job.get('salary_min') or None
+                    salary_max = job.get('salary_max') or None
+                    if salary_min and salary_max:
+                        compensation_info = f"${salary_min}-${salary_max}"
+                    elif salary_min or salary_max:
+                        compensation_info = f"${salary_min or salary_max}"
+                    else:
+                        compensation_info = None
                     
                     opportunity = self._normalize_opportunity(
                         {
                             "title": f"{title} at {company}",
+                            "company_or_organizer": company,
                             "description": description,
                             "url": job_url,
                             "location": "Remote",
                             "tags": tags,
-                            "compensation_info": f"${salary_min}-${salary_max}" if salary_min else None
+                            "compensation_info": compensation_info,
+                            # The API's salaries are annual USD figures
+                            "salary_min": salary_min,
+                            "salary_max": salary_max,
+                            "salary_currency": "USD",
+                            "salary_period": "year"
                         },
                         opportunity_type="job"
                     )
                     
-                    opportunities.append(opportunity)
+                    batch.append(opportunity)
+                    total += 1
                     
                 except Exception as e:
                     logger.warning(f"Error parsing job: {e}")
                     continue
+                
+                if len(batch) >= settings.scraping_stream_batch_size:
+                    yield checkpointed(batch, batch_keys)
+                    batch, batch_keys = [], []
+            
+            if batch:
+                yield checkpointed(batch, batch_keys)
+            
+            finished = True
+            if not unstored:
+                # Every batch was stored before the stream ended, or there were none
+                await completed()
             
-            logger.info(f"Scraped {len(opportunities)} opportunities from RemoteOK")
-            return opportunities
+            logger.info(f"Scraped {total} opportunities from RemoteOK")
             
         except Exception as e:
             logger.error(f"Error scraping RemoteOK: {e}")
-            return []
+            raise
@@ -0,0 +1,105 @@
+from typing import Dict, Any, Optional
+from urllib.robotparser import RobotFileParser
+from urllib.parse import urlparse
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.scrapers.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+
+class _RobotsEntry:
+
+    def __init__(self, parser: RobotFileParser, expires_at: float, negative: bool = False):
+        self.parser = parser
+        self.expires_at = expires_at
+        self.negative = negative
+
+
+class RobotsCache:
+    """
+    Host-keyed robots.txt cache shared by all scrapers.
+
+    Fetches go through the shared aiohttp pool, concurrent lookups for the same
+    host share one fetch, and failed fetches are cached for a shorter TTL so an
+    unreachable host is not retried on every request.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _RobotsEntry] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def can_fetch(self, url: str, user_agent: str) -> bool:
+        parsed = urlparse(url)
+        host = f"{parsed.scheme}://{parsed.netloc}"
+
+        entry = self._entries.get(host)
+        if entry is None or entry.expires_at <= time.monotonic():
+            self._misses += 1
+            entry = await self._load(host)
+        else:
+            self._hits += 1
+
+        return entry.parser.can_fetch(user_agent, url)
+
+    async def _load(self, host: str) -> _RobotsEntry:
+        task = self._inflight.get(host)
+        if task is None:
+            task = asyncio.create_task(self._fetch(host))
+            self._inflight[host] = task
+            task.add_done_callback(lambda _: self._inflight.pop(host, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, host: str) -> _RobotsEntry:
+        robots_url = f"{host}/robots.txt"
+        parser = RobotFileParser(robots_url)
+
+        try:
+            session = await http_client.get_session()
+            async with session.get(robots_url, allow_redirects=True) as response:
+                if response.status in (401, 403):
+                    # Same interpretation as RobotFileParser.read()
+                    parser.disallow_all = True
+                    return self._store(host, parser, negative=True)
+                if response.status >= 400:
+                    parser.allow_all = True
+                    return self._store(host, parser, negative=response.status >= 500)
+
+                body = await response.text(errors="replace")
+                parser.parse(body.splitlines())
+                parser.modified()
+                return self._store(host, parser)
+
+        except Exception as e:
+            logger.warning(f"Error fetching robots.txt for {host}: {e}")
+            parser.allow_all = True
+            return self._store(host, parser, negative=True)
+
+    def _store(self, host: str, parser: RobotFileParser, negative: bool = False) -> _RobotsEntry:
+        ttl = settings.scraping_robots_negative_ttl if negative else settings.scraping_robots_ttl
+        entry = _RobotsEntry(parser, time.monotonic() + ttl, negative=negative)
+        self._entries[host] = entry
+        return entry
+
+    def invalidate(self, host: Optional[str] = None):
+        if host is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(host, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hosts": len(self._entries),
+            "negative": sum(1 for e in self._entries.values() if e.negative),
+            "hits": self._hits,
+            "misses": self._misses,
+            "inflight": len(self._inflight),
+        }
+
+
+robots_cache = RobotsCache()
@@ -0,0 +1,370 @@
+"""
+Deterministic extraction of schema.org JobPosting / Event data (JSON-LD and
+microdata) and RSS/Atom feed items.
+
+Every extractor returns dicts shaped like OpportunitySchema (title,
+company_or_organizer, description, location, url, tags, compensation_info)
+so results feed straight into `_normalize_opportunity`.
+"""
+from typing import List, Dict, Any, Optional
+from html import unescape
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+import json
+import logging
+import re
+import xml.etree.ElementTree as ET
+
+logger = logging.getLogger(__name__)
+
+JOB_TYPES = {"JobPosting"}
+EVENT_TYPES = {
+    "Event", "BusinessEvent", "EducationEvent", "Hackathon", "SocialEvent",
+    "ExhibitionEvent", "CourseInstance", "Festival",
+}
+OPPORTUNITY_TYPES = JOB_TYPES | EVENT_TYPES
+
+_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_MAX_DESCRIPTION = 2000
+
+
+def _clean_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        value = " ".join(str(v) for v in value if v)
+    text = _WHITESPACE.sub(" ", _TAG.sub(" ", unescape(str(value)))).strip()
+    return text[:_MAX_DESCRIPTION] or None
+
+
+def _first(value: Any) -> Any:
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _name_of(value: Any) -> Optional[str]:
+    value = _first(value)
+    if isinstance(value, dict):
+        return _clean_text(value.get("name"))
+    return _clean_text(value)
+
+
+def _types_of(node: Dict[str, Any]) -> set:
+    types = node.get("@type") or node.get("type") or []
+    if isinstance(types, str):
+        types = [types]
+    # Microdata itemtypes are full URLs (https://schema.org/JobPosting)
+    return {str(t).rstrip("/").rsplit("/", 1)[-1] for t in types}
+
+
+def _format_address(address: Any) -> Optional[str]:
+    address = _first(address)
+    if isinstance(address, str):
+        return _clean_text(address)
+    if not isinstance(address, dict):
+        return None
+    country = address.get("addressCountry")
+    if isinstance(country, dict):
+        country = country.get("name")
+    parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+    return ", ".join(str(p) for p in parts if p) or None
+
+
+def _job_location(node: Dict[str, Any]) -> Optional[str]:
+    if str(node.get("jobLocationType", "")).upper() == "TELECOMMUTE":
+        return "Remote"
+    locations = node.get("jobLocation")
+    if not isinstance(locations, list):
+        locations = [locations] if locations else []
+    formatted = []
+    for location in locations:
+        if isinstance(location, dict):
+            formatted.append(_format_address(location.get("address")) or _clean_text(location.get("name")))
+        elif location:
+            formatted.append(_clean_text(location))
+    formatted = [f for f in formatted if f]
+    return "; ".join(formatted) or None
+
+
+def _event_location(node: Dict[str, Any]) -> Optional[str]:
+    mode = str(node.get("eventAttendanceMode", ""))
+    location = _first(node.get("location"))
+    if "Online" in mode or (isinstance(location, dict) and "VirtualLocation" in _types_of(location)):
+        return "Online"
+    if isinstance(location, dict):
+        return _format_address(location.get("address")) or _clean_text(location.get("name"))
+    return _clean_text(location)
+
+
+def _salary(node: Dict[str, Any]) -> Optional[str]:
+    salary = _first(node.get("baseSalary") or node.get("estimatedSalary"))
+    if salary is None:
+        return None
+    if not isinstance(salary, dict):
+        return _clean_text(salary)
+
+    currency = salary.get("currency") or ""
+    value = salary.get("value", salary)
+    if not isinstance(value, dict):
+        return f"{currency} {value}".strip()
+
+    low = value.get("minValue", value.get("value"))
+    high = value.get("maxValue")
+    unit = value.get("unitText") or salary.get("unitText")
+    amount = f"{low}-{high}" if low is not None and high is not None else str(low if low is not None else high)
+    text = f"{currency} {amount}".strip()
+    return f"{text} per {str(unit).lower()}" if unit else text
+
+
+def _ticket_price(node: Dict[str, Any]) -> Optional[str]:
+    offer = _first(node.get("offers"))
+    if not isinstance(offer, dict):
+        return None
+    if node.get("isAccessibleForFree") is True:
+        return "Free"
+    price = offer.get("price", offer.get("lowPrice"))
+    if price in (None, ""):
+        return None
+    try:
+        if float(price) == 0:
+            return "Free"
+    except (TypeError, ValueError):
+        pass
+    return f"{offer.get('priceCurrency', '')} {price}".strip()
+
+
+def _tags(node: Dict[str, Any], fields: List[str]) -> List[str]:
+    tags = []
+    for field in fields:
+        value = node.get(field)
+        values = value if isinstance(value, list) else [value]
+        for v in values:
+            if isinstance(v, dict):
+                v = v.get("name")
+            if v:
+                tag = str(v).rsplit("/", 1)[-1]
+                if tag not in tags:
+                    tags.append(tag)
+    return tags
+
+
+def schema_node_to_opportunity(node: Dict[str, Any], page_url: str) -> Optional[Dict[str, Any]]:
+    types = _types_of(node)
+    title = _clean_text(node.get("title") or node.get("name"))
+    if not title or not (types & OPPORTUNITY_TYPES):
+        return None
+
+    url = _first(node.get("url")) or _first(node.get("sameAs"))
+    url = urljoin(page_url, str(url)) if url else page_url
+
+    if types & JOB_TYPES:
+        return {
+            "title": title,
+            "company_or_organizer": _name_of(node.get("hiringOrganization")),
+            "description": _clean_text(node.get("description")),
+            "location": _job_location(node),
+            "url": url,
+            "tags": _tags(node, ["employmentType", "industry", "occupationalCategory", "skills"]),
+            "compensation_info": _salary(node),
+        }
+
+    start_date = node.get("startDate")
+    description = _clean_text(node.get("description"))
+    if start_date:
+        description = f"{description} (starts {start_date})" if description else f"Starts {start_date}"
+    return {
+        "title": title,
+        "company_or_organizer": _name_of(node.get("organizer") or node.get("performer")),
+        "description": description,
+        "location": _event_location(node),
+        "url": url,
+        "tags": _tags(node, ["eventAttendanceMode", "keywords"]),
+        "compensation_info": _ticket_price(node),
+    }
+
+
+def _walk_json_ld(data: Any):
+    """Yield every dict node, descending into @graph and ItemList elements"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk_json_ld(item)
+    elif isinstance(data, dict):
+        yield data
+        for key in ("@graph", "itemListElement", "item", "mainEntity"):
+            if key in data:
+                yield from _walk_json_ld(data[key])
+
+
+class _StructuredHTMLParser(HTMLParser):
+    """Collects JSON-LD script bodies and schema.org microdata items in one pass"""
+
+    _VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.json_ld: List[str] = []
+        self.items: List[Dict[str, Any]] = []
+        self._in_json_ld = False
+        self._script: List[str] = []
+        # Each open element: (tag, item_or_None, pending_prop_or_None, text_parts)
+        self._stack: List[tuple] = []
+
+    def _current_item(self) -> Optional[Dict[str, Any]]:
+        for _, item, _, _ in reversed(self._stack):
+            if item is not None:
+                return item
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script" and (attrs.get("type") or "").lower() == "application/ld+json":
+            self._in_json_ld = True
+            self._script = []
+            return
+
+        parent = self._current_item()
+        prop = attrs.get("itemprop")
+        item = None
+
+        if "itemscope" in attrs:
+            item = {"@type": (attrs.get("itemtype") or "").split()}
+            if prop and parent is not None:
+                parent.setdefault(prop, item)
+            elif parent is None:
+                self.items.append(item)
+            prop = None
+        elif prop and parent is not None:
+            value = attrs.get("content") or attrs.get("datetime")
+            if value is None and tag in ("a", "link", "area"):
+                value = attrs.get("href")
+            if value is None and tag in ("img", "source", "meta"):
+                value = attrs.get("src")
+            if value is not None:
+                parent.setdefault(prop, value)
+                prop = None
+
+        if tag in self._VOID:
+            return
+        self._stack.append((tag, item, prop, []))
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._in_json_ld:
+            self.json_ld.append("".join(self._script))
+            self._in_json_ld = False
+            return
+
+        # Tolerate unclosed tags by unwinding to the matching open element
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+
+        while len(self._stack) > index:
+            _, item, prop, text = self._stack.pop()
+            if prop is not None:
+                parent = self._current_item()
+                if parent is not None:
+                    parent.setdefault(prop, "".join(text).strip())
+
+    def handle_data(self, data):
+        if self._in_json_ld:
+            self._script.append(data)
+            return
+        for _, _, prop, text in self._stack:
+            if prop is not None:
+                text.append(data)
+
+
+def extract_structured_opportunities(html: str, page_url: str) -> List[Dict[str, Any]]:
+    """JobPosting/Event entries from a page's JSON-LD and microdata"""
+    if not html:
+        return []
+
+    parser = _StructuredHTMLParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as e:
+        logger.debug(f"Structured data parse failed for {page_url}: {e}")
+        return []
+
+    nodes: List[Dict[str, Any]] = []
+    for script in parser.json_ld:
+        try:
+            nodes.extend(_walk_json_ld(json.loads(script)))
+        except json.JSONDecodeError:
+            continue
+    for item in parser.items:
+        nodes.extend(_walk_json_ld(item))
+
+    opportunities = []
+    seen_urls = set()
+    for node in nodes:
+        opportunity = schema_node_to_opportunity(node, page_url)
+        if opportunity and opportunity["url"] not in seen_urls:
+            seen_urls.add(opportunity["url"])
+            opportunities.append(opportunity)
+    return opportunities
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(element: ET.Element, name: str) -> Optional[str]:
+    for child in element:
+        if _local(child.tag) == name:
+            return child.text
+    return None
+
+
+def parse_feed(body, feed_url: str) -> List[Dict[str, Any]]:
+    """Items from an RSS 2.0 or Atom feed"""
+    root = ET.fromstring(body)
+    opportunities = []
+
+    for element in root.iter():
+        name = _local(element.tag)
+        if name not in ("item", "entry"):
+            continue
+
+        title = _clean_text(_child_text(element, "title"))
+        if not title:
+            continue
+
+        link = _child_text(element, "link")
+        if not link:
+            for child in element:
+                if _local(child.tag) == "link" and child.get("rel", "alternate") == "alternate":
+                    link = child.get("href")
+                    break
+        if not link:
+            continue
+
+        description = (
+            _child_text(element, "description")
+            or _child_text(element, "summary")
+            or _child_text(element, "content")
+        )
+        tags = []
+        for child in element:
+            if _local(child.tag) == "category":
+                tag = child.text or child.get("term")
+                if tag and tag not in tags:
+                    tags.append(tag.strip())
+
+        opportunities.append({
+            "title": title,
+            "company_or_organizer": _clean_text(_child_text(element, "author")),
+            "description": _clean_text(description),
+            "location": _clean_text(_child_text(element, "region") or _child_text(element, "location")),
+            "url": urljoin(feed_url, link.strip()),
+            "tags": tags,
+            "compensation_info": None,
+            "published": _child_text(element, "pubDate") or _child_text(element, "published"),
+        })
+
+    return opportunities
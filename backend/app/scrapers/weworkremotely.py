@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
 import logging
 
@@ -7,6 +7,9 @@ logger = logging.getLogger(__name__)
 
 class WeWorkRemotelyScraper(Crawl4AIBaseScraper):
     
+    query_filters = ("category",)
+    content_selector = "#job_list"
+    
     def __init__(self):
         super().__init__(
             source_name="weworkremotely",
@@ -14,6 +17,9 @@ class WeWorkRemotelyScraper(Crawl4AIBaseScraper):
         )
     
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._collect_stream(filters)
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
         try:
             category = filters.get("category", "programming")
             url = f"{self.base_url}/categories/remote-{category}-jobs"
@@ -31,20 +37,21 @@ class WeWorkRemotelyScraper(Crawl4AIBaseScraper):
             All jobs are remote, but note any specific region requirements.
             """
             
-            raw_opportunities = await self._crawl_with_llm(url, instruction)
-            
-            opportunities = []
-            for raw_opp in raw_opportunities:
-                normalized = self._normalize_opportunity(raw_opp, "job")
-                # Ensure remote flag is set
-                normalized["remote"] = True
-                normalized["location"] = normalized.get("location", "Remote")
-                if normalized.get("source_url"):
-                    opportunities.append(normalized)
+            total = 0
+            pages = self._stream_new_listings(url, instruction, feed_url=f"{url}.rss")
+            async for raw_opportunities in pages:
+                opportunities = await self._normalize_batch(raw_opportunities, "job")
+                for normalized in opportunities:
+                    # Ensure remote flag is set
+                    normalized["remote"] = True
+                    normalized["location"] = normalized.get("location", "Remote")
+                
+                total += len(opportunities)
+                if opportunities:
+                    yield opportunities
             
-            logger.info(f"Scraped {len(opportunities)} opportunities from WeWorkRemotely")
-            return opportunities
+            logger.info(f"Scraped {total} opportunities from WeWorkRemotely")
             
         except Exception as e:
             logger.error(f"Error scraping WeWorkRemotely: {e}")
-            return []
+            raise
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
 import logging
 
@@ -7,6 +7,8 @@ logger = logging.getLogger(__name__)
 
 class YCombinatorScraper(Crawl4AIBaseScraper):
     
+    content_selector = "main"
+    
     def __init__(self):
         super().__init__(
             source_name="ycombinator",
@@ -14,6 +16,9 @@ class YCombinatorScraper(Crawl4AIBaseScraper):
         )
     
     async def scrape(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._collect_stream(filters)
+    
+    async def scrape_stream(self, filters: Dict[str, Any]) -> AsyncIterator[List[Dict[str, Any]]]:
         try:
             url = f"{self.base_url}/jobs"
             
@@ -30,19 +35,19 @@ class YCombinatorScraper(Crawl4AIBaseScraper):
             Only include open positions from YC companies.
             """
             
-            raw_opportunities = await self._crawl_with_llm(url, instruction)
-            
-            opportunities = []
-            for raw_opp in raw_opportunities:
-                normalized = self._normalize_opportunity(raw_opp, "job")
-                if normalized.get("source_url"):
+            total = 0
+            async for raw_opportunities in self._stream_new_listings(url, instruction):
+                opportunities = await self._normalize_batch(raw_opportunities, "job")
+                for normalized in opportunities:
                     # Add YC-specific metadata
-                    normalized["tags"] = normalized.get("tags", []) + ["ycombinator", "startup"]
-                    opportunities.append(normalized)
+                    normalized["tags"] = (normalized.get("tags") or []) + ["ycombinator", "startup"]
+                
+                total += len(opportunities)
+                if opportunities:
+                    yield opportunities
             
-            logger.info(f"Scraped {len(opportunities)} opportunities from YCombinator")
-            return opportunities
+            logger.info(f"Scraped {total} opportunities from YCombinator")
             
         except Exception as e:
             logger.error(f"Error scraping YCombinator: {e}")
-            return []
+            raise
@@ -0,0 +1,179 @@
+"""
+Split embedding requests to fit the provider's per-request limits.
+
+Texts are packed in order into slices of at most `embedding_batch_max_inputs`
+inputs and `embedding_batch_max_tokens` tokens (inputs longer than
+`embedding_max_input_tokens` are truncated), and slices run concurrently up
+to `embedding_max_concurrency`. A slice that fails with a transient error
+is retried on its own; one the provider rejects is bisected so a single bad
+input cannot sink its neighbours. Whatever still fails comes back as None
+in its original position.
+"""
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
+import asyncio
+import logging
+
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+from app.config import settings
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Without a tokenizer, assume ~3 characters per token: over-counting only makes slices smaller
+CHARS_PER_TOKEN = 3
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    # text-embedding-3 models use cl100k_base; tiktoken downloads it on first use
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        if tiktoken is not None:
+            try:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                logger.debug(f"tiktoken encoding unavailable, estimating tokens from length: {e}")
+    return _encoding
+
+
+def fit_to_token_limit(text: str, max_tokens: int) -> Tuple[str, int]:
+    """The text truncated to `max_tokens`, and its token count"""
+    encoding = _get_encoding()
+    if encoding is None:
+        text = text[:max_tokens * CHARS_PER_TOKEN]
+        return text, len(text) // CHARS_PER_TOKEN + 1
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) > max_tokens:
+        return encoding.decode(tokens[:max_tokens]), max_tokens
+    return text, len(tokens)
+
+
+def plan_slices(token_counts: List[int], max_inputs: int, max_tokens: int) -> List[Tuple[int, int]]:
+    """Contiguous [start, end) ranges that respect both per-request limits"""
+    slices = []
+    start, tokens = 0, 0
+    for index, count in enumerate(token_counts):
+        if index > start and (index - start >= max_inputs or tokens + count > max_tokens):
+            slices.append((start, index))
+            start, tokens = index, 0
+        tokens += count
+    if start < len(token_counts):
+        slices.append((start, len(token_counts)))
+    return slices
+
+
+def is_transient(error: BaseException) -> bool:
+    """Rate limits, timeouts, connection errors and 5xx are worth retrying; other 4xx are not"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        return not isinstance(error, (ValueError, TypeError))
+    return status in (408, 409, 429) or status >= 500
+
+
+class EmbeddingBatcher:
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.requests = 0
+        self.retries = 0
+        self.bisections = 0
+        self.failed_inputs = 0
+        self.truncated_inputs = 0
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._slots = asyncio.Semaphore(settings.embedding_max_concurrency)
+            self._loop = loop
+
+    async def embed(
+        self,
+        texts: List[str],
+        request: Callable[[List[str]], Awaitable[List[List[float]]]]
+    ) -> List[Optional[List[float]]]:
+        """Embeddings in input order; None for inputs whose slice could not be embedded"""
+        if not texts:
+            return []
+        self._bind_loop()
+
+        fitted, token_counts = [], []
+        for text in texts:
+            fitted_text, count = fit_to_token_limit(text, settings.embedding_max_input_tokens)
+            if len(fitted_text) < len(text):
+                self.truncated_inputs += 1
+            fitted.append(fitted_text)
+            token_counts.append(count)
+
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        slices = plan_slices(token_counts, settings.embedding_batch_max_inputs, settings.embedding_batch_max_tokens)
+        await asyncio.gather(*[
+            self._run_slice(fitted, start, end, request, results) for start, end in slices
+        ])
+        return results
+
+    async def _run_slice(
+        self,
+        texts: List[str],
+        start: int,
+        end: int,
+        request: Callable[[List[str]], Awaitable[List[List[float]]]],
+        results: List[Optional[List[float]]]
+    ):
+        try:
+            embeddings = await self._request_with_retry(texts[start:end], request)
+        except Exception as e:
+            if end - start > 1 and not is_transient(e):
+                # Rejected input: bisect so only the offending text is lost
+                self.bisections += 1
+                middle = (start + end) // 2
+                await asyncio.gather(
+                    self._run_slice(texts, start, middle, request, results),
+                    self._run_slice(texts, middle, end, request, results)
+                )
+                return
+            self.failed_inputs += end - start
+            logger.error(f"Embedding slice [{start}:{end}] failed: {e}")
+            return
+        results[start:end] = embeddings
+
+    async def _request_with_retry(
+        self,
+        texts: List[str],
+        request: Callable[[List[str]], Awaitable[List[List[float]]]]
+    ) -> List[List[float]]:
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(settings.embedding_retry_attempts),
+            wait=wait_exponential(multiplier=1, min=1, max=20),
+            retry=retry_if_exception(is_transient),
+            reraise=True
+        ):
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    self.retries += 1
+                async with self._slots:
+                    self.requests += 1
+                    embeddings = await request(texts)
+                if len(embeddings) != len(texts):
+                    raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+                return embeddings
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "bisections": self.bisections,
+            "failed_inputs": self.failed_inputs,
+            "truncated_inputs": self.truncated_inputs,
+        }
+
+
+embedding_batcher = EmbeddingBatcher()
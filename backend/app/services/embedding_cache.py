@@ -0,0 +1,178 @@
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from array import array
+from collections import OrderedDict
+import hashlib
+import logging
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.embedding_cache import EmbeddingCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _as_list(embedding: Any) -> List[float]:
+    # pgvector returns numpy arrays; the memory tier keeps compact float32 arrays
+    return embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embeddings keyed by (model, dimensions, sha256(text)).
+    An in-process LRU of float32 vectors sits in front of the
+    `embedding_cache` table; `prune()` keeps only the most recently used
+    `embedding_cache_max_rows` rows. Lookup and write failures are logged
+    and treated as misses, never as embedding errors.
+    """
+
+    def __init__(self):
+        self._memory: "OrderedDict[Tuple[str, int, str], array]" = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.embedding_cache_enabled
+
+    def _remember(self, key: Tuple[str, int, str], embedding: Sequence[float]):
+        self._memory[key] = array("f", embedding)
+        self._memory.move_to_end(key)
+        while len(self._memory) > settings.embedding_cache_memory_size:
+            self._memory.popitem(last=False)
+
+    async def get_many(self, model: str, dimensions: int, texts: List[str]) -> List[Optional[List[float]]]:
+        """Cached embedding for each text, None where there is none"""
+        if not self.enabled:
+            return [None] * len(texts)
+
+        hashes = [text_hash(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        for digest in set(hashes):
+            key = (model, dimensions, digest)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[digest] = self._memory[key].tolist()
+
+        wanted = [digest for digest in set(hashes) if digest not in found]
+        if wanted:
+            for digest, embedding in (await self._load(model, dimensions, wanted)).items():
+                self._remember((model, dimensions, digest), embedding)
+                found[digest] = embedding
+
+        results = [found.get(digest) for digest in hashes]
+        for digest, embedding in zip(hashes, results):
+            if embedding is None:
+                self.misses += 1
+            elif digest in wanted:
+                self.db_hits += 1
+            else:
+                self.memory_hits += 1
+        return results
+
+    async def _load(self, model: str, dimensions: int, hashes: List[str]) -> Dict[str, List[float]]:
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(
+                    select(EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.embedding).where(
+                        EmbeddingCacheEntry.model == model,
+                        EmbeddingCacheEntry.dimensions == dimensions,
+                        EmbeddingCacheEntry.text_hash.in_(hashes)
+                    )
+                )).all()
+                if rows:
+                    await db.execute(
+                        update(EmbeddingCacheEntry)
+                        .where(
+                            EmbeddingCacheEntry.model == model,
+                            EmbeddingCacheEntry.dimensions == dimensions,
+                            EmbeddingCacheEntry.text_hash.in_([digest for digest, _ in rows])
+                        )
+                        .values(
+                            hit_count=EmbeddingCacheEntry.hit_count + 1,
+                            last_hit_at=func.now()
+                        )
+                    )
+                    await db.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return {}
+        return {digest: _as_list(embedding) for digest, embedding in rows}
+
+    async def set_many(self, model: str, dimensions: int, texts: List[str], embeddings: List[List[float]]):
+        if not self.enabled:
+            return
+
+        values = {}
+        for text, embedding in zip(texts, embeddings):
+            if embedding is None:
+                continue
+            digest = text_hash(text)
+            self._remember((model, dimensions, digest), embedding)
+            values[digest] = {
+                "model": model,
+                "dimensions": dimensions,
+                "text_hash": digest,
+                "embedding": embedding,
+                "hit_count": 0,
+            }
+        if not values:
+            return
+
+        stmt = insert(EmbeddingCacheEntry).on_conflict_do_nothing(
+            index_elements=["model", "dimensions", "text_hash"]
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(stmt, list(values.values()))
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    async def prune(self) -> int:
+        """Keep only the `embedding_cache_max_rows` most recently used rows"""
+        overflow = (
+            select(EmbeddingCacheEntry.id)
+            .order_by(EmbeddingCacheEntry.last_hit_at.desc())
+            .offset(settings.embedding_cache_max_rows)
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                removed = await db.execute(
+                    delete(EmbeddingCacheEntry).where(EmbeddingCacheEntry.id.in_(overflow))
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache prune failed: {e}")
+            return 0
+
+        removed = removed.rowcount or 0
+        self.evicted += removed
+        if removed:
+            logger.info(f"Pruned {removed} embedding cache entries")
+        return removed
+
+    def clear(self):
+        self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.db_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.db_hits) / lookups, 3) if lookups else 0.0,
+            "evicted": self.evicted,
+        }
+
+
+embedding_cache = EmbeddingCache()
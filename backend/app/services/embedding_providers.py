@@ -0,0 +1,143 @@
+"""
+Embedding backends behind `app.services.embeddings`.
+
+Every provider returns vectors of `EMBEDDING_DIMENSIONS` so they fit the
+`Vector(1536)` columns: smaller local models are L2-normalized and
+zero-padded, which leaves cosine distances unchanged. Vectors from
+different models are not comparable, so each provider has a `model_id`
+that is stored next to every embedding and scopes cache entries and
+similarity searches.
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import List, Optional
+import asyncio
+import logging
+import math
+import threading
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = 1536
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# sentence-transformers pulls in torch; it is imported when the model loads
+SENTENCE_TRANSFORMERS_AVAILABLE = find_spec("sentence_transformers") is not None
+
+
+def fit_dimensions(vector: List[float], dimensions: int = EMBEDDING_DIMENSIONS) -> List[float]:
+    """L2-normalize and zero-pad a vector to the storage width"""
+    if len(vector) > dimensions:
+        raise ValueError(f"Embedding has {len(vector)} dimensions, more than the {dimensions} stored")
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector] + [0.0] * (dimensions - len(vector))
+
+
+class EmbeddingProvider(ABC):
+
+    model_id: str
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """One request's worth of texts in, one EMBEDDING_DIMENSIONS vector per text out"""
+        pass
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+
+    def __init__(self, model: str = OPENAI_EMBEDDING_MODEL):
+        self.model_id = model
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._client
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        response = await self._get_client().embeddings.create(
+            model=self.model_id,
+            input=texts,
+            dimensions=EMBEDDING_DIMENSIONS,
+            encoding_format="float"
+        )
+        return [item.embedding for item in response.data]
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    sentence-transformers model on CPU. Batches are encoded in a small thread
+    pool (torch releases the GIL) so inference never blocks the event loop.
+    `embedding_local_backend` can be "onnx" or "openvino" for faster CPU
+    inference where the model ships those exports.
+    """
+
+    def __init__(self, model_name: str, backend: str = "torch", threads: int = 2, batch_size: int = 64):
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.model_id = f"local/{model_name}" if backend == "torch" else f"local/{model_name}@{backend}"
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="embedding")
+
+    def _load(self):
+        with self._load_lock:
+            if self._model is None:
+                if not SENTENCE_TRANSFORMERS_AVAILABLE:
+                    raise RuntimeError("sentence-transformers is not installed")
+                from sentence_transformers import SentenceTransformer
+
+                model = SentenceTransformer(self.model_name, device="cpu", backend=self.backend)
+                native = model.get_sentence_embedding_dimension()
+                if native and native > EMBEDDING_DIMENSIONS:
+                    raise ValueError(
+                        f"{self.model_name} produces {native}-dimensional embeddings; "
+                        f"at most {EMBEDDING_DIMENSIONS} fit the vector columns"
+                    )
+                logger.info(f"Loaded local embedding model {self.model_id} ({native} dimensions)")
+                self._model = model
+        return self._model
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        vectors = self._load().encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return [fit_dimensions(vector.tolist()) for vector in vectors]
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._encode, texts)
+
+    async def warm_up(self):
+        """Load the model now rather than on the first request"""
+        await asyncio.get_running_loop().run_in_executor(self._pool, self._load)
+
+
+_provider: Optional[EmbeddingProvider] = None
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    """The provider selected by `embedding_provider`, created on first use"""
+    global _provider
+    if _provider is None:
+        if settings.embedding_provider == "local":
+            _provider = LocalEmbeddingProvider(
+                settings.embedding_local_model,
+                backend=settings.embedding_local_backend,
+                threads=settings.embedding_local_threads,
+                batch_size=settings.embedding_local_batch_size
+            )
+        elif settings.embedding_provider == "openai":
+            _provider = OpenAIEmbeddingProvider()
+        else:
+            raise ValueError(f"Unknown embedding provider: {settings.embedding_provider}")
+    return _provider
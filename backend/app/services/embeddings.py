@@ -1,35 +1,53 @@
-from openai import AsyncOpenAI
-from typing import List, Union
-from app.config import settings
+from typing import List, Optional, Union
+from app.services.embedding_cache import embedding_cache
+from app.services.embedding_batcher import embedding_batcher
+from app.services.embedding_providers import get_embedding_provider, EMBEDDING_DIMENSIONS
 import logging
 
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(api_key=settings.openai_api_key)
+
+def current_embedding_model() -> str:
+    """Identifier of the model new embeddings come from, stored alongside them"""
+    return get_embedding_provider().model_id
+
+
+async def _request_embeddings(texts: List[str]) -> List[List[float]]:
+    return await get_embedding_provider().embed(texts)
+
+
+async def _cached_embeddings(texts: List[str]) -> List[Optional[List[float]]]:
+    """
+    Serve what the cache has and embed only the distinct misses, split into
+    provider-sized slices. Inputs whose slice failed come back as None;
+    raises only when nothing could be embedded.
+    """
+    model = current_embedding_model()
+    embeddings = await embedding_cache.get_many(model, EMBEDDING_DIMENSIONS, texts)
+    missing = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
+    if not missing:
+        return embeddings
+
+    fresh = dict(zip(missing, await embedding_batcher.embed(missing, _request_embeddings)))
+    embedded = [text for text in missing if fresh[text] is not None]
+    if not embedded:
+        raise RuntimeError(f"Embedding request failed for all {len(missing)} inputs")
+    await embedding_cache.set_many(model, EMBEDDING_DIMENSIONS, embedded, [fresh[text] for text in embedded])
+    return [embedding if embedding is not None else fresh[text] for text, embedding in zip(texts, embeddings)]
 
 
 async def generate_embedding(text: str) -> List[float]:
     try:
-        response = await client.embeddings.create(
-            model="text-embedding-3-small",
-            input=text,
-            encoding_format="float"
-        )
-        return response.data[0].embedding
+        return (await _cached_embeddings([text]))[0]
     except Exception as e:
         logger.error(f"Error generating embedding: {e}")
         raise
 
 
-async def generate_embeddings_batch(texts: List[str]) -> List[List[float]]:
+async def generate_embeddings_batch(texts: List[str]) -> List[Optional[List[float]]]:
+    """Embeddings in input order; None for any input that could not be embedded"""
     try:
-        response = await client.embeddings.create(
-            model="text-embedding-3-small",
-            input=texts,
-            encoding_format="float"
-        )
-        return [item.embedding for item in response.data]
+        return await _cached_embeddings(texts)
     except Exception as e:
         logger.error(f"Error generating batch embeddings: {e}")
         raise
-
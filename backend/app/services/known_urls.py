@@ -0,0 +1,122 @@
+"""
+In-worker Bloom filter over stored opportunity URLs.
+
+Answers "definitely not stored" without a query, so the pre-embedding
+lookup only has to ask the database about URLs that might be known. It is
+warmed from the opportunities table on first use and fed every URL this
+worker inserts; rows written by other workers after warm-up read as new,
+which costs a wasted embedding that ON CONFLICT then discards, never a
+missed listing.
+"""
+from typing import Dict, Any, Iterable, List, Optional
+import asyncio
+import hashlib
+import logging
+import math
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.opportunity import Opportunity
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> List[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class KnownURLIndex:
+
+    def __init__(self):
+        self._filter: Optional[BloomFilter] = None
+        self._warm_lock: Optional[asyncio.Lock] = None
+        self._warm_failed = False
+        self.definitely_new = 0
+        self.possibly_known = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.embedding_prefilter_bloom
+
+    async def _ensure_warm(self):
+        if self._filter is not None:
+            return
+        if self._warm_lock is None:
+            self._warm_lock = asyncio.Lock()
+        async with self._warm_lock:
+            if self._filter is not None:
+                return
+            bloom = BloomFilter(
+                settings.embedding_prefilter_bloom_capacity,
+                settings.embedding_prefilter_bloom_error_rate
+            )
+            try:
+                async with AsyncSessionLocal() as db:
+                    urls = await db.stream_scalars(
+                        select(Opportunity.source_url).execution_options(yield_per=10000)
+                    )
+                    async for url in urls:
+                        bloom.add(url)
+            except Exception as e:
+                # A partial filter would report stored URLs as new; fall back to DB lookups
+                logger.warning(f"Could not warm known-URL filter, using database lookups only: {e}")
+                self._warm_failed = True
+                return
+            self._filter = bloom
+            logger.info(f"Known-URL filter warmed with {bloom.count} URLs")
+
+    async def maybe_known(self, urls: Iterable[str]) -> List[str]:
+        """The URLs that may already be stored; everything else is certainly new"""
+        urls = list(urls)
+        if not self.enabled or self._warm_failed:
+            return urls
+        await self._ensure_warm()
+        if self._filter is None:
+            return urls
+        candidates = [url for url in urls if url in self._filter]
+        self.possibly_known += len(candidates)
+        self.definitely_new += len(urls) - len(candidates)
+        return candidates
+
+    def add(self, urls: Iterable[str]):
+        if self._filter is not None:
+            for url in urls:
+                self._filter.add(url)
+
+    def reset(self):
+        self._filter = None
+        self._warm_failed = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "urls": self._filter.count if self._filter is not None else 0,
+            "definitely_new": self.definitely_new,
+            "possibly_known": self.possibly_known,
+        }
+
+
+known_urls = KnownURLIndex()
@@ -1,4 +1,3 @@
-from openai import AsyncOpenAI
 from typing import Dict, Any, List, Optional
 from app.config import settings
 import json
@@ -6,7 +5,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-client = AsyncOpenAI(api_key=settings.openai_api_key)
+_client = None
+
+
+def get_client():
+    """Shared AsyncOpenAI client, created (and openai imported) on first use"""
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+        _client = AsyncOpenAI(api_key=settings.openai_api_key)
+    return _client
 
 
 async def chat_completion(
@@ -29,7 +37,7 @@ async def chat_completion(
         if response_format:
             kwargs["response_format"] = response_format
         
-        response = await client.chat.completions.create(**kwargs)
+        response = await get_client().chat.completions.create(**kwargs)
         return response.choices[0].message.content
     except Exception as e:
         logger.error(f"Error in chat completion: {e}")
@@ -0,0 +1,244 @@
+"""
+Cross-source near-duplicate detection for scraped opportunities.
+
+Each listing gets two 64-bit SimHash fingerprints: `key` over the normalized
+title and company, and `description` over word 3-shingles of the opening of
+the description, plus a hash of the normalized company. `key` is split into
+four 16-bit bands; two listings within Hamming distance 3 must share a band
+(pigeonhole), so candidates come from a GIN-indexed band lookup instead of
+a scan. A candidate is a duplicate when its key is within
+`dedupe_key_max_distance` bits and either both have a description and
+their description fingerprints are within `dedupe_description_max_distance`,
+or, lacking that, both name the same company. A title alone ("Software
+Engineer", "Call for Speakers") never links two listings.
+
+Duplicates are stored without an embedding and with `canonical_id`
+pointing at the first listing of the group; search only returns canonicals.
+"""
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+import hashlib
+import logging
+import re
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.opportunity import Opportunity
+
+logger = logging.getLogger(__name__)
+
+BANDS = 4
+BAND_BITS = 64 // BANDS
+DESCRIPTION_WORDS = 80
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+_PARENTHETICAL = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "limited", "gmbh", "corp", "corporation", "co", "sa", "bv", "plc"}
+_ABBREVIATIONS = {
+    "sr": "senior", "jr": "junior", "eng": "engineer", "engr": "engineer",
+    "dev": "developer", "mgr": "manager", "swe": "software engineer",
+}
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return _WORD.findall((text or "").lower())
+
+
+def normalize_company(company: Optional[str]) -> str:
+    return " ".join(word for word in _words(company) if word not in _COMPANY_SUFFIXES)
+
+
+def normalize_title(title: Optional[str], company: Optional[str] = None) -> str:
+    """Lowercased title without locations in brackets, abbreviations or an "at <company>" suffix"""
+    title = _PARENTHETICAL.sub(" ", title or "").replace("@", " at ")
+    words = _words(title)
+    company_words = _words(company)
+    # "Backend Engineer at Acme" on one board is "Backend Engineer" + company Acme on another
+    if company_words and words[-len(company_words) - 1:] == ["at"] + company_words:
+        words = words[:-len(company_words) - 1]
+    return " ".join(" ".join(_ABBREVIATIONS.get(word, word) for word in words).split())
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(features: Iterable[Tuple[str, float]]) -> int:
+    totals = [0.0] * 64
+    for feature, weight in features:
+        value = _hash64(feature)
+        for bit in range(64):
+            totals[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit, total in enumerate(totals) if total > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin((a ^ b) & 0xFFFFFFFFFFFFFFFF).count("1")
+
+
+def to_signed(value: int) -> int:
+    """Postgres BIGINT is signed"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _unsigned(value: Optional[int]) -> Optional[int]:
+    return value & 0xFFFFFFFFFFFFFFFF if value is not None else None
+
+
+class Fingerprint:
+
+    def __init__(self, key: int, description: Optional[int], company: Optional[int] = None):
+        self.key = _unsigned(key)
+        self.description = _unsigned(description)
+        self.company = _unsigned(company)
+
+    @property
+    def bands(self) -> List[int]:
+        """Band index in the high bits so equal values in different bands do not collide"""
+        mask = (1 << BAND_BITS) - 1
+        return [band << BAND_BITS | (self.key >> (band * BAND_BITS) & mask) for band in range(BANDS)]
+
+    def matches(self, other: "Fingerprint") -> bool:
+        if hamming(self.key, other.key) > settings.dedupe_key_max_distance:
+            return False
+        if self.description is not None and other.description is not None:
+            return hamming(self.description, other.description) <= settings.dedupe_description_max_distance
+        # Too little text to compare: only the same role at the same company is the same listing
+        return self.company is not None and self.company == other.company
+
+    def columns(self) -> Dict[str, Any]:
+        return {
+            "dedupe_key": to_signed(self.key),
+            "dedupe_description": to_signed(self.description) if self.description is not None else None,
+            "dedupe_company": to_signed(self.company) if self.company is not None else None,
+            "dedupe_bands": self.bands,
+        }
+
+
+def fingerprint(opp_data: Dict[str, Any]) -> Optional[Fingerprint]:
+    """None when there is no title to compare on"""
+    company = normalize_company(opp_data.get("company"))
+    title = normalize_title(opp_data.get("title"), opp_data.get("company"))
+    if not title:
+        return None
+
+    # The company counts as much as the whole title, so the same role at another employer is far away
+    words = title.split()
+    features = [(f"t:{word}", 1.0) for word in words]
+    if company:
+        features.append((f"c:{company}", float(len(words))))
+    key = simhash(features)
+    company_hash = _hash64(company) if company else None
+
+    description = _words(opp_data.get("description"))[:DESCRIPTION_WORDS]
+    if len(description) < 8:
+        return Fingerprint(key, None, company_hash)
+    shingles = [" ".join(description[i:i + 3]) for i in range(len(description) - 2)]
+    return Fingerprint(key, simhash((shingle, 1.0) for shingle in shingles), company_hash)
+
+
+class DedupeWindow:
+    """
+    In-memory LSH over listings not yet committed: those earlier in the same
+    batch, and with a pipeline, batches still between dedupe and persist.
+    Entries are released once their rows are visible to the database lookup.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, Dict[str, Tuple[Fingerprint, Any]]] = {}
+        self._bands: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._bands)
+
+    def add(self, source_url: str, fp: Fingerprint, opportunity_type: Any):
+        self._bands[source_url] = fp.bands
+        for band in fp.bands:
+            self._buckets.setdefault(band, {})[source_url] = (fp, opportunity_type)
+
+    def find(self, fp: Fingerprint, opportunity_type: Any, own_url: Optional[str] = None) -> Optional[str]:
+        for band in fp.bands:
+            for source_url, (other, other_type) in self._buckets.get(band, {}).items():
+                if source_url != own_url and other_type == opportunity_type and fp.matches(other):
+                    return source_url
+        return None
+
+    def release(self, source_urls: Iterable[str]):
+        for source_url in source_urls:
+            for band in self._bands.pop(source_url, ()):
+                bucket = self._buckets.get(band)
+                if bucket is not None:
+                    bucket.pop(source_url, None)
+                    if not bucket:
+                        del self._buckets[band]
+
+
+async def find_canonicals(
+    db: AsyncSession,
+    opportunities: List[Dict[str, Any]],
+    fingerprints: List[Optional[Fingerprint]],
+    window: Optional[DedupeWindow] = None
+) -> List[Optional[Union[UUID, str]]]:
+    """
+    For each listing: the id of the stored canonical it duplicates, the
+    source_url of an uncommitted listing it duplicates, or None. Listings
+    left as canonicals are added to `window` (a fresh one per call when not
+    given) for the caller to release once they are stored.
+    """
+    links: List[Optional[Union[UUID, str]]] = [None] * len(opportunities)
+    if not settings.dedupe_enabled:
+        return links
+    if window is None:
+        window = DedupeWindow()
+
+    bands = sorted({band for fp in fingerprints if fp is not None for band in fp.bands})
+    stored: Dict[int, List[Tuple[Fingerprint, UUID, str, str]]] = {}
+    if bands:
+        rows = (await db.execute(
+            select(
+                Opportunity.id,
+                Opportunity.source_url,
+                Opportunity.opportunity_type,
+                Opportunity.dedupe_key,
+                Opportunity.dedupe_description,
+                Opportunity.dedupe_company
+            ).where(
+                Opportunity.dedupe_bands.overlap(bands),
+                Opportunity.canonical_id.is_(None)
+            )
+        )).all()
+        for opportunity_id, source_url, opportunity_type, key, description, company in rows:
+            fp = Fingerprint(key, description, company)
+            type_value = getattr(opportunity_type, "value", opportunity_type)
+            for band in fp.bands:
+                stored.setdefault(band, []).append((fp, opportunity_id, source_url, type_value))
+
+    for index, (opp_data, fp) in enumerate(zip(opportunities, fingerprints)):
+        if fp is None:
+            continue
+        for band in fp.bands:
+            match = next(
+                (
+                    opportunity_id
+                    for other, opportunity_id, source_url, type_value in stored.get(band, ())
+                    # A re-scraped listing must not be linked to its own row
+                    if source_url != opp_data.get("source_url")
+                    and type_value == opp_data.get("opportunity_type")
+                    and fp.matches(other)
+                ),
+                None
+            )
+            if match is not None:
+                links[index] = match
+                break
+        if links[index] is None:
+            links[index] = window.find(fp, opp_data.get("opportunity_type"), opp_data.get("source_url"))
+            if links[index] is None:
+                window.add(opp_data["source_url"], fp, opp_data.get("opportunity_type"))
+
+    duplicates = sum(1 for link in links if link is not None)
+    if duplicates:
+        logger.info(f"Linked {duplicates} of {len(opportunities)} opportunities to existing listings as near-duplicates")
+    return links
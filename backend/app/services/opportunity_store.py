@@ -0,0 +1,238 @@
+"""
+Bulk writes of scraped opportunities.
+
+Each chunk is one executemany of `INSERT ... ON CONFLICT (source_url) ...
+RETURNING`, which SQLAlchemy's insertmanyvalues sends as multi-row VALUES
+pages from a single cached compilation. This replaces a SELECT plus an ORM
+add per listing, and the unique index decides what is new, so concurrent
+scrapes of the same source cannot race.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select, and_, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+from app.models.opportunity import Opportunity, OpportunityType
+from app.services.known_urls import known_urls
+from app.services.embeddings import current_embedding_model
+from app.services.near_duplicates import Fingerprint
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Refreshed on re-scrape when updating existing rows; id and created_at are kept
+UPDATE_COLUMNS = (
+    "title", "description", "location", "remote", "compensation",
+    "comp_min", "comp_max", "currency", "period", "tags", "raw_data",
+    "dedupe_key", "dedupe_description", "dedupe_company", "dedupe_bands",
+)
+
+
+class UpsertResult:
+    """Rows a bulk upsert inserted (id + source_url), and how many it updated or skipped"""
+
+    def __init__(self):
+        self.inserted: List[Dict[str, Any]] = []
+        self.updated = 0
+        self.skipped = 0
+
+    def merge(self, other: "UpsertResult"):
+        self.inserted.extend(other.inserted)
+        self.updated += other.updated
+        self.skipped += other.skipped
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"inserted": len(self.inserted), "updated": self.updated, "skipped": self.skipped}
+
+
+def embedding_text(opp_data: Dict[str, Any]) -> str:
+    """The text an opportunity's embedding is computed from"""
+    return f"{opp_data.get('title') or ''} {(opp_data.get('description') or '')[:500]}"
+
+
+def opportunity_row(
+    opp_data: Dict[str, Any],
+    embedding: Optional[List[float]] = None,
+    embedding_model: Optional[str] = None,
+    fingerprint: Optional[Fingerprint] = None,
+    canonical_id: Optional[UUID] = None
+) -> Dict[str, Any]:
+    """Column values for one normalized opportunity"""
+    compensation = opp_data.get("compensation") or {}
+    # Every row carries every key: an executemany compiles the columns of the first row only
+    dedupe = fingerprint.columns() if fingerprint is not None else {
+        "dedupe_key": None, "dedupe_description": None, "dedupe_company": None, "dedupe_bands": None
+    }
+    return {
+        "title": opp_data["title"],
+        "description": opp_data.get("description"),
+        "source_url": opp_data["source_url"],
+        "source_name": opp_data["source_name"],
+        "opportunity_type": OpportunityType(opp_data["opportunity_type"]),
+        "location": opp_data.get("location"),
+        "remote": bool(opp_data.get("remote", False)),
+        "compensation": opp_data.get("compensation"),
+        "comp_min": compensation.get("min"),
+        "comp_max": compensation.get("max"),
+        "currency": compensation.get("currency"),
+        "period": compensation.get("period"),
+        "tags": opp_data.get("tags"),
+        "embedding": embedding,
+        "embedding_model": embedding_model if embedding is not None else None,
+        **dedupe,
+        "canonical_id": canonical_id,
+        "raw_data": opp_data,
+    }
+
+
+def build_upsert(update_existing: bool = False):
+    """Upsert statement, executed with a list of rows; returns (id, source_url, inserted) per row written"""
+    # The Table, not the mapped class: a plain Core executemany rather than an ORM bulk insert
+    stmt = insert(Opportunity.__table__)
+    if update_existing:
+        set_ = {column: stmt.excluded[column] for column in UPDATE_COLUMNS}
+        # A failed embedding call must not wipe a stored embedding
+        set_["embedding"] = func.coalesce(stmt.excluded.embedding, Opportunity.__table__.c.embedding)
+        set_["embedding_model"] = func.coalesce(stmt.excluded.embedding_model, Opportunity.__table__.c.embedding_model)
+        set_["scraped_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=["source_url"], set_=set_)
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["source_url"])
+    # xmax is 0 only for a freshly inserted tuple, so it tells inserts from updates
+    return stmt.returning(
+        Opportunity.__table__.c.id,
+        Opportunity.__table__.c.source_url,
+        literal_column("(xmax = 0)").label("inserted")
+    )
+
+
+async def find_known(db: AsyncSession, urls: List[str]) -> Dict[str, Tuple[str, bool]]:
+    """source_url -> (embedding text, has an embedding from the current model) for the URLs already stored"""
+    known: Dict[str, Tuple[str, bool]] = {}
+    model = current_embedding_model()
+    batch_size = max(1, settings.opportunity_upsert_batch_size)
+    for start in range(0, len(urls), batch_size):
+        rows = (await db.execute(
+            select(
+                Opportunity.source_url,
+                Opportunity.title,
+                Opportunity.description,
+                and_(Opportunity.embedding.is_not(None), Opportunity.embedding_model == model)
+            ).where(Opportunity.source_url.in_(urls[start:start + batch_size]))
+        )).all()
+        for source_url, title, description, has_embedding in rows:
+            known[source_url] = (embedding_text({"title": title, "description": description}), has_embedding)
+    return known
+
+
+async def find_ids(db: AsyncSession, urls: List[str]) -> Dict[str, UUID]:
+    """source_url -> id for the URLs already stored"""
+    ids: Dict[str, UUID] = {}
+    batch_size = max(1, settings.opportunity_upsert_batch_size)
+    for start in range(0, len(urls), batch_size):
+        rows = (await db.execute(
+            select(Opportunity.source_url, Opportunity.id)
+            .where(Opportunity.source_url.in_(urls[start:start + batch_size]))
+        )).all()
+        ids.update({source_url: opportunity_id for source_url, opportunity_id in rows})
+    return ids
+
+
+async def filter_known_opportunities(
+    db: AsyncSession,
+    opportunities: List[Dict[str, Any]],
+    update_existing: Optional[bool] = None
+) -> Tuple[List[Dict[str, Any]], List[bool]]:
+    """
+    Drop listings that are already stored (or repeated within the batch)
+    before anything is embedded.
+    Returns the listings still to write and, for each, whether it needs a
+    new embedding. When existing rows are updated, known listings are kept
+    for the refresh but only re-embedded if their title/description changed
+    (or their embedding is missing or from another model). One query covers the whole batch; with
+    the Bloom filter enabled, only URLs it cannot rule out are queried.
+    """
+    if update_existing is None:
+        update_existing = settings.opportunity_upsert_update_existing
+
+    urls = list({opp["source_url"] for opp in opportunities if opp.get("source_url")})
+    known = await find_known(db, await known_urls.maybe_known(urls)) if urls else {}
+
+    to_write: List[Dict[str, Any]] = []
+    needs_embedding: List[bool] = []
+    seen = set()
+    for opp_data in opportunities:
+        source_url = opp_data.get("source_url")
+        if source_url in seen:
+            continue
+        seen.add(source_url)
+        stored = known.get(source_url)
+        if stored is None:
+            to_write.append(opp_data)
+            needs_embedding.append(True)
+        elif update_existing:
+            stored_text, has_embedding = stored
+            to_write.append(opp_data)
+            needs_embedding.append(not has_embedding or stored_text != embedding_text(opp_data))
+    return to_write, needs_embedding
+
+
+async def bulk_upsert_opportunities(
+    db: AsyncSession,
+    opportunities: List[Dict[str, Any]],
+    embeddings: Optional[List[Optional[List[float]]]] = None,
+    update_existing: Optional[bool] = None,
+    fingerprints: Optional[List[Optional[Fingerprint]]] = None,
+    canonical_ids: Optional[List[Optional[UUID]]] = None
+) -> UpsertResult:
+    """
+    Write a batch of normalized opportunities in chunks of
+    `opportunity_upsert_batch_size`. Existing URLs are skipped, or refreshed
+    when `update_existing` (default: `opportunity_upsert_update_existing`);
+    a refresh keeps the stored `canonical_id`.
+    Invalid items and repeats of a URL within the batch count as skipped.
+    The caller commits.
+    """
+    if update_existing is None:
+        update_existing = settings.opportunity_upsert_update_existing
+    if embeddings is None:
+        embeddings = [None] * len(opportunities)
+    if fingerprints is None:
+        fingerprints = [None] * len(opportunities)
+    if canonical_ids is None:
+        canonical_ids = [None] * len(opportunities)
+
+    result = UpsertResult()
+    rows: List[Dict[str, Any]] = []
+    seen = set()
+    embedding_model = current_embedding_model()
+    for opp_data, embedding, fp, canonical_id in zip(opportunities, embeddings, fingerprints, canonical_ids):
+        try:
+            row = opportunity_row(opp_data, embedding, embedding_model, fp, canonical_id)
+        except (KeyError, ValueError) as e:
+            logger.error(f"Skipping invalid opportunity {opp_data.get('source_url')}: {e}")
+            result.skipped += 1
+            continue
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one statement
+        if row["source_url"] in seen:
+            result.skipped += 1
+            continue
+        seen.add(row["source_url"])
+        rows.append(row)
+
+    stmt = build_upsert(update_existing)
+    batch_size = max(1, settings.opportunity_upsert_batch_size)
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start:start + batch_size]
+        written = (await db.execute(stmt, chunk)).all()
+        for row in written:
+            if row.inserted:
+                result.inserted.append({"id": row.id, "source_url": row.source_url})
+            else:
+                result.updated += 1
+        result.skipped += len(chunk) - len(written)
+
+    known_urls.add(row["source_url"] for row in result.inserted)
+    return result
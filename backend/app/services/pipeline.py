@@ -0,0 +1,169 @@
+"""
+Staged async pipeline with bounded queues.
+
+Each stage has its own worker count and an input queue of at most
+`queue_size` items, so a slow stage pushes back on the ones before it
+instead of letting work pile up in memory. A handler returns the item for
+the next stage, or None to drop it; an exception is logged and counted and
+drops only that item. Per-stage throughput and queue depth are kept for
+`stats()`.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class Stage:
+    """
+    One step of a pipeline. With a `session` factory (an async context
+    manager, e.g. `AsyncSessionLocal`) each worker holds its own session for
+    the run and the handler is called as `handler(session, item)`; otherwise
+    as `handler(item)`. A failed item rolls its worker's session back, so the
+    next one does not start in an aborted transaction.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[Any]],
+        concurrency: int = 1,
+        queue_size: int = 8,
+        session: Optional[Callable[[], Any]] = None
+    ):
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, queue_size)
+        self.session = session
+        self.reset()
+
+    def reset(self):
+        self.batches = 0
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+        self._depth_total = 0
+
+    def stats(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "batches": self.batches,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "items_per_second": round(self.items_in / elapsed, 1) if elapsed else 0.0,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "max_queue_depth": self.max_queue_depth,
+            "mean_queue_depth": round(self._depth_total / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+class Pipeline:
+
+    def __init__(self, stages: List[Stage]):
+        self.stages = stages
+        self._queues: List[asyncio.Queue] = []
+        self._elapsed = 0.0
+
+    async def run(self, produce: Callable[[Callable[[Any], Awaitable[None]]], Awaitable[Any]]) -> Any:
+        """
+        Run `produce(put)` to feed the first stage, waiting when its queue is
+        full, and drain every stage before returning what `produce` returned.
+        """
+        self._queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        for stage in self.stages:
+            stage.reset()
+        started = time.perf_counter()
+
+        stage_tasks = [
+            asyncio.create_task(self._run_stage(index))
+            for index in range(len(self.stages))
+        ]
+        producer = asyncio.create_task(self._produce(produce))
+        tasks = [producer, *stage_tasks]
+        try:
+            # A stage that dies (e.g. cannot open its session) must not leave the producer blocked on a full queue
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+            return producer.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            self._elapsed = time.perf_counter() - started
+
+    async def _produce(self, produce: Callable[[Callable[[Any], Awaitable[None]]], Awaitable[Any]]) -> Any:
+        try:
+            return await produce(self._queues[0].put)
+        finally:
+            for _ in range(self.stages[0].concurrency):
+                await self._queues[0].put(_DONE)
+
+    async def _run_stage(self, index: int):
+        stage = self.stages[index]
+        await asyncio.gather(*[self._worker(index) for _ in range(stage.concurrency)])
+        # Every worker has stopped: tell each worker of the next stage to stop too
+        if index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].concurrency):
+                await self._queues[index + 1].put(_DONE)
+
+    async def _worker(self, index: int):
+        stage = self.stages[index]
+        if stage.session is None:
+            await self._consume(index, None)
+        else:
+            async with stage.session() as session:
+                await self._consume(index, session)
+
+    async def _consume(self, index: int, session: Any):
+        stage = self.stages[index]
+        queue = self._queues[index]
+        next_queue = self._queues[index + 1] if index + 1 < len(self.stages) else None
+        while True:
+            depth = queue.qsize()
+            item = await queue.get()
+            if item is _DONE:
+                return
+            stage.batches += 1
+            stage.items_in += len(item)
+            stage._depth_total += depth
+            stage.max_queue_depth = max(stage.max_queue_depth, depth)
+
+            started = time.perf_counter()
+            try:
+                result = await (stage.handler(item) if stage.session is None else stage.handler(session, item))
+            except Exception as e:
+                stage.errors += 1
+                logger.error(f"Pipeline stage {stage.name} failed on a batch of {len(item)}: {e}")
+                if session is not None:
+                    await self._rollback(stage, session)
+                continue
+            finally:
+                stage.busy_seconds += time.perf_counter() - started
+
+            if result is None:
+                continue
+            stage.items_out += len(result)
+            if next_queue is not None:
+                await next_queue.put(result)
+
+    async def _rollback(self, stage: Stage, session: Any):
+        try:
+            await session.rollback()
+        except Exception as e:
+            logger.error(f"Pipeline stage {stage.name} could not roll back its session: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-stage counters of the last run, keyed by stage name"""
+        stats = {stage.name: stage.stats(self._elapsed) for stage in self.stages}
+        stats["elapsed_seconds"] = round(self._elapsed, 3)
+        return stats
@@ -0,0 +1,156 @@
+"""
+Write-behind buffer for scrape bookkeeping.
+
+ScrapeLog rows and PipelineEvents are appended to an in-memory buffer
+without awaiting anything, and a background task writes them as one
+executemany per table on its own pooled connection: every
+`telemetry_flush_interval` seconds, or sooner once `telemetry_flush_size`
+rows are waiting. If the database is unreachable, rows are kept for the
+next flush up to `telemetry_max_buffer`, beyond which the oldest are
+dropped; bookkeeping is never allowed to slow down or fail a scrape.
+"""
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timezone
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import Table, insert
+
+from app.config import settings
+from app.database import engine
+from app.models.pipeline_event import PipelineEvent
+from app.models.scrape_log import ScrapeLog
+
+logger = logging.getLogger(__name__)
+
+_SCRAPE_LOG_COLUMNS = ("source_name", "status", "opportunities_found", "error_log", "started_at", "completed_at")
+
+
+class TelemetryWriter:
+
+    def __init__(self, connect: Optional[Callable[[], Any]] = None):
+        # A transaction on a connection of its own, never a caller's session
+        self._connect = connect or engine.begin
+        self._buffers: Dict[Table, List[Dict[str, Any]]] = {}
+        self._pending = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+
+    def record_scrape_log(self, log: ScrapeLog):
+        row = {column: getattr(log, column) for column in _SCRAPE_LOG_COLUMNS}
+        # Column defaults only apply on flush, and every row of an executemany needs the same keys
+        row["id"] = log.id or uuid.uuid4()
+        row["opportunities_found"] = row["opportunities_found"] or 0
+        row["started_at"] = row["started_at"] or datetime.now(timezone.utc)
+        self._append(ScrapeLog.__table__, row)
+
+    def record_event(self, kind: str, source_name: Optional[str] = None, **payload: Any):
+        self._append(PipelineEvent.__table__, {
+            "id": uuid.uuid4(),
+            "kind": kind,
+            "source_name": source_name,
+            "payload": payload or None,
+            # Stamped when it happened, not when the buffer is flushed
+            "created_at": datetime.now(timezone.utc),
+        })
+
+    def _append(self, table: Table, row: Dict[str, Any]):
+        self._buffers.setdefault(table, []).append(row)
+        self._pending += 1
+        self._trim()
+        self._ensure_flusher()
+        if self._pending >= settings.telemetry_flush_size and self._wake is not None:
+            self._wake.set()
+
+    def _trim(self):
+        while self._pending > settings.telemetry_max_buffer:
+            # Oldest rows of the largest buffer go first
+            rows = max(self._buffers.values(), key=len)
+            del rows[0]
+            self._pending -= 1
+            self.dropped += 1
+
+    def _bind_loop(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync caller): rows wait for the next flush from async code
+            return False
+        if self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flusher = None
+        return True
+
+    def _ensure_flusher(self):
+        if self._bind_loop() and (self._flusher is None or self._flusher.done()):
+            self._flusher = self._loop.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.telemetry_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._pending:
+                await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything buffered now; returns the number of rows written"""
+        if not self._pending or not self._bind_loop():
+            return 0
+        async with self._flush_lock:
+            buffers, self._buffers = self._buffers, {}
+            pending, self._pending = self._pending, 0
+            try:
+                async with self._connect() as conn:
+                    for table, rows in buffers.items():
+                        if rows:
+                            await conn.execute(insert(table), rows)
+            except BaseException as e:
+                # Rows recorded during the failed write go after the ones that were already waiting
+                for table, rows in self._buffers.items():
+                    buffers.setdefault(table, []).extend(rows)
+                self._buffers = buffers
+                self._pending += pending
+                self._trim()
+                if not isinstance(e, Exception):
+                    raise
+                self.failed_flushes += 1
+                logger.warning(f"Could not write {pending} telemetry rows, keeping them for the next flush: {e}")
+                return 0
+            self.flushes += 1
+            self.written += pending
+            return pending
+
+    async def close(self):
+        """Stop the background task and write what is left"""
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        self._flusher = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self._pending,
+            "written": self.written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+        }
+
+
+telemetry = TelemetryWriter()
@@ -1,16 +1,46 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from typing import List, Optional, Tuple
+from sqlalchemy import select, and_, or_
+from typing import List, Optional, Tuple, Dict, Any
 from uuid import UUID
 import logging
 
 from app.models.opportunity import Opportunity, OpportunityType
 from app.models.goal import Goal
-from app.services.embeddings import generate_embedding
+from app.services.embeddings import generate_embedding, current_embedding_model
 
 logger = logging.getLogger(__name__)
 
 
+def compensation_conditions(filters: Optional[Dict[str, Any]]) -> list:
+    """
+    WHERE clauses for a goal's compensation filters, so they run inside the
+    vector query. `min_salary` is an annual amount in `salary_currency`
+    (USD by default), compared against the annualized comp columns.
+    """
+    filters = filters or {}
+    conditions = []
+    
+    if filters.get("compensation_required"):
+        conditions.append(or_(
+            Opportunity.comp_min.isnot(None),
+            Opportunity.comp_max.isnot(None),
+            Opportunity.compensation["type"].as_string() == "paid"
+        ))
+    
+    try:
+        min_salary = float(filters.get("min_salary") or 0)
+    except (TypeError, ValueError):
+        min_salary = 0
+    if min_salary > 0:
+        conditions.append(Opportunity.currency == str(filters.get("salary_currency") or "USD").upper())
+        conditions.append(or_(
+            Opportunity.comp_max >= min_salary,
+            and_(Opportunity.comp_max.is_(None), Opportunity.comp_min >= min_salary)
+        ))
+    
+    return conditions
+
+
 async def search_similar_opportunities(
     db: AsyncSession,
     goal_id: UUID,
@@ -23,16 +53,23 @@ async def search_similar_opportunities(
         )
         goal = result.scalar_one_or_none()
         
-        if not goal or not goal.embedding:
+        if not goal or goal.embedding is None:
             return []
         
+        # Vectors from different embedding models are not comparable
+        embedding_model = goal.embedding_model or current_embedding_model()
+        
         query = select(
             Opportunity,
             Opportunity.embedding.cosine_distance(goal.embedding).label("distance")
         ).where(
             and_(
                 Opportunity.opportunity_type == goal.goal_type,
-                Opportunity.embedding.cosine_distance(goal.embedding) < (1 - relevance_threshold)
+                # Near-duplicates are not embedded; their canonical stands for the group
+                Opportunity.canonical_id.is_(None),
+                Opportunity.embedding_model == embedding_model,
+                Opportunity.embedding.cosine_distance(goal.embedding) < (1 - relevance_threshold),
+                *compensation_conditions(goal.filters)
             )
         ).order_by("distance").limit(limit)
         
@@ -60,6 +97,9 @@ async def search_opportunities_by_text(
         stmt = select(
             Opportunity,
             Opportunity.embedding.cosine_distance(query_embedding).label("distance")
+        ).where(
+            Opportunity.canonical_id.is_(None),
+            Opportunity.embedding_model == current_embedding_model()
         )
         
         if opportunity_type:
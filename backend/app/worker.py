@@ -4,6 +4,10 @@ from temporalio.client import Client
 from temporalio.worker import Worker
 
 from app.config import settings
+from app.scrapers.http_client import http_client
+from app.scrapers.browser_pool import browser_pool
+from app.scrapers.cpu_executor import cpu_executor
+from app.services.telemetry import telemetry
 from app.workflows.matching import (
     GoalProcessingWorkflow,
     clarify_goal_activity,
@@ -49,8 +53,19 @@ async def main():
         ],
     )
     
+    if settings.scraping_browser_prewarm:
+        await browser_pool.warm_up()
+    # Independent of the browsers: spawned workers are slow to start on the first parse batch
+    await cpu_executor.warm_up()
+    
     logger.info("Temporal worker started")
-    await worker.run()
+    try:
+        await worker.run()
+    finally:
+        await browser_pool.close()
+        await http_client.close()
+        await cpu_executor.close()
+        await telemetry.close()
 
 
 if __name__ == "__main__":
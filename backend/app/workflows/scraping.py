@@ -9,27 +9,56 @@ logger = logging.getLogger(__name__)
 @activity.defn
 async def scrape_all_sources_activity() -> Dict[str, Any]:
     from app.scrapers import get_all_scrapers
-    from app.database import AsyncSessionLocal
+    from app.scrapers.extraction_cache import extraction_cache
+    from app.scrapers.cpu_executor import cpu_executor
+    from app.scrapers.browser_pool import browser_pool
+    from app.scrapers.circuit_breaker import circuit_breakers
+    from app.scrapers.coalescer import scrape_coalescer
+    from app.scrapers.http_cache import http_validators
+    from app.scrapers.http_client import http_client
+    from app.scrapers.rate_limiter import rate_limiters
+    from app.scrapers.robots import robots_cache
+    from app.services.known_urls import known_urls
+    from app.services.embedding_cache import embedding_cache
+    from app.services.embedding_batcher import embedding_batcher
+    from app.services.telemetry import telemetry
     from app.agents.executor import ExecutorAgent
+    from app.config import settings
     
     scrapers = get_all_scrapers()
     executor = ExecutorAgent()
     
-    total_opportunities = 0
-    failed_sources = []
+    # Only counts are needed here, so stored listings are not kept in memory
+    result = await executor.scrape_and_store(
+        scrapers, {}, source_timeout=settings.scraping_source_timeout_daily, collect_stored=False
+    )
     
-    async with AsyncSessionLocal() as db:
-        for scraper in scrapers:
-            try:
-                result = await executor._scrape_with_logging(db, scraper, {})
-                total_opportunities += len(result)
-            except Exception as e:
-                logger.error(f"Failed to scrape {scraper.source_name}: {e}")
-                failed_sources.append(scraper.source_name)
+    await extraction_cache.prune()
+    logger.info(f"Extraction cache: {extraction_cache.stats()}")
+    await embedding_cache.prune()
+    logger.info(f"Embedding cache: {embedding_cache.stats()}")
+    logger.info(f"Embedding requests: {embedding_batcher.stats()}")
+    logger.info(f"CPU pool: {cpu_executor.stats()}")
+    logger.info(f"Browser pool: {browser_pool.stats()}")
+    logger.info(f"HTTP pool: {http_client.stats()}")
+    logger.info(f"Host rate limits: {rate_limiters.stats()}")
+    logger.info(f"Circuit breakers: {circuit_breakers.stats()}")
+    logger.info(f"Scrape coalescer: {scrape_coalescer.stats()}")
+    logger.info(f"robots.txt cache: {robots_cache.stats()}")
+    logger.info(f"Conditional fetches: {http_validators.stats()}")
+    logger.info(f"Known-URL filter: {known_urls.stats()}")
+    logger.info(f"Pipeline: {result['pipeline']}")
+    # Activities may be the last thing a worker runs before exiting; don't leave logs in the buffer
+    await telemetry.flush()
+    logger.info(f"Telemetry: {telemetry.stats()}")
     
     return {
-        "total_opportunities": total_opportunities,
-        "failed_sources": failed_sources,
+        "total_opportunities": result["found"],
+        "stored_opportunities": result["inserted"],
+        "skipped_opportunities": result["skipped"],
+        "failed_sources": result["failed_sources"],
+        "partial_sources": result["partial_sources"],
+        "skipped_sources": result["skipped_sources"],
         "total_scrapers": len(scrapers)
     }
 
@@ -0,0 +1,161 @@
+"""
+Offline scraper benchmarks over the recorded cassettes.
+
+Thresholds are deliberately loose so only real regressions fail CI; tighten
+or relax them per runner with the BENCH_* environment variables.
+Run just these with `pytest -m benchmark -s` to see the numbers.
+"""
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from app.agents.executor import ExecutorAgent
+from app.config import settings
+from app.scrapers import get_all_scrapers
+from app.scrapers.cpu_executor import CPUExecutor
+from app.scrapers.cursors import cursor_store, SourceCursor
+from app.scrapers.structured import extract_structured_opportunities, parse_feed
+from tests.conftest import CASSETTE_DIR, stub_storage
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "5"))
+MIN_PAGES_PER_SEC = float(os.getenv("BENCH_MIN_PAGES_PER_SEC", "20"))
+MAX_PARSE_MS = float(os.getenv("BENCH_MAX_PARSE_MS", "50"))
+MAX_PEAK_ALLOC_MB = float(os.getenv("BENCH_MAX_PEAK_ALLOC_MB", "64"))
+MAX_SEARCH_MS = float(os.getenv("BENCH_MAX_SEARCH_MS", "2000"))
+MAX_LOOP_LAG_MS = float(os.getenv("BENCH_MAX_LOOP_LAG_MS", "100"))
+
+
+@pytest.fixture
+def fresh_cursors(replay_cassettes, monkeypatch):
+    """Every scrape sees an empty watermark, so each round parses the full fixture"""
+    async def load(source_name, scope=""):
+        return SourceCursor(source_name, scope)
+
+    async def save(cursor):
+        return None
+
+    monkeypatch.setattr(cursor_store, "load", load)
+    monkeypatch.setattr(cursor_store, "save", save)
+
+
+def _recorded_bodies():
+    for path in sorted(CASSETTE_DIR.glob("*.json")):
+        tape = json.loads(path.read_text(encoding="utf-8"))
+        for url, entry in tape["http"].items():
+            yield pytest.param(tape["source"], url, "http", entry["body"], id=f"{tape['source']}-http")
+        for url, entry in tape["pages"].items():
+            yield pytest.param(tape["source"], url, "page", entry["html"], id=f"{tape['source']}-page")
+
+
+def _parse(url: str, kind: str, body: str):
+    if kind == "page":
+        return extract_structured_opportunities(body, url)
+    if body.lstrip().startswith("<"):
+        return parse_feed(body.encode("utf-8"), url)
+    return json.loads(body)
+
+
+async def test_replay_throughput(fresh_cursors):
+    scrapers = get_all_scrapers()
+
+    started = time.perf_counter()
+    listings = 0
+    for _ in range(ROUNDS):
+        for scraper in scrapers:
+            listings += len(await scraper.scrape({}))
+    elapsed = time.perf_counter() - started
+
+    pages_per_sec = ROUNDS * len(scrapers) / elapsed
+    print(f"\nreplay: {pages_per_sec:.1f} pages/s, {listings / elapsed:.0f} listings/s")
+    assert listings > 0
+    assert pages_per_sec >= MIN_PAGES_PER_SEC
+
+
+@pytest.mark.parametrize("source, url, kind, body", list(_recorded_bodies()))
+def test_parse_time(source, url, kind, body):
+    _parse(url, kind, body)
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        _parse(url, kind, body)
+    parse_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+    print(f"\nparse {source}: {parse_ms:.2f} ms for {len(body) / 1024:.0f} KiB")
+    assert parse_ms <= MAX_PARSE_MS
+
+
+async def test_replay_allocations(fresh_cursors):
+    scrapers = get_all_scrapers()
+    # Warm imports and lazily built state so only steady-state allocations count
+    for scraper in scrapers:
+        await scraper.scrape({})
+
+    tracemalloc.start()
+    try:
+        for scraper in scrapers:
+            await scraper.scrape({})
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    peak_mb = peak / (1024 * 1024)
+    print(f"\nreplay allocations: peak {peak_mb:.2f} MiB, retained {current / 1024:.0f} KiB")
+    assert peak_mb <= MAX_PEAK_ALLOC_MB
+
+
+@pytest.mark.parametrize("goal_type", ["job", "speaking", "event"])
+async def test_execute_search_latency(fresh_cursors, monkeypatch, goal_type):
+    executor = stub_storage(ExecutorAgent(), monkeypatch)
+
+    goal = {"goal_type": goal_type, "filters": {}}
+    await executor.execute_search(None, goal)
+
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        stored = await executor.execute_search(None, goal)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert stored
+
+    timings.sort()
+    print(f"\nexecute_search({goal_type}): median {timings[len(timings) // 2]:.1f} ms, max {timings[-1]:.1f} ms")
+    assert timings[len(timings) // 2] <= MAX_SEARCH_MS
+
+
+async def test_event_loop_lag_during_large_parse(monkeypatch):
+    monkeypatch.setattr(settings, "scraping_cpu_workers", 1)
+    monkeypatch.setattr(settings, "scraping_cpu_inline_threshold", 0)
+    tape = json.loads((CASSETTE_DIR / "angellist.json").read_text(encoding="utf-8"))
+    url, entry = next(iter(tape["pages"].items()))
+    # ~2 MB listing page
+    html = entry["html"] * max(1, (2 * 1024 * 1024) // len(entry["html"]))
+
+    executor = CPUExecutor()
+    await executor.warm_up()
+    lags = []
+
+    async def ticker(stop: asyncio.Event):
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append((time.perf_counter() - started - 0.005) * 1000)
+
+    try:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(ticker(stop))
+        result = await executor.run("structured", extract_structured_opportunities, html, url, size=len(html))
+        stop.set()
+        await probe
+    finally:
+        await executor.close()
+
+    run_ms = executor.stats()["tasks"]["structured"]["max_ms"]
+    print(f"\nloop lag while parsing {len(html) / 1024 / 1024:.1f} MiB off-loop: max {max(lags):.1f} ms (parse {run_ms:.0f} ms)")
+    assert result
+    assert max(lags) <= MAX_LOOP_LAG_MS
@@ -0,0 +1,126 @@
+"""
+Bulk upsert throughput at 100, 1k and 10k rows.
+
+The preparation benchmark runs offline and covers the Python side (row
+building, in-batch dedupe, statement compilation) and the round-trip count.
+Set BENCH_DATABASE_URL to a disposable Postgres with pgvector to also time
+real writes; its `opportunities` table is created if missing and the test
+rows are removed afterwards.
+"""
+import os
+import time
+import uuid
+
+import pytest
+from sqlalchemy import delete, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from app.config import settings
+from app.models.opportunity import Opportunity
+from app.services.opportunity_store import bulk_upsert_opportunities
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [100, 1_000, 10_000]
+MIN_PREPARE_ROWS_PER_SEC = float(os.getenv("BENCH_MIN_UPSERT_PREPARE_ROWS_PER_SEC", "5000"))
+MIN_DB_ROWS_PER_SEC = float(os.getenv("BENCH_MIN_UPSERT_DB_ROWS_PER_SEC", "1000"))
+DATABASE_URL = os.getenv("BENCH_DATABASE_URL")
+
+
+def _batch(size, source_name):
+    return [
+        {
+            "title": f"Senior Engineer {i}",
+            "description": "Build and run the scraping pipeline. " * 10,
+            "source_url": f"https://bench.example/{source_name}/{i}",
+            "source_name": source_name,
+            "opportunity_type": "job",
+            "location": "Remote",
+            "remote": True,
+            "tags": ["python", "postgres"],
+            "compensation": {"type": "paid", "min": 150000.0, "max": 180000.0, "currency": "USD", "period": "year"},
+        }
+        for i in range(size)
+    ]
+
+
+class _CountingSession:
+    """Stands in for the database: every row is new, round trips are counted"""
+
+    def __init__(self):
+        self.round_trips = 0
+
+    async def execute(self, stmt, params):
+        self.round_trips += 1
+        stmt.compile(dialect=postgresql.asyncpg.dialect())
+        return _Rows([_Inserted(row["source_url"]) for row in params])
+
+
+class _Inserted:
+
+    def __init__(self, source_url):
+        self.id = uuid.uuid4()
+        self.source_url = source_url
+        self.inserted = True
+
+
+class _Rows:
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+@pytest.mark.parametrize("size", SIZES)
+async def test_upsert_preparation_throughput(size):
+    opportunities = _batch(size, "prepare")
+    db = _CountingSession()
+
+    started = time.perf_counter()
+    result = await bulk_upsert_opportunities(db, opportunities)
+    elapsed = time.perf_counter() - started
+
+    rows_per_sec = size / elapsed
+    print(f"\nupsert prepare {size} rows: {db.round_trips} round trips, {rows_per_sec:.0f} rows/s")
+    assert len(result.inserted) == size
+    assert db.round_trips == -(-size // settings.opportunity_upsert_batch_size)
+    assert rows_per_sec >= MIN_PREPARE_ROWS_PER_SEC
+
+
+@pytest.mark.skipif(not DATABASE_URL, reason="BENCH_DATABASE_URL not set")
+@pytest.mark.parametrize("size", SIZES)
+async def test_upsert_database_throughput(size):
+    engine = create_async_engine(DATABASE_URL, connect_args={"statement_cache_size": 0})
+    source_name = f"bench-{uuid.uuid4().hex[:8]}"
+    opportunities = _batch(size, source_name)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            await conn.run_sync(Opportunity.__table__.create, checkfirst=True)
+
+        async with AsyncSession(engine) as db:
+            started = time.perf_counter()
+            first = await bulk_upsert_opportunities(db, opportunities)
+            await db.commit()
+            insert_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            second = await bulk_upsert_opportunities(db, opportunities)
+            await db.commit()
+            conflict_seconds = time.perf_counter() - started
+
+            await db.execute(delete(Opportunity).where(Opportunity.source_name == source_name))
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    print(
+        f"\nupsert {size} rows: insert {size / insert_seconds:.0f} rows/s, "
+        f"all-conflict {size / conflict_seconds:.0f} rows/s"
+    )
+    assert first.as_dict() == {"inserted": size, "updated": 0, "skipped": 0}
+    assert second.as_dict() == {"inserted": 0, "updated": 0, "skipped": size}
+    assert size / insert_seconds >= MIN_DB_ROWS_PER_SEC
@@ -0,0 +1,122 @@
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+
+from app.agents.executor import ExecutorAgent
+from app.config import settings
+from app.scrapers.circuit_breaker import SourceCircuit, CircuitState, CircuitBreakerRegistry, _utcnow
+from app.scrapers.errors import (
+    HTTPStatusError, RateLimitedError, RobotsBlockedError, CrawlFailedError, is_retryable
+)
+from tests.conftest import stub_storage
+
+
+def test_error_classification():
+    assert is_retryable(RateLimitedError("https://a", 429, 5))
+    assert is_retryable(HTTPStatusError("https://a", 503))
+    assert is_retryable(CrawlFailedError("https://a", "net::ERR_TIMED_OUT"))
+    assert is_retryable(asyncio.TimeoutError())
+    assert not is_retryable(HTTPStatusError("https://a", 404))
+    assert not is_retryable(RobotsBlockedError("https://a"))
+    assert not is_retryable(json.JSONDecodeError("bad", "", 0))
+
+
+def test_opens_after_repeated_retryable_failures():
+    circuit = SourceCircuit("remoteok")
+    for _ in range(settings.scraping_breaker_failure_threshold - 1):
+        circuit.record_failure("timeout")
+        assert circuit.allow()
+    circuit.record_failure("timeout")
+    assert circuit.state == CircuitState.OPEN
+    assert not circuit.allow()
+
+
+def test_fatal_failure_opens_immediately():
+    circuit = SourceCircuit("indeed")
+    circuit.record_failure("Blocked by robots.txt", fatal=True)
+    assert circuit.state == CircuitState.OPEN
+
+
+def test_half_open_allows_single_probe_then_recovers():
+    circuit = SourceCircuit("indeed")
+    now = _utcnow()
+    circuit.record_failure("blocked", fatal=True, at=now)
+
+    later = now + timedelta(seconds=settings.scraping_breaker_cooldown + 1)
+    assert circuit.allow(later)
+    assert circuit.state == CircuitState.HALF_OPEN
+    assert not circuit.allow(later)
+
+    circuit.record_success()
+    assert circuit.state == CircuitState.CLOSED
+    assert circuit.allow()
+
+
+def test_failed_probe_reopens_with_longer_cooldown():
+    circuit = SourceCircuit("indeed")
+    now = _utcnow()
+    circuit.record_failure("blocked", fatal=True, at=now)
+    first_cooldown = circuit.open_until - now
+
+    probe_at = now + first_cooldown + timedelta(seconds=1)
+    assert circuit.allow(probe_at)
+    circuit.record_failure("still blocked", at=probe_at)
+
+    assert circuit.state == CircuitState.OPEN
+    assert circuit.open_until - probe_at == first_cooldown * 2
+
+
+async def test_cancelled_probe_does_not_block_the_source(monkeypatch):
+    from app.agents import executor as executor_module
+
+    registry = CircuitBreakerRegistry()
+    registry._seeded = True
+    circuit = registry.get("flaky")
+    circuit.record_failure("blocked", fatal=True, at=_utcnow() - timedelta(days=1))
+    monkeypatch.setattr(settings, "scraping_breaker_enabled", True)
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 0)
+    monkeypatch.setattr(executor_module, "circuit_breakers", registry)
+
+    started = asyncio.Event()
+
+    class HangingScraper:
+        source_name = "flaky"
+        query_filters = ()
+
+        async def scrape_stream(self, filters):
+            started.set()
+            await asyncio.sleep(3600)
+            yield []
+
+    executor = stub_storage(ExecutorAgent(), monkeypatch)
+    run = asyncio.create_task(executor.scrape_and_store([HangingScraper()], {}))
+    await started.wait()
+    assert circuit.state == CircuitState.HALF_OPEN
+    assert not registry.allow("flaky")
+
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    assert registry.allow("flaky")
+
+
+async def test_execute_search_skips_open_sources(replay_cassettes, monkeypatch):
+    from app.agents import executor as executor_module
+
+    registry = CircuitBreakerRegistry()
+    registry._seeded = True
+    registry.get("remoteok").record_failure("blocked", fatal=True)
+    monkeypatch.setattr(settings, "scraping_breaker_enabled", True)
+    monkeypatch.setattr(executor_module, "circuit_breakers", registry)
+
+    executor = stub_storage(ExecutorAgent(), monkeypatch)
+
+    scrapers = executor_module.get_scrapers_for_goal_type("job")
+    result = await executor.scrape_and_store(scrapers, {})
+
+    assert result["skipped_sources"] == ["remoteok"]
+    assert all(o["source_name"] != "remoteok" for o in result["stored"])
+    assert result["stored"]
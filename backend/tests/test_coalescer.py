@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.scrapers.coalescer import ScrapeCoalescer, normalize_filters
+
+
+class CountingScraper:
+    source_name = "indeed"
+    query_filters = ("job_title", "location")
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def scrape_stream(self, filters):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        yield [{"source_url": "https://example.com/1"}]
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("boom")
+        yield [{"source_url": "https://example.com/2"}]
+
+
+async def _collect(coalescer, scraper, filters):
+    return [item async for batch in coalescer.stream(scraper, filters) for item in batch]
+
+
+def test_normalize_filters_ignores_case_whitespace_and_unused_keys():
+    keys = ("job_title", "location")
+    assert normalize_filters({"job_title": "Software  Developer", "goal_id": 1}, keys) == \
+        normalize_filters({"job_title": "software developer", "location": ""}, keys)
+    assert normalize_filters({"job_title": "designer"}, keys) != normalize_filters({"job_title": "developer"}, keys)
+
+
+async def test_concurrent_identical_scrapes_share_one_crawl(monkeypatch):
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 0)
+    coalescer = ScrapeCoalescer()
+    scraper = CountingScraper()
+
+    results = await asyncio.gather(*[
+        _collect(coalescer, scraper, {"job_title": "Developer", "user": i}) for i in range(5)
+    ])
+
+    assert scraper.calls == 1
+    assert all(len(result) == 2 for result in results)
+    assert coalescer.stats()["coalesced"] == 4
+
+
+async def test_completed_result_is_reused_within_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 60)
+    coalescer = ScrapeCoalescer()
+    scraper = CountingScraper()
+
+    first = await _collect(coalescer, scraper, {"job_title": "developer"})
+    second = await _collect(coalescer, scraper, {"job_title": "Developer"})
+
+    assert scraper.calls == 1
+    assert first == second
+    assert coalescer.stats()["hits"] == 1
+
+
+async def test_failures_reach_every_subscriber_and_are_not_cached(monkeypatch):
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 60)
+    coalescer = ScrapeCoalescer()
+    scraper = CountingScraper(fail=True)
+
+    results = await asyncio.gather(
+        *[_collect(coalescer, scraper, {}) for _ in range(3)],
+        return_exceptions=True
+    )
+
+    assert scraper.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await _collect(coalescer, scraper, {})
+    assert scraper.calls == 2
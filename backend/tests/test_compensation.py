@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.opportunity import Opportunity
+from app.scrapers.compensation import parse_compensation_text
+from app.scrapers.normalize import normalize_opportunity
+from app.services.vector_search import compensation_conditions
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$120k - $150k", (120000, 150000, "USD", "year")),
+    ("80-100K", (80000, 100000, None, "year")),
+    ("up to €70k", (None, 70000, "EUR", "year")),
+    ("from 60,000 GBP", (60000, None, "GBP", "year")),
+    ("CA$95,000 – 110,000 annually", (95000, 110000, "CAD", "year")),
+    ("USD 100000-150000 per year", (100000, 150000, "USD", "year")),
+    ("€50 - €70 per hour", (104000, 145600, "EUR", "hour")),
+    ("$5,000/month", (60000, 60000, "USD", "month")),
+    ("£400 a day", (104000, 104000, "GBP", "day")),
+    ("$500 honorarium", (500, 500, "USD", "fixed")),
+    ("$150k+ and 401(k) match", (150000, None, "USD", "year")),
+    ("10+ years experience, $90k", (90000, 90000, "USD", "year")),
+    ("4 day week, $120k", (120000, 120000, "USD", "year")),
+    ("€ 45.000 - 55.000", (45000, 55000, "EUR", "year")),
+])
+def test_parse_compensation_text(text, expected):
+    parsed = parse_compensation_text(text)
+    assert (parsed["min"], parsed["max"], parsed["currency"], parsed["period"]) == expected
+    assert parsed["type"] == "paid"
+    assert parsed["details"] == text
+
+
+def test_unpaid_and_amountless_text():
+    assert parse_compensation_text("Volunteer / unpaid")["type"] == "unpaid"
+    paid = parse_compensation_text("Competitive salary")
+    assert paid["type"] == "paid" and paid["min"] is None and paid["max"] is None
+    assert parse_compensation_text("") is None
+
+
+@pytest.mark.parametrize("text", [
+    "Competitive salary + 401(k)",
+    "Salary + 403b + equity",
+    "Competitive salary + 25 days PTO",
+    "Full-time, 40 hours per week",
+    "Top 5% pay",
+    "Equity 0.5% - 1%",
+    "2024 conference",
+])
+def test_counts_percentages_and_benefits_are_not_amounts(text):
+    parsed = parse_compensation_text(text)
+    assert (parsed["min"], parsed["max"], parsed["period"]) == (None, None, None)
+
+
+def test_numeric_source_salaries_bypass_text_parsing():
+    opportunity = normalize_opportunity(
+        {"url": "https://remoteok.com/1", "compensation_info": "$90000", "salary_min": 90000,
+         "salary_max": None, "salary_currency": "USD", "salary_period": "year"},
+        "remoteok",
+        "job"
+    )
+    assert opportunity["compensation"]["min"] == 90000
+    assert opportunity["compensation"]["max"] is None
+
+
+def test_event_ticket_prices_are_not_compensation():
+    opportunity = normalize_opportunity(
+        {"url": "https://eventbrite.com/e/1", "compensation_info": "USD 25.00"}, "eventbrite", "event"
+    )
+    assert opportunity["compensation"]["min"] is None
+
+
+def test_salary_floor_is_pushed_into_sql():
+    sql = str(
+        select(Opportunity.id)
+        .where(*compensation_conditions({"min_salary": 100000, "compensation_required": True}))
+        .compile(dialect=postgresql.dialect())
+    )
+    assert "opportunities.comp_max >=" in sql
+    assert "opportunities.currency =" in sql
+    assert compensation_conditions({}) == []
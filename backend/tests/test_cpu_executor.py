@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from app.config import settings
+from app.scrapers.cpu_executor import CPUExecutor
+from app.scrapers.structured import extract_structured_opportunities
+from tests.conftest import CASSETTE_DIR
+
+
+@pytest.fixture
+def sessionize_page():
+    tape = json.loads((CASSETTE_DIR / "sessionize.json").read_text(encoding="utf-8"))
+    url, entry = next(iter(tape["pages"].items()))
+    return url, entry["html"]
+
+
+async def test_small_payloads_run_inline(monkeypatch, sessionize_page):
+    monkeypatch.setattr(settings, "scraping_cpu_inline_threshold", 10 ** 9)
+    executor = CPUExecutor()
+    url, html = sessionize_page
+
+    result = await executor.run("structured", extract_structured_opportunities, html, url, size=len(html))
+
+    assert result == extract_structured_opportunities(html, url)
+    assert executor.stats()["tasks"]["structured"]["inline"] == 1
+
+
+async def test_large_payloads_run_in_process_pool(monkeypatch, sessionize_page):
+    monkeypatch.setattr(settings, "scraping_cpu_workers", 1)
+    monkeypatch.setattr(settings, "scraping_cpu_inline_threshold", 0)
+    executor = CPUExecutor()
+    url, html = sessionize_page
+
+    try:
+        result = await executor.run("structured", extract_structured_opportunities, html, url, size=len(html))
+    finally:
+        await executor.close()
+
+    assert result == extract_structured_opportunities(html, url)
+    stats = executor.stats()["tasks"]["structured"]
+    assert stats["offloaded"] == 1
+    assert stats["max_ms"] > 0
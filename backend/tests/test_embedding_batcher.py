@@ -0,0 +1,93 @@
+import asyncio
+import random
+
+import pytest
+from tenacity import wait_none
+
+from app.config import settings
+from app.services import embedding_batcher as batcher_module
+from app.services.embedding_batcher import EmbeddingBatcher, plan_slices
+
+
+class ProviderError(Exception):
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture
+def batcher(monkeypatch):
+    monkeypatch.setattr(settings, "embedding_batch_max_inputs", 4)
+    monkeypatch.setattr(settings, "embedding_batch_max_tokens", 10_000)
+    monkeypatch.setattr(settings, "embedding_max_concurrency", 2)
+    monkeypatch.setattr(settings, "embedding_retry_attempts", 3)
+    monkeypatch.setattr(batcher_module, "wait_exponential", lambda **kwargs: wait_none())
+    return EmbeddingBatcher()
+
+
+def test_slices_respect_input_and_token_limits():
+    assert plan_slices([1] * 10, max_inputs=4, max_tokens=100) == [(0, 4), (4, 8), (8, 10)]
+    assert plan_slices([60, 30, 20, 90, 5], max_inputs=10, max_tokens=100) == [(0, 2), (2, 3), (3, 5)]
+    # A single input over the token budget still gets its own slice
+    assert plan_slices([150, 10], max_inputs=10, max_tokens=100) == [(0, 1), (1, 2)]
+
+
+async def test_output_order_is_kept_with_bounded_concurrency(batcher):
+    running = 0
+    peak = 0
+
+    async def request(texts):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(random.uniform(0, 0.01))
+        running -= 1
+        return [[float(text)] for text in texts]
+
+    texts = [str(i) for i in range(30)]
+    result = await batcher.embed(texts, request)
+
+    assert result == [[float(i)] for i in range(30)]
+    assert peak == 2
+    assert batcher.stats()["requests"] == 8
+
+
+async def test_only_the_failed_slice_is_retried(batcher):
+    calls = []
+
+    async def request(texts):
+        calls.append(texts[0])
+        if texts[0] == "4" and calls.count("4") == 1:
+            raise ProviderError(429)
+        return [[1.0] for _ in texts]
+
+    result = await batcher.embed([str(i) for i in range(12)], request)
+
+    assert all(embedding == [1.0] for embedding in result)
+    assert sorted(calls) == ["0", "4", "4", "8"]
+    assert batcher.stats()["retries"] == 1
+
+
+async def test_rejected_input_is_isolated(batcher):
+    async def request(texts):
+        if "bad" in texts:
+            raise ProviderError(400)
+        return [[1.0] for _ in texts]
+
+    result = await batcher.embed(["a", "b", "bad", "c"], request)
+
+    assert result == [[1.0], [1.0], None, [1.0]]
+    assert batcher.stats()["failed_inputs"] == 1
+
+
+async def test_exhausted_retries_leave_only_that_slice_empty(batcher):
+    async def request(texts):
+        if texts[0] == "0":
+            raise ProviderError(503)
+        return [[1.0] for _ in texts]
+
+    result = await batcher.embed([str(i) for i in range(8)], request)
+
+    assert result[:4] == [None] * 4
+    assert result[4:] == [[1.0]] * 4
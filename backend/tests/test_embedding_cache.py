@@ -0,0 +1,93 @@
+import pytest
+
+from app.config import settings
+from app.services import embeddings
+from app.services.embedding_cache import EmbeddingCache, text_hash
+
+
+class FakeTable:
+    """Stands in for the embedding_cache table behind AsyncSessionLocal"""
+
+    def __init__(self):
+        self.rows = {}
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        for row in params or []:
+            self.rows.setdefault((row["model"], row["dimensions"], row["text_hash"]), row["embedding"])
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    table = FakeTable()
+    cache = EmbeddingCache()
+
+    async def load(model, dimensions, hashes):
+        return {h: table.rows[(model, dimensions, h)] for h in hashes if (model, dimensions, h) in table.rows}
+
+    monkeypatch.setattr(settings, "embedding_cache_enabled", True)
+    monkeypatch.setattr("app.services.embedding_cache.AsyncSessionLocal", table)
+    monkeypatch.setattr(cache, "_load", load)
+    monkeypatch.setattr(embeddings, "embedding_cache", cache)
+    cache.table = table
+    return cache
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    async def request(texts):
+        calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    monkeypatch.setattr(embeddings, "_request_embeddings", request)
+    return calls
+
+
+async def test_only_distinct_misses_go_upstream(cache, upstream):
+    first = await embeddings.generate_embeddings_batch(["alpha", "beta", "alpha"])
+    second = await embeddings.generate_embeddings_batch(["beta", "gamma"])
+
+    assert upstream == [["alpha", "beta"], ["gamma"]]
+    assert first == [[5.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+    assert second == [[4.0, 0.5], [5.0, 0.5]]
+    assert cache.stats()["memory_hits"] == 1
+
+
+async def test_table_serves_entries_evicted_from_memory(cache, upstream):
+    await embeddings.generate_embedding("a goal description")
+    cache.clear()
+
+    assert await embeddings.generate_embedding("a goal description") == [18.0, 0.5]
+    assert len(upstream) == 1
+    stats = cache.stats()
+    assert stats["db_hits"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+async def test_entries_are_keyed_by_model_and_dimensions(cache):
+    await cache.set_many("model-a", 2, ["text"], [[1.0, 2.0]])
+
+    assert await cache.get_many("model-a", 2, ["text"]) == [[1.0, 2.0]]
+    assert await cache.get_many("model-a", 3, ["text"]) == [None]
+    assert await cache.get_many("model-b", 2, ["text"]) == [None]
+    assert ("model-a", 2, text_hash("text")) in cache.table.rows
+
+
+async def test_memory_tier_is_size_bounded(cache, monkeypatch):
+    monkeypatch.setattr(settings, "embedding_cache_memory_size", 2)
+    await cache.set_many("m", 1, ["a", "b", "c"], [[1.0], [2.0], [3.0]])
+
+    assert cache.stats()["memory_entries"] == 2
@@ -0,0 +1,76 @@
+import math
+import threading
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services import embedding_providers, embeddings
+from app.services.embedding_providers import (
+    EMBEDDING_DIMENSIONS,
+    LocalEmbeddingProvider,
+    OpenAIEmbeddingProvider,
+    fit_dimensions,
+    get_embedding_provider,
+)
+
+
+class FakeSentenceModel:
+    """Deterministic 4-dimensional stand-in for a sentence-transformers model"""
+
+    def __init__(self):
+        self.threads = set()
+
+    def encode(self, texts, **kwargs):
+        self.threads.add(threading.get_ident())
+        return np.array([[len(text), 1.0, 0.0, 2.0] for text in texts], dtype=np.float32)
+
+
+def _cosine(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)))
+
+
+def test_fit_dimensions_pads_without_changing_similarity():
+    a, b = [3.0, 4.0, 0.0], [1.0, 2.0, 2.0]
+    padded_a, padded_b = fit_dimensions(a), fit_dimensions(b)
+
+    assert len(padded_a) == EMBEDDING_DIMENSIONS
+    assert math.isclose(math.sqrt(sum(x * x for x in padded_a)), 1.0)
+    assert math.isclose(_cosine(padded_a, padded_b), _cosine(a, b))
+
+    with pytest.raises(ValueError):
+        fit_dimensions([1.0] * (EMBEDDING_DIMENSIONS + 1))
+
+
+async def test_local_provider_embeds_off_the_event_loop(monkeypatch):
+    provider = LocalEmbeddingProvider("fake-model", threads=1)
+    model = FakeSentenceModel()
+    monkeypatch.setattr(provider, "_load", lambda: model)
+
+    vectors = await provider.embed(["a", "abc"])
+
+    assert [len(vector) for vector in vectors] == [EMBEDDING_DIMENSIONS, EMBEDDING_DIMENSIONS]
+    assert vectors[0][:4] != vectors[1][:4]
+    assert threading.get_ident() not in model.threads
+
+
+def test_provider_is_chosen_by_settings(monkeypatch):
+    monkeypatch.setattr(embedding_providers, "_provider", None)
+    monkeypatch.setattr(settings, "embedding_provider", "local")
+    monkeypatch.setattr(settings, "embedding_local_model", "fake-model")
+    monkeypatch.setattr(settings, "embedding_local_backend", "onnx")
+    provider = get_embedding_provider()
+    assert isinstance(provider, LocalEmbeddingProvider)
+    # Versioned per model and backend, so their vectors are never compared or cached together
+    assert embeddings.current_embedding_model() == "local/fake-model@onnx"
+
+    monkeypatch.setattr(embedding_providers, "_provider", None)
+    monkeypatch.setattr(settings, "embedding_provider", "openai")
+    assert isinstance(get_embedding_provider(), OpenAIEmbeddingProvider)
+    assert embeddings.current_embedding_model() == "text-embedding-3-small"
+
+    monkeypatch.setattr(embedding_providers, "_provider", None)
+    monkeypatch.setattr(settings, "embedding_provider", "nope")
+    with pytest.raises(ValueError):
+        get_embedding_provider()
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from app.agents.executor import ExecutorAgent
+from app.config import settings
+from app.models.scrape_log import ScrapeStatus
+from tests.conftest import stub_storage
+
+
+class SlowScraper:
+    query_filters = ()
+
+    def __init__(self, source_name, listings_before_hang):
+        self.source_name = source_name
+        self.listings_before_hang = listings_before_hang
+        self.cancelled = False
+
+    async def scrape_stream(self, filters):
+        if self.listings_before_hang:
+            yield [
+                {"source_url": f"https://{self.source_name}.example/{i}", "source_name": self.source_name}
+                for i in range(self.listings_before_hang)
+            ]
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class FastScraper(SlowScraper):
+
+    async def scrape_stream(self, filters):
+        yield [{"source_url": "https://fast.example/1", "source_name": self.source_name}]
+
+
+@pytest.fixture
+def executor(monkeypatch, buffered_telemetry):
+    monkeypatch.setattr(settings, "scraping_breaker_enabled", False)
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 0)
+    agent = stub_storage(ExecutorAgent(), monkeypatch)
+    agent.logs = buffered_telemetry["scrape_logs"]
+    return agent
+
+
+async def test_deadline_keeps_partial_results(executor):
+    partial = SlowScraper("deadline-partial", listings_before_hang=3)
+    hung = SlowScraper("deadline-hung", listings_before_hang=0)
+    fast = FastScraper("deadline-fast", 0)
+
+    result = await executor.scrape_and_store([partial, hung, fast], {}, source_timeout=0.2)
+
+    assert result["partial_sources"] == ["deadline-partial"]
+    assert result["failed_sources"] == ["deadline-hung"]
+    assert len(result["stored"]) == 4
+    assert partial.cancelled and hung.cancelled
+
+    logs = {log.source_name: log for log in executor.logs}
+    assert logs["deadline-partial"].status == ScrapeStatus.PARTIAL
+    assert logs["deadline-partial"].opportunities_found == 3
+    assert "Deadline of" in logs["deadline-partial"].error_log
+    assert logs["deadline-partial"].completed_at > logs["deadline-partial"].started_at
+    assert logs["deadline-hung"].status == ScrapeStatus.TIMEOUT
+    assert logs["deadline-fast"].status == ScrapeStatus.SUCCESS
+
+
+async def test_batch_cut_off_on_a_full_queue_is_not_counted(executor, monkeypatch):
+    monkeypatch.setattr(settings, "pipeline_queue_size", 1)
+    monkeypatch.setattr(settings, "pipeline_dedupe_concurrency", 1)
+    release = asyncio.Event()
+
+    async def blocked_dedupe(db, batch, window=None):
+        await release.wait()
+        return batch
+
+    monkeypatch.setattr(executor, "_dedupe_batch", blocked_dedupe)
+
+    class BurstScraper(SlowScraper):
+
+        async def scrape_stream(self, filters):
+            for i in range(5):
+                yield [{"source_url": f"https://burst.example/{i}", "source_name": self.source_name}]
+            await asyncio.sleep(60)
+
+    async def release_after_deadline():
+        await asyncio.sleep(0.2)
+        release.set()
+
+    releaser = asyncio.create_task(release_after_deadline())
+    result = await executor.scrape_and_store([BurstScraper("deadline-burst", 0)], {}, source_timeout=0.05)
+    await releaser
+
+    log = executor.logs[-1]
+    assert log.status == ScrapeStatus.PARTIAL
+    # The dedupe worker holds one batch and the queue one more; the rest never made it in
+    assert log.opportunities_found == result["found"] == result["inserted"] == 2
+    assert result["skipped"] == 0
+
+
+async def test_running_out_of_budget_does_not_open_the_circuit(executor, monkeypatch):
+    from app.agents import executor as executor_module
+    from app.scrapers.circuit_breaker import CircuitBreakerRegistry, CircuitState
+
+    registry = CircuitBreakerRegistry()
+    registry._seeded = True
+    monkeypatch.setattr(settings, "scraping_breaker_enabled", True)
+    monkeypatch.setattr(executor_module, "circuit_breakers", registry)
+
+    for _ in range(settings.scraping_breaker_failure_threshold + 1):
+        result = await executor.scrape_and_store([SlowScraper("deadline-slow", 0)], {}, source_timeout=0.05)
+        assert result["skipped_sources"] == []
+
+    circuit = registry.get("deadline-slow")
+    assert circuit.state == CircuitState.CLOSED
+    assert circuit.consecutive_failures == 0
+    assert all(log.status == ScrapeStatus.TIMEOUT for log in executor.logs)
+
+
+async def test_execute_search_uses_interactive_budget(executor, monkeypatch):
+    budgets = []
+
+    async def scrape_and_store(scrapers, filters, source_timeout=None):
+        budgets.append(source_timeout)
+        return {"stored": []}
+
+    monkeypatch.setattr(executor, "scrape_and_store", scrape_and_store)
+
+    await executor.execute_search(None, {"goal_type": "job"})
+    await executor.execute_search(None, {"goal_type": "job"}, source_timeout=5)
+
+    assert budgets == [settings.scraping_source_timeout_interactive, 5]
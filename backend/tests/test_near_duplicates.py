@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+from app.services.near_duplicates import BANDS, Fingerprint, fingerprint, hamming, normalize_title
+
+DESCRIPTION = (
+    "We are looking for a backend engineer to design and build the APIs behind our payments platform. "
+    "You will work with Python, PostgreSQL and Kafka, own services end to end and mentor other engineers."
+)
+
+
+def _listing(title, company, description=DESCRIPTION):
+    return {"title": title, "company": company, "description": description}
+
+
+def test_titles_are_normalized_across_boards():
+    assert normalize_title("Sr. Backend Eng. (Berlin) at Acme", "Acme") == "senior backend engineer"
+    assert normalize_title("Backend Engineer @ Acme", "Acme") == "backend engineer"
+    # Only a trailing company name is stripped
+    assert normalize_title("Acme Backend Engineer", "Acme") == "acme backend engineer"
+
+
+def test_reposts_match_and_different_roles_do_not():
+    original = fingerprint(_listing("Senior Backend Engineer", "Acme Inc"))
+    repost = fingerprint(_listing("Sr Backend Engineer at Acme", "ACME", DESCRIPTION + " Apply today!"))
+    other_company = fingerprint(_listing("Senior Backend Engineer", "Globex"))
+    other_role = fingerprint(_listing("Product Designer", "Acme Inc"))
+
+    assert original.matches(repost)
+    assert not original.matches(other_company)
+    assert not original.matches(other_role)
+
+
+def test_same_title_with_a_different_description_does_not_match():
+    original = fingerprint(_listing("Backend Engineer", "Acme"))
+    different = fingerprint(_listing(
+        "Backend Engineer", "Acme",
+        "Join the data team to maintain our warehouse, write dbt models and run Airflow pipelines "
+        "that feed reporting for finance, marketing and the executive team every morning."
+    ))
+
+    assert hamming(original.key, different.key) == 0
+    assert not original.matches(different)
+    # Without a description to compare, title and company decide
+    assert original.matches(fingerprint(_listing("Backend Engineer", "Acme", None)))
+
+
+def test_a_title_alone_never_links_listings():
+    # Short blurbs get no description fingerprint, and without a company only the title is left
+    first = fingerprint(_listing("Software Engineer", None, "Remote, full time."))
+    second = fingerprint(_listing("Software Engineer", "", "Apply now"))
+    cfp = fingerprint(_listing("Call for Speakers", None, None))
+
+    assert hamming(first.key, second.key) == 0
+    assert not first.matches(second)
+    assert not cfp.matches(fingerprint(_listing("Call for Speakers", None, None)))
+    # Comparable descriptions still link company-less reposts
+    assert fingerprint(_listing("Backend Engineer", None)).matches(fingerprint(_listing("Backend Engineer", None)))
+
+
+def test_close_keys_always_share_a_band():
+    rng = random.Random(7)
+    for _ in range(500):
+        key = rng.getrandbits(64)
+        flipped = key
+        for bit in rng.sample(range(64), 3):
+            flipped ^= 1 << bit
+        a, b = Fingerprint(key, None), Fingerprint(flipped, None)
+        assert len(a.bands) == BANDS
+        assert set(a.bands) & set(b.bands)
+
+
+def test_key_distance_cannot_outgrow_the_bands():
+    assert Settings(dedupe_key_max_distance=BANDS - 1).dedupe_key_max_distance == BANDS - 1
+    with pytest.raises(ValidationError):
+        Settings(dedupe_key_max_distance=BANDS)
+
+
+def test_columns_fit_postgres_types():
+    columns = fingerprint(_listing("Senior Backend Engineer", "Acme")).columns()
+    assert -(1 << 63) <= columns["dedupe_key"] < 1 << 63
+    assert all(0 <= band < 1 << 31 for band in columns["dedupe_bands"])
+    assert fingerprint(_listing("", "Acme")) is None
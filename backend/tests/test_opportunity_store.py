@@ -0,0 +1,303 @@
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+
+from sqlalchemy.dialects import postgresql
+
+from app.agents.executor import ExecutorAgent
+from app.config import settings
+from app.scrapers.checkpoints import Checkpoint, ScrapeBatch
+from app.services.known_urls import BloomFilter, known_urls
+from app.services.opportunity_store import bulk_upsert_opportunities, build_upsert, filter_known_opportunities
+
+
+class _Row:
+
+    def __init__(self, source_url, inserted, id=None):
+        self.id = id or uuid.uuid4()
+        self.source_url = source_url
+        self.inserted = inserted
+
+
+class _Result:
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """Applies ON CONFLICT (source_url) semantics to an in-memory set of URLs"""
+
+    def __init__(self, existing=()):
+        # url -> (title, description, has_embedding) of the stored row
+        self.stored = {url: (f"Listing {url.rsplit('/', 1)[-1]}", None, True) for url in existing}
+        self.urls = set(existing)
+        # url -> column values of rows written through this session
+        self.rows = {}
+        self.ids = {}
+        self.statements = []
+        self.lookups = []
+        # Like Postgres, a failed statement poisons the transaction until rollback
+        self.aborted = False
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        self.aborted = False
+
+    async def execute(self, stmt, params=None):
+        if self.aborted:
+            raise RuntimeError("current transaction is aborted, commands ignored until end of transaction block")
+        compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+        sql = str(compiled)
+        self.statements.append(sql)
+        if "dedupe_bands &&" in sql:
+            bands = set(next(value for key, value in compiled.params.items() if key.startswith("dedupe_bands")))
+            return _Result([
+                (
+                    self.ids[url], url, row["opportunity_type"],
+                    row["dedupe_key"], row["dedupe_description"], row["dedupe_company"]
+                )
+                for url, row in self.rows.items()
+                if row["canonical_id"] is None and bands & set(row["dedupe_bands"] or ())
+            ])
+        if sql.startswith("SELECT opportunities.source_url, opportunities.id"):
+            urls = next(value for key, value in compiled.params.items() if key.startswith("source_url"))
+            return _Result([(url, self.ids[url]) for url in urls if url in self.ids])
+        if sql.startswith("SELECT"):
+            urls = next(value for key, value in compiled.params.items() if key.startswith("source_url"))
+            self.lookups.append(list(urls))
+            return _Result([(url, *self.stored[url]) for url in urls if url in self.stored])
+        updating = "DO UPDATE" in sql
+        rows = []
+        for params_row in params:
+            url = params_row["source_url"]
+            if url not in self.urls:
+                self.urls.add(url)
+                self.rows[url] = params_row
+                self.ids[url] = uuid.uuid4()
+                rows.append(_Row(url, True, self.ids[url]))
+            elif updating:
+                rows.append(_Row(url, False))
+        return _Result(rows)
+
+
+def _opportunity(i):
+    return {
+        "title": f"Listing {i}",
+        "source_url": f"https://jobs.example/{i}",
+        "source_name": "example",
+        "opportunity_type": "job",
+        "compensation": {"type": "paid", "min": 100000.0, "max": 120000.0, "currency": "USD", "period": "year"},
+    }
+
+
+def test_upsert_statement_uses_on_conflict_returning():
+    sql = str(build_upsert().compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (source_url) DO NOTHING" in sql
+    assert "RETURNING opportunities.id, opportunities.source_url" in sql
+
+    sql = str(build_upsert(update_existing=True).compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (source_url) DO UPDATE" in sql
+    assert "coalesce(excluded.embedding, opportunities.embedding)" in sql
+
+
+async def test_bulk_upsert_counts_inserted_and_skipped(monkeypatch):
+    monkeypatch.setattr(settings, "opportunity_upsert_batch_size", 2)
+    db = FakeSession(existing={"https://jobs.example/0"})
+    batch = [_opportunity(i) for i in range(5)] + [_opportunity(3), {"title": "no url"}]
+
+    result = await bulk_upsert_opportunities(db, batch, update_existing=False)
+
+    assert [row["source_url"] for row in result.inserted] == [f"https://jobs.example/{i}" for i in range(1, 5)]
+    # existing URL, in-batch repeat and the invalid item
+    assert result.skipped == 3
+    assert result.updated == 0
+    # five distinct URLs in chunks of two: one round trip per chunk
+    assert len(db.statements) == 3
+
+
+async def test_bulk_upsert_updates_existing_rows():
+    db = FakeSession(existing={"https://jobs.example/0"})
+
+    result = await bulk_upsert_opportunities(db, [_opportunity(0), _opportunity(1)], update_existing=True)
+
+    assert result.as_dict() == {"inserted": 1, "updated": 1, "skipped": 0}
+
+
+async def test_known_listings_are_filtered_before_embedding():
+    db = FakeSession(existing={"https://jobs.example/0", "https://jobs.example/1"})
+    changed = dict(_opportunity(1), title="Listing 1 (updated)")
+    batch = [_opportunity(0), changed, _opportunity(2), _opportunity(2)]
+
+    to_write, needs_embedding = await filter_known_opportunities(db, batch, update_existing=False)
+    assert [opp["source_url"] for opp in to_write] == ["https://jobs.example/2"]
+    assert needs_embedding == [True]
+    # One lookup for the whole batch
+    assert len(db.lookups) == 1
+
+    to_write, needs_embedding = await filter_known_opportunities(db, batch, update_existing=True)
+    assert [opp["source_url"] for opp in to_write] == [f"https://jobs.example/{i}" for i in range(3)]
+    assert needs_embedding == [False, True, True]
+
+
+async def test_store_embeds_only_new_listings(monkeypatch):
+    embedded = []
+
+    async def fake_embeddings(texts):
+        embedded.extend(texts)
+        return [[0.0] * 3 for _ in texts]
+
+    monkeypatch.setattr("app.agents.executor.generate_embeddings_batch", fake_embeddings)
+    db = FakeSession(existing={"https://jobs.example/0"})
+
+    stored = await ExecutorAgent()._store_opportunities(db, [_opportunity(0), _opportunity(1)])
+
+    assert [opp["source_url"] for opp in stored] == ["https://jobs.example/1"]
+    assert embedded == ["Listing 1 "]
+
+
+async def test_near_duplicates_link_to_one_canonical(monkeypatch):
+    embedded = []
+
+    async def fake_embeddings(texts):
+        embedded.extend(texts)
+        return [[0.0] * 3 for _ in texts]
+
+    monkeypatch.setattr("app.agents.executor.generate_embeddings_batch", fake_embeddings)
+    db = FakeSession()
+    agent = ExecutorAgent()
+
+    first = dict(_opportunity(1), title="Senior Backend Engineer", company="Acme Inc")
+    # The same role on another board, in the same batch and in a later one
+    repost = dict(_opportunity(2), title="Sr. Backend Engineer at Acme", company="Acme")
+    later = dict(_opportunity(3), title="Senior Backend Engineer (Remote)", company="ACME")
+    other = dict(_opportunity(4), title="Senior Backend Engineer", company="Globex")
+
+    await agent._store_opportunities(db, [first, repost])
+    await agent._store_opportunities(db, [later, other])
+
+    canonical_id = db.ids["https://jobs.example/1"]
+    assert db.rows["https://jobs.example/1"]["canonical_id"] is None
+    assert db.rows["https://jobs.example/2"]["canonical_id"] == canonical_id
+    assert db.rows["https://jobs.example/3"]["canonical_id"] == canonical_id
+    assert db.rows["https://jobs.example/4"]["canonical_id"] is None
+    # Duplicates are not embedded
+    assert embedded == ["Senior Backend Engineer ", "Senior Backend Engineer "]
+
+
+async def test_bloom_filter_skips_lookups_for_new_urls(monkeypatch):
+    monkeypatch.setattr(settings, "embedding_prefilter_bloom", True)
+    bloom = BloomFilter(1000, 0.01)
+    bloom.add("https://jobs.example/0")
+    monkeypatch.setattr(known_urls, "_filter", bloom)
+    db = FakeSession(existing={"https://jobs.example/0"})
+
+    to_write, _ = await filter_known_opportunities(db, [_opportunity(i) for i in range(50)], update_existing=False)
+
+    assert len(to_write) == 49
+    # Only URLs the filter could not rule out reach the database
+    assert "https://jobs.example/0" in db.lookups[0]
+    assert len(db.lookups[0]) < 5
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(10_000, 0.01)
+    urls = [f"https://jobs.example/{i}" for i in range(10_000)]
+    for url in urls:
+        bloom.add(url)
+
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://other.example/{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+async def test_pipeline_links_duplicates_across_batches_in_flight(monkeypatch):
+    monkeypatch.setattr(settings, "scraping_breaker_enabled", False)
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 0)
+    monkeypatch.setattr(settings, "pipeline_embed_concurrency", 2)
+
+    async def slow_first_embeddings(texts):
+        # The first batch finishes embedding after the second, so its duplicate is persisted first
+        if texts == ["Senior Backend Engineer "]:
+            await asyncio.sleep(0.05)
+        return [[0.0] * 3 for _ in texts]
+
+    monkeypatch.setattr("app.agents.executor.generate_embeddings_batch", slow_first_embeddings)
+
+    db = FakeSession()
+    stored_at_checkpoint = {}
+
+    async def checkpoint(batch_number):
+        stored_at_checkpoint[batch_number] = set(db.rows)
+
+    class Scraper:
+        source_name = "pipeline-test"
+        query_filters = ()
+
+        async def scrape_stream(self, filters):
+            yield ScrapeBatch(
+                [dict(_opportunity(1), title="Senior Backend Engineer", company="Acme")], [Checkpoint(checkpoint, 1)]
+            )
+            yield ScrapeBatch(
+                [dict(_opportunity(2), title="Sr Backend Engineer at Acme", company="Acme")], [Checkpoint(checkpoint, 2)]
+            )
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    agent = ExecutorAgent(session_factory=session)
+    result = await agent.scrape_and_store([Scraper()], {})
+
+    assert result["found"] == result["inserted"] == 2
+    assert db.rows["https://jobs.example/2"]["canonical_id"] == db.ids["https://jobs.example/1"]
+    assert result["pipeline"]["persist"]["batches"] == 2
+    # The deferred duplicate's checkpoint waits until it is written too
+    assert stored_at_checkpoint == {
+        1: {"https://jobs.example/1"},
+        2: {"https://jobs.example/1", "https://jobs.example/2"},
+    }
+
+
+async def test_failed_persist_does_not_poison_later_batches(monkeypatch):
+    monkeypatch.setattr(settings, "scraping_breaker_enabled", False)
+    monkeypatch.setattr(settings, "scraping_result_cache_ttl", 0)
+
+    async def fake_embeddings(texts):
+        return [[0.0] * 3 for _ in texts]
+
+    monkeypatch.setattr("app.agents.executor.generate_embeddings_batch", fake_embeddings)
+
+    class FirstInsertFails(FakeSession):
+        failed = False
+
+        async def execute(self, stmt, params=None):
+            if params is not None and not self.failed:
+                self.failed = self.aborted = True
+                raise RuntimeError("duplicate key value violates unique constraint")
+            return await super().execute(stmt, params)
+
+    db = FirstInsertFails()
+
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    class Scraper:
+        source_name = "rollback-test"
+        query_filters = ()
+
+        async def scrape_stream(self, filters):
+            for i, title in enumerate(["Backend Engineer", "Product Designer", "Data Analyst"]):
+                yield [dict(_opportunity(i), title=title, company=f"Company {i}")]
+
+    result = await ExecutorAgent(session_factory=session).scrape_and_store([Scraper()], {})
+
+    assert result["pipeline"]["persist"]["errors"] == 1
+    assert result["inserted"] == 2
+    assert set(db.rows) == {"https://jobs.example/1", "https://jobs.example/2"}
@@ -0,0 +1,78 @@
+import asyncio
+
+from app.services.pipeline import Pipeline, Stage
+
+
+async def test_bounded_queues_push_back_on_the_producer():
+    in_flight = 0
+    peak = 0
+    produced = []
+
+    async def slow(batch):
+        nonlocal in_flight
+        await asyncio.sleep(0.002)
+        in_flight -= len(batch)
+        return batch
+
+    async def produce(feed):
+        nonlocal in_flight, peak
+        for i in range(50):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            produced.append(i)
+            await feed([i])
+
+    pipeline = Pipeline([Stage("slow", slow, concurrency=1, queue_size=2)])
+    await pipeline.run(produce)
+
+    assert len(produced) == 50
+    # queue of 2, one in the worker's hands, one waiting on put
+    assert peak <= 4
+    stats = pipeline.stats()["slow"]
+    assert stats["items_in"] == stats["items_out"] == 50
+    assert stats["max_queue_depth"] <= 2
+
+
+async def test_stage_concurrency_and_failures():
+    running = 0
+    peak = 0
+    persisted = []
+
+    async def work(batch):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        if batch == [13]:
+            raise ValueError("bad batch")
+        return batch
+
+    async def persist(session, batch):
+        assert session == "session"
+        persisted.extend(batch)
+        return batch
+
+    class FakeSession:
+        async def __aenter__(self):
+            return "session"
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def produce(feed):
+        for i in range(30):
+            await feed([i])
+        return "done"
+
+    pipeline = Pipeline([
+        Stage("work", work, concurrency=3, queue_size=4),
+        Stage("persist", persist, concurrency=1, queue_size=4, session=FakeSession),
+    ])
+
+    assert await pipeline.run(produce) == "done"
+    assert peak == 3
+    assert sorted(persisted) == [i for i in range(30) if i != 13]
+    stats = pipeline.stats()
+    assert stats["work"]["errors"] == 1
+    assert stats["persist"]["items_in"] == 29
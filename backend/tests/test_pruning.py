@@ -0,0 +1,51 @@
+from app.scrapers.pruning import prune_markdown, prune_listing_content
+
+PAGE_MARKDOWN = """[Skip to main content](#main)
+
+* [Home](/)
+* [Find jobs](/jobs)
+* [Company reviews](/companies)
+* [Log in](/login)
+
+We use cookies to improve your experience. [Accept](/cookies)
+
+![logo](/logo.png)
+
+- [Data Engineer](https://example.com/jobs/123-data-engineer)
+- [ML Engineer](https://example.com/jobs/124-ml-engineer)
+
+[Senior Backend Engineer at Acme](https://example.com/viewjob?jk=abc)
+Berlin · Full time · Build and run our payment services.
+
+© 2026 Example Inc. All rights reserved. [Privacy Policy](/privacy) [Terms](/terms)"""
+
+PAGE_HTML = """<html><body><nav><a href="/">Home</a><a href="/jobs">Find jobs</a></nav>
+<main id="results"><div><a href="https://example.com/jobs/1-platform">Platform Engineer at Initech</a>
+<p>Remote, full time</p></div></main><footer>&copy; 2026 Example</footer></body></html>"""
+
+
+def test_prune_markdown_drops_navigation_and_boilerplate():
+    pruned = prune_markdown(PAGE_MARKDOWN)
+
+    assert "Data Engineer" in pruned
+    assert "ML Engineer" in pruned
+    assert "Senior Backend Engineer at Acme" in pruned
+    for boilerplate in ("Find jobs", "cookies", "Privacy Policy", "logo", "Skip to main"):
+        assert boilerplate not in pruned
+
+
+def test_content_selector_scopes_markdown_to_listing_region():
+    markdown, stats = prune_listing_content(PAGE_HTML, PAGE_MARKDOWN, "https://example.com", "#results")
+
+    assert stats["scoped"]
+    assert "Platform Engineer at Initech" in markdown
+    assert "Senior Backend Engineer" not in markdown
+    assert stats["tokens_after"] < stats["tokens_before"]
+
+
+def test_unmatched_selector_falls_back_to_whole_page():
+    markdown, stats = prune_listing_content(PAGE_HTML, PAGE_MARKDOWN, "https://example.com", "#missing")
+
+    assert not stats["scoped"]
+    assert "Senior Backend Engineer at Acme" in markdown
+    assert "Find jobs" not in markdown
@@ -0,0 +1,58 @@
+import time
+import pytest
+from app.scrapers.rate_limiter import (
+    AdaptiveRateLimiter,
+    HostRateLimiterRegistry,
+    parse_retry_after,
+)
+
+
+def test_registry_shares_limiter_per_host():
+    registry = HostRateLimiterRegistry()
+    first = registry.for_url("https://remoteok.com/api", 2)
+    second = registry.for_url("https://REMOTEOK.com/jobs", 5)
+    other = registry.for_url("https://www.indeed.com/jobs", 2)
+    
+    assert first is second
+    assert first is not other
+    assert set(registry.stats()) == {"remoteok.com", "www.indeed.com"}
+
+
+def test_aimd_adjusts_rate():
+    limiter = AdaptiveRateLimiter("example.com", 2)
+    
+    limiter.on_throttle()
+    assert limiter.rate == pytest.approx(1.0)
+    
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(2.0)
+
+
+def test_rate_stays_within_bounds():
+    limiter = AdaptiveRateLimiter("example.com", 2)
+    
+    for _ in range(50):
+        limiter.on_throttle(0)
+    assert limiter.rate == limiter.min_rate
+    
+    for _ in range(1000):
+        limiter.on_success()
+    assert limiter.rate == limiter.max_rate
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_host():
+    limiter = AdaptiveRateLimiter("example.com", 100)
+    limiter.on_throttle(0.2)
+    
+    started = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - started >= 0.15
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
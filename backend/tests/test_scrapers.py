@@ -1,36 +1,118 @@
 import pytest
-from app.scrapers.base import BaseScraper
-from app.scrapers import get_scrapers_for_goal_type, get_all_scrapers
+from app.config import settings
+from app.scrapers.crawl4ai_base import Crawl4AIBaseScraper
+from app.scrapers.http_cache import http_validators
+from app.scrapers.cassette import CassetteMiss
+from app.scrapers.checkpoints import run_checkpoints
+from app.scrapers import get_scrapers_for_goal_type, get_all_scrapers, get_scraper
+from tests.conftest import fake_llm_extraction
 
 
 def test_get_scrapers_for_job_type():
     scrapers = get_scrapers_for_goal_type("job")
     assert len(scrapers) > 0
-    assert all(isinstance(s, BaseScraper) for s in scrapers)
+    assert all(isinstance(s, Crawl4AIBaseScraper) for s in scrapers)
 
 
 def test_get_scrapers_for_speaking_type():
     scrapers = get_scrapers_for_goal_type("speaking")
     assert len(scrapers) > 0
-    assert all(isinstance(s, BaseScraper) for s in scrapers)
+    assert all(isinstance(s, Crawl4AIBaseScraper) for s in scrapers)
 
 
 def test_get_all_scrapers():
     scrapers = get_all_scrapers()
     assert len(scrapers) >= 8
-    assert all(isinstance(s, BaseScraper) for s in scrapers)
+    assert all(isinstance(s, Crawl4AIBaseScraper) for s in scrapers)
 
 
 @pytest.mark.asyncio
 async def test_base_scraper_rate_limiting():
-    class TestScraper(BaseScraper):
+    class TestScraper(Crawl4AIBaseScraper):
         def __init__(self):
             super().__init__("test", "https://example.com", rate_limit=1)
-        
+
         async def scrape(self, filters):
             return []
-    
+
     scraper = TestScraper()
     assert scraper.rate_limit == 1
     assert scraper.source_name == "test"
 
+
+EXPECTED_LISTINGS = {
+    "remoteok": (25, "job"),
+    "weworkremotely": (20, "job"),
+    "indeed": (15, "job"),
+    "ycombinator": (20, "job"),
+    "angellist": (20, "job"),
+    "sessionize": (20, "speaking"),
+    "papercall": (15, "speaking"),
+    "eventbrite": (20, "event"),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("source_name", sorted(EXPECTED_LISTINGS))
+async def test_scraper_parses_recorded_fixture(replay_cassettes, source_name):
+    count, opportunity_type = EXPECTED_LISTINGS[source_name]
+
+    opportunities = await get_scraper(source_name).scrape({})
+
+    assert len(opportunities) == count
+    for opportunity in opportunities:
+        assert opportunity["source_name"] == source_name
+        assert opportunity["opportunity_type"] == opportunity_type
+        assert opportunity["title"]
+        assert opportunity["source_url"].startswith("https://")
+    assert len({o["source_url"] for o in opportunities}) == count
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("source_name", ["remoteok", "weworkremotely", "indeed"])
+async def test_cursor_only_advances_once_listings_are_stored(replay_cassettes, source_name):
+    count, _ = EXPECTED_LISTINGS[source_name]
+    scraper = get_scraper(source_name)
+
+    # Lost downstream (e.g. the write failed), so its checkpoints never ran
+    assert len(await scraper.scrape({})) == count
+
+    stored = await scraper.scrape({})
+    assert len(stored) == count
+    await run_checkpoints(stored.checkpoints)
+    assert await scraper.scrape({}) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("complete", [True, False])
+async def test_page_validators_are_stored_with_a_complete_batch(replay_cassettes, monkeypatch, complete):
+    monkeypatch.setattr(settings, "scraping_conditional_get", True)
+    validators = {}
+
+    async def get(url):
+        return None
+
+    async def store(url, source_name, etag, last_modified, body_hash):
+        validators[url] = body_hash
+
+    async def extraction(self, url, markdown, instruction=None):
+        listings, _ = await fake_llm_extraction(self, url, markdown, instruction)
+        return listings, complete
+
+    monkeypatch.setattr(http_validators, "get", get)
+    monkeypatch.setattr(http_validators, "store", store)
+    monkeypatch.setattr(Crawl4AIBaseScraper, "_extract_with_llm", extraction)
+
+    batch = await get_scraper("indeed").scrape({})
+    assert len(batch) == EXPECTED_LISTINGS["indeed"][0]
+    assert not validators
+
+    await run_checkpoints(batch.checkpoints)
+    # A page with failed chunks is extracted again next time, not skipped as unchanged
+    assert bool(validators) == complete
+
+
+@pytest.mark.asyncio
+async def test_replay_raises_on_unrecorded_url(replay_cassettes):
+    with pytest.raises(CassetteMiss):
+        await get_scraper("remoteok")._http_get("https://remoteok.com/unrecorded", {})
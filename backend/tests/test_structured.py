@@ -0,0 +1,138 @@
+from app.scrapers.structured import extract_structured_opportunities, parse_feed
+
+
+JOB_POSTING_PAGE = """
+<html><head>
+<script type="application/ld+json">
+{
+  "@context": "https://schema.org",
+  "@graph": [
+    {"@type": "WebSite", "name": "Jobs"},
+    {
+      "@type": "JobPosting",
+      "title": "Senior Python Engineer",
+      "description": "<p>Build &amp; scale APIs</p>",
+      "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+      "jobLocationType": "TELECOMMUTE",
+      "employmentType": ["FULL_TIME"],
+      "url": "/jobs/123",
+      "baseSalary": {
+        "@type": "MonetaryAmount",
+        "currency": "USD",
+        "value": {"@type": "QuantitativeValue", "minValue": 120000, "maxValue": 150000, "unitText": "YEAR"}
+      }
+    }
+  ]
+}
+</script>
+</head><body></body></html>
+"""
+
+EVENT_LIST_PAGE = """
+<script type="application/ld+json">
+{"@type": "ItemList", "itemListElement": [
+  {"@type": "ListItem", "item": {
+    "@type": "BusinessEvent", "name": "PyCon Online",
+    "startDate": "2026-05-01",
+    "eventAttendanceMode": "https://schema.org/OnlineEventAttendanceMode",
+    "organizer": {"name": "PSF"},
+    "url": "https://example.com/pycon",
+    "offers": {"price": "0", "priceCurrency": "USD"}
+  }}
+]}
+</script>
+"""
+
+MICRODATA_PAGE = """
+<div itemscope itemtype="https://schema.org/JobPosting">
+  <h2 itemprop="title">Data Engineer</h2>
+  <div itemprop="hiringOrganization" itemscope itemtype="https://schema.org/Organization">
+    <span itemprop="name">Globex</span>
+  </div>
+  <div itemprop="jobLocation" itemscope itemtype="https://schema.org/Place">
+    <div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">
+      <span itemprop="addressLocality">Berlin</span>
+      <meta itemprop="addressCountry" content="DE">
+    </div>
+  </div>
+  <p itemprop="description">Pipelines <b>everywhere</b></p>
+  <a itemprop="url" href="/careers/data-engineer">Apply</a>
+</div>
+"""
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+  <item>
+    <title>Acme: Backend Developer</title>
+    <region>Anywhere in the World</region>
+    <category>Programming</category>
+    <description>&lt;p&gt;Go and Postgres&lt;/p&gt;</description>
+    <pubDate>Mon, 12 Oct 2026 10:00:00 +0000</pubDate>
+    <link>https://weworkremotely.com/remote-jobs/acme-backend-developer</link>
+  </item>
+</channel></rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Call for Papers: DevConf</title>
+    <link rel="alternate" href="/cfp/devconf"/>
+    <summary>Submit a talk</summary>
+    <category term="conference"/>
+  </entry>
+</feed>
+"""
+
+
+def test_json_ld_job_posting():
+    [job] = extract_structured_opportunities(JOB_POSTING_PAGE, "https://jobs.example.com/search")
+    
+    assert job["title"] == "Senior Python Engineer"
+    assert job["company_or_organizer"] == "Acme"
+    assert job["description"] == "Build & scale APIs"
+    assert job["location"] == "Remote"
+    assert job["url"] == "https://jobs.example.com/jobs/123"
+    assert job["tags"] == ["FULL_TIME"]
+    assert job["compensation_info"] == "USD 120000-150000 per year"
+
+
+def test_json_ld_item_list_event():
+    [event] = extract_structured_opportunities(EVENT_LIST_PAGE, "https://example.com/events")
+    
+    assert event["title"] == "PyCon Online"
+    assert event["location"] == "Online"
+    assert event["compensation_info"] == "Free"
+    assert "2026-05-01" in event["description"]
+
+
+def test_microdata_job_posting():
+    [job] = extract_structured_opportunities(MICRODATA_PAGE, "https://globex.example/jobs")
+    
+    assert job["title"] == "Data Engineer"
+    assert job["company_or_organizer"] == "Globex"
+    assert job["location"] == "Berlin, DE"
+    assert job["description"] == "Pipelines everywhere"
+    assert job["url"] == "https://globex.example/careers/data-engineer"
+
+
+def test_page_without_structured_data():
+    assert extract_structured_opportunities("<html><body>Jobs</body></html>", "https://x.com") == []
+
+
+def test_rss_feed():
+    [item] = parse_feed(RSS_FEED, "https://weworkremotely.com/categories/remote-programming-jobs.rss")
+    
+    assert item["title"] == "Acme: Backend Developer"
+    assert item["url"] == "https://weworkremotely.com/remote-jobs/acme-backend-developer"
+    assert item["location"] == "Anywhere in the World"
+    assert item["description"] == "Go and Postgres"
+    assert item["tags"] == ["Programming"]
+
+
+def test_atom_feed():
+    [entry] = parse_feed(ATOM_FEED, "https://conf.example.com/feed.atom")
+    
+    assert entry["url"] == "https://conf.example.com/cfp/devconf"
+    assert entry["description"] == "Submit a talk"
+    assert entry["tags"] == ["conference"]
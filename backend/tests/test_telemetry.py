@@ -0,0 +1,82 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+
+from app.config import settings
+from app.models.scrape_log import ScrapeLog, ScrapeStatus
+from app.services.telemetry import TelemetryWriter
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.executes = []
+        self.fail = False
+
+    @asynccontextmanager
+    async def begin(self):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        yield self
+
+    async def execute(self, stmt, rows):
+        self.executes.append((stmt.table.name, list(rows)))
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    monkeypatch.setattr(settings, "telemetry_flush_interval", 60.0)
+    monkeypatch.setattr(settings, "telemetry_flush_size", 5)
+    monkeypatch.setattr(settings, "telemetry_max_buffer", 8)
+    return FakeConnection()
+
+
+def _log(i):
+    return ScrapeLog(source_name=f"source-{i}", status=ScrapeStatus.SUCCESS, started_at=datetime.utcnow())
+
+
+async def test_size_threshold_flushes_one_insert_per_table(connection):
+    writer = TelemetryWriter(connect=connection.begin)
+    for i in range(4):
+        writer.record_scrape_log(_log(i))
+    writer.record_event("pipeline_run", found=4)
+    await asyncio.sleep(0.01)
+
+    assert sorted((table, len(rows)) for table, rows in connection.executes) == [
+        ("pipeline_events", 1), ("scrape_logs", 4)
+    ]
+    assert connection.executes[0][1][0]["opportunities_found"] == 0
+    assert writer.stats()["written"] == 5
+    await writer.close()
+
+
+async def test_timer_flushes_a_partial_buffer(connection, monkeypatch):
+    monkeypatch.setattr(settings, "telemetry_flush_interval", 0.01)
+    writer = TelemetryWriter(connect=connection.begin)
+    writer.record_event("source_skipped", "remoteok", reason="circuit_open")
+    await asyncio.sleep(0.05)
+
+    assert connection.executes == [("pipeline_events", connection.executes[0][1])]
+    assert connection.executes[0][1][0]["source_name"] == "remoteok"
+    await writer.close()
+
+
+async def test_failed_flushes_keep_rows_up_to_the_cap(connection):
+    writer = TelemetryWriter(connect=connection.begin)
+    connection.fail = True
+    for i in range(12):
+        writer.record_scrape_log(_log(i))
+    await writer.flush()
+
+    assert writer.stats()["pending"] == 8
+    assert writer.stats()["dropped"] == 4
+    assert writer.stats()["failed_flushes"] >= 1
+
+    connection.fail = False
+    await writer.close()
+
+    written = [row["source_name"] for _, rows in connection.executes for row in rows]
+    # The oldest rows were dropped, the rest written in order
+    assert written == [f"source-{i}" for i in range(4, 12)]